@@ -0,0 +1,93 @@
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class Settings:
+    """Configurações da aplicação, lidas de variáveis de ambiente"""
+
+    def __init__(self):
+        # Cache de respostas da SWAPI
+        self.cache_ttl = _env_float("SWAPI_CACHE_TTL", 3600.0)
+        self.cache_max_entries = _env_int("SWAPI_CACHE_MAX_ENTRIES", 5000)
+        self.cache_max_bytes = _env_int("SWAPI_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        self.cache_stale_while_revalidate = _env_float(
+            "SWAPI_CACHE_STALE_WHILE_REVALIDATE", 86400.0
+        )
+        self.cache_stale_if_error = _env_float("SWAPI_CACHE_STALE_IF_ERROR", 7 * 86400.0)
+
+        # Circuit breaker da SWAPI
+        self.breaker_failure_rate = _env_float("SWAPI_BREAKER_FAILURE_RATE", 0.5)
+        self.breaker_minimum_calls = _env_int("SWAPI_BREAKER_MINIMUM_CALLS", 10)
+        self.breaker_window_seconds = _env_float("SWAPI_BREAKER_WINDOW_SECONDS", 60.0)
+        self.breaker_open_seconds = _env_float("SWAPI_BREAKER_OPEN_SECONDS", 30.0)
+        self.breaker_half_open_calls = _env_int("SWAPI_BREAKER_HALF_OPEN_CALLS", 3)
+
+        # Retentativas e prazo por requisição
+        self.retry_max_attempts = _env_int("SWAPI_RETRY_MAX_ATTEMPTS", 3)
+        self.retry_base_delay = _env_float("SWAPI_RETRY_BASE_DELAY", 0.1)
+        self.retry_max_delay = _env_float("SWAPI_RETRY_MAX_DELAY", 2.0)
+        self.request_deadline = _env_float("SWAPI_REQUEST_DEADLINE", 8.0)
+
+        # Pool de conexões e timeouts do cliente HTTP
+        self.http_max_connections = _env_int("SWAPI_HTTP_MAX_CONNECTIONS", 100)
+        self.http_max_keepalive_connections = _env_int("SWAPI_HTTP_MAX_KEEPALIVE", 20)
+        self.http_keepalive_expiry = _env_float("SWAPI_HTTP_KEEPALIVE_EXPIRY", 30.0)
+        self.http2 = _env_bool("SWAPI_HTTP2", False)
+        self.timeout_connect = _env_float("SWAPI_TIMEOUT_CONNECT", 3.0)
+        self.timeout_read = _env_float("SWAPI_TIMEOUT_READ", 10.0)
+        self.timeout_write = _env_float("SWAPI_TIMEOUT_WRITE", 10.0)
+        self.timeout_pool = _env_float("SWAPI_TIMEOUT_POOL", 5.0)
+
+        # Limites de chamadas à SWAPI
+        self.upstream_max_concurrency = _env_int("SWAPI_MAX_CONCURRENCY", 20)
+        self.upstream_rate_limit = _env_float("SWAPI_RATE_LIMIT", 10.0)
+        self.upstream_rate_burst = _env_int("SWAPI_RATE_BURST", 20)
+        self.upstream_max_wait = _env_float("SWAPI_LIMITER_MAX_WAIT", 2.0)
+        self.upstream_max_queue = _env_int("SWAPI_LIMITER_MAX_QUEUE", 200)
+
+        # Modo offline: responde a partir de um snapshot local da SWAPI
+        self.snapshot_path = os.getenv("SWAPI_SNAPSHOT_PATH") or None
+
+        # Aquecimento do cache na inicialização
+        self.warmup_enabled = _env_bool("SWAPI_WARMUP", False)
+        self.warmup_concurrency = _env_int("SWAPI_WARMUP_CONCURRENCY", 4)
+
+        # Consulta em lote
+        self.batch_max_items = _env_int("SWAPI_BATCH_MAX_ITEMS", 100)
+        self.batch_concurrency = _env_int("SWAPI_BATCH_CONCURRENCY", 10)
+
+        # Expansão de relações (?expand=)
+        self.expand_max_depth = _env_int("SWAPI_EXPAND_MAX_DEPTH", 2)
+        self.expand_concurrency = _env_int("SWAPI_EXPAND_CONCURRENCY", 10)
+
+        # Busca aproximada: similaridade mínima (0 a 1) entre consulta e item
+        self.fuzzy_threshold = _env_float("SWAPI_FUZZY_THRESHOLD", 0.3)
+
+        # Busca unificada (/swapi/search): tempo máximo de cada recurso, em segundos
+        self.search_timeout = _env_float("SWAPI_SEARCH_TIMEOUT", 2.0)
+
+        # Paginação local (?page_size= e ?cursor=)
+        self.default_page_size = _env_int("SWAPI_DEFAULT_PAGE_SIZE", 10)
+        self.max_page_size = _env_int("SWAPI_MAX_PAGE_SIZE", 100)
+
+        # Exportação NDJSON: páginas buscadas à frente do consumidor
+        self.export_concurrency = _env_int("SWAPI_EXPORT_CONCURRENCY", 4)
+
+
+settings = Settings()
@@ -0,0 +1,224 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.core.columns import (
+    CATEGORICAL_FIELDS,
+    NUMERIC_FIELDS,
+    MultiCategorical,
+    ResourceColumns,
+)
+from app.core.dataset import dataset
+from app.core.relations import RELATION_FIELDS
+from app.core.snapshot import SEARCH_FIELDS
+
+OPERATIONS = ("count", "sum", "mean", "min", "max")
+_PERCENTILE = re.compile(r"p(\d{1,2}(?:\.\d+)?|100)$")
+
+# (nome na resposta, operação, campo, percentil)
+Metric = Tuple[str, str, Optional[str], Optional[float]]
+
+
+def parse_metrics(resource: str, metrics: Optional[str]) -> List[Metric]:
+    """
+    Interpreta `metrics` como `operação:campo` separados por vírgula
+
+    Operações: count, sum, mean, min, max, median e pNN (percentil, ex: p90).
+    `count` sem campo conta os itens do grupo; com campo, os valores conhecidos.
+
+    Raises:
+        HTTPException: 400 para operações ou campos inválidos
+    """
+    parsed = []
+    for raw in (part.strip() for part in (metrics or "count").split(",")):
+        if not raw:
+            continue
+        operation, _, field = raw.partition(":")
+        field = field or None
+        percentile = None
+        if operation == "median":
+            operation, percentile = "percentile", 50.0
+        elif _PERCENTILE.match(operation):
+            operation, percentile = "percentile", float(operation[1:])
+        elif operation not in OPERATIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Operação '{operation}' inválida. "
+                f"Operações: {', '.join(OPERATIONS)}, median, pNN",
+            )
+
+        if field is None and operation != "count":
+            raise HTTPException(
+                status_code=400, detail=f"'{raw}' precisa de um campo (ex: mean:height)"
+            )
+        if field is not None and field not in NUMERIC_FIELDS[resource]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Campo '{field}' não é numérico em '{resource}'. "
+                f"Campos: {', '.join(NUMERIC_FIELDS[resource])}",
+            )
+        parsed.append((raw, operation, field, percentile))
+    return parsed
+
+
+def parse_group_by(resource: str, group_by: Optional[str]) -> Optional[str]:
+    """
+    Campo de agrupamento: um campo categórico ou uma relação do recurso
+
+    Raises:
+        HTTPException: 400 para campos que não podem agrupar
+    """
+    allowed = (*CATEGORICAL_FIELDS[resource], *RELATION_FIELDS[resource])
+    if group_by and group_by not in allowed:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campo '{group_by}' não pode agrupar '{resource}'. "
+            f"Campos: {', '.join(allowed)}",
+        )
+    return group_by or None
+
+
+def _groups(table: ResourceColumns, group_by: Optional[str], keep: np.ndarray):
+    """
+    Linhas e código de grupo de cada linha, mais a chave e o rótulo de cada grupo
+
+    Relações com vários destinos e campos com listas (`climate`) contam o item
+    em cada valor; itens sem relação (ou com valor categórico vazio) caem no
+    grupo de chave None.
+    """
+    rows = np.flatnonzero(keep)
+    if group_by is None:
+        return rows, np.zeros(len(rows), dtype=np.int64), [(None, None)]
+
+    column = table.categorical.get(group_by)
+    if isinstance(column, MultiCategorical):
+        pair_rows, codes = column.explode()
+        selected = keep[pair_rows]
+        labels = [(value or None, value or None) for value in column.parts.categories]
+        return pair_rows[selected], codes[selected].astype(np.int64), labels
+
+    if column is not None:
+        labels = [(value or None, value or None) for value in column.categories]
+        return rows, column.codes[rows].astype(np.int64), labels
+
+    relation = table.relations[group_by]
+    pair_rows, targets = relation.explode()
+    # Itens sem nenhum destino entram com o destino -1 (grupo None)
+    empty = np.flatnonzero(relation.lengths == 0)
+    pair_rows = np.concatenate((pair_rows, empty))
+    targets = np.concatenate((targets, np.full(len(empty), -1, dtype=np.int64)))
+    selected = keep[pair_rows]
+    pair_rows, targets = pair_rows[selected], targets[selected]
+
+    keys, codes = np.unique(targets, return_inverse=True)
+    store = dataset.store
+    field = SEARCH_FIELDS[relation.target][0]
+    labels = []
+    for key in keys.tolist():
+        item = store.get(relation.target, key) if key >= 0 else None
+        labels.append((key if key >= 0 else None, item.get(field) if item else None))
+    return pair_rows, codes.astype(np.int64), labels
+
+
+class _SortedField:
+    """Valores conhecidos de um campo ordenados dentro de cada grupo"""
+
+    def __init__(self, values: np.ndarray, codes: np.ndarray, groups: int):
+        known = ~np.isnan(values)
+        values, codes = values[known], codes[known]
+        order = np.argsort(values, kind="stable")
+        order = order[np.argsort(codes[order], kind="stable")]
+        self.values = values[order]
+        self.codes = codes[order]
+        self.counts = np.bincount(codes, minlength=groups)
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)[:-1]))
+        self.present = self.counts > 0
+
+    def sums(self) -> np.ndarray:
+        return np.bincount(self.codes, weights=self.values, minlength=len(self.counts))
+
+    def percentile(self, q: float) -> np.ndarray:
+        """Percentil com interpolação linear, para todos os grupos de uma vez"""
+        position = (self.counts - 1) * q / 100
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        result = np.full(len(self.counts), np.nan)
+        low_values = self.values[(self.starts + low)[self.present]]
+        high_values = self.values[(self.starts + high)[self.present]]
+        result[self.present] = (
+            low_values + (high_values - low_values) * (position - low)[self.present]
+        )
+        return result
+
+
+def _metric(field: Optional[_SortedField], codes: np.ndarray, groups: int, metric: Metric):
+    _, operation, _, percentile = metric
+    if field is None:
+        return np.bincount(codes, minlength=groups).astype(np.float64)
+    if operation == "count":
+        return field.counts.astype(np.float64)
+    if operation == "sum":
+        return np.where(field.present, field.sums(), np.nan)
+    if operation == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return field.sums() / field.counts
+    if operation == "min":
+        return field.percentile(0)
+    if operation == "max":
+        return field.percentile(100)
+    return field.percentile(percentile)
+
+
+def _key_order(key: Any) -> Tuple[int, float, str]:
+    """Desempate entre grupos: IDs em ordem numérica, textos em ordem alfabética, None no fim"""
+    if key is None:
+        return (2, 0, "")
+    if isinstance(key, int):
+        return (0, key, "")
+    return (1, 0, str(key))
+
+
+def aggregate(
+    table: ResourceColumns,
+    group_by: Optional[str],
+    metrics: List[Metric],
+    filters: List[Tuple[str, str, str]],
+) -> List[Dict[str, Any]]:
+    """
+    Agrupa os itens e calcula as métricas de cada grupo sobre as colunas tipadas
+
+    Cada métrica é calculada para todos os grupos de uma vez (bincount e
+    percentis sobre os valores ordenados por grupo). Valores desconhecidos ficam de fora das métricas;
+    métricas sem nenhum valor retornam None. Grupos vêm do maior para o menor.
+    """
+    rows, codes, labels = _groups(table, group_by, table.mask(filters))
+    groups = len(labels)
+    counts = np.bincount(codes, minlength=groups)
+    # Cada campo é ordenado por grupo uma única vez, para todas as suas métricas
+    fields = {
+        field: _SortedField(table.numeric[field][rows], codes, groups)
+        for field in {metric[2] for metric in metrics if metric[2] is not None}
+    }
+    values = {
+        metric[0]: _metric(fields.get(metric[2]), codes, groups, metric) for metric in metrics
+    }
+
+    result = []
+    for code, (key, label) in enumerate(labels):
+        if counts[code] == 0 and group_by is not None:
+            continue
+        result.append(
+            {
+                "key": key,
+                "label": label,
+                "count": int(counts[code]),
+                "metrics": {
+                    name: None if np.isnan(column[code]) else float(column[code])
+                    for name, column in values.items()
+                },
+            }
+        )
+    result.sort(key=lambda group: (-group["count"], _key_order(group["key"])))
+    return result
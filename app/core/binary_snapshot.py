@@ -0,0 +1,165 @@
+"""
+Formato binário do snapshot da SWAPI, carregado via mmap
+
+Layout (little-endian):
+
+    cabeçalho   magic (8s) | versão (I) | nº de registros (I) | tamanho dos metadados (I) |
+                tamanho do dicionário (I)
+    metadados   JSON com a data de criação
+    dicionário  amostra de registros usada como dicionário do zlib
+    índice      por registro: recurso (B) | id (I) | offset e tamanho dos dados (II)
+    dados       cada registro em JSON compacto (UTF-8), comprimido com zlib
+
+Cada registro é comprimido sozinho, para continuar acessível sem ler os
+vizinhos; o dicionário compartilhado (URLs, nomes de campos) é o que torna a
+compressão de registros pequenos eficiente.
+
+Abrir o arquivo só lê o cabeçalho e o índice; cada registro é decodificado na
+primeira vez em que é pedido. Os textos de busca são montados a partir dos
+registros na primeira busca em cada recurso.
+"""
+
+import json
+import mmap
+import struct
+import zlib
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.snapshot import RESOURCES, BaseSnapshot, resource_id, search_text
+
+MAGIC = b"SWSNAP\x00\x01"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<8sIIII")
+INDEX_ENTRY = struct.Struct("<BIII")
+# Tamanho máximo de um dicionário do zlib (janela de 32 KB)
+DICTIONARY_SIZE = 32 * 1024
+DICTIONARY_FRACTION = 16
+
+
+def is_binary_snapshot(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _dictionary(records: List[Tuple[int, int, bytes]]) -> bytes:
+    """
+    Amostra de registros alternando entre os recursos
+
+    Fica limitada a uma fração dos dados para não pesar em snapshots pequenos.
+    """
+    size = min(DICTIONARY_SIZE, sum(len(data) for *_, data in records) // DICTIONARY_FRACTION)
+    by_resource: Dict[int, List[bytes]] = {}
+    for code, _, data in records:
+        by_resource.setdefault(code, []).append(data)
+    sample = bytearray()
+    for row in zip_longest(*by_resource.values()):
+        for data in filter(None, row):
+            if len(sample) + len(data) > size:
+                return bytes(sample)
+            sample += data
+    return bytes(sample)
+
+
+def save_binary_snapshot(store: BaseSnapshot, path: str) -> None:
+    """Grava um snapshot no formato binário"""
+    meta = json.dumps({"created": store.created}).encode()
+    records: List[Tuple[int, int, bytes]] = [
+        (
+            code,
+            resource_id(item["url"]),
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode(),
+        )
+        for code, resource in enumerate(RESOURCES)
+        for item in store.items(resource)
+    ]
+    dictionary = _dictionary(records)
+
+    def compress(data: bytes) -> bytes:
+        compressor = zlib.compressobj(9, zdict=dictionary)
+        return compressor.compress(data) + compressor.flush()
+
+    compressed = [compress(data) for _, _, data in records]
+    offset = HEADER.size + len(meta) + len(dictionary) + INDEX_ENTRY.size * len(records)
+    index = bytearray()
+    for (code, item_id, _), data in zip(records, compressed):
+        index += INDEX_ENTRY.pack(code, item_id, offset, len(data))
+        offset += len(data)
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(records), len(meta), len(dictionary)))
+        f.write(meta)
+        f.write(dictionary)
+        f.write(index)
+        for data in compressed:
+            f.write(data)
+
+
+class BinarySnapshot(BaseSnapshot):
+    """Snapshot binário mapeado em memória, decodificado sob demanda"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version = struct.unpack_from("<8sI", self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Arquivo de snapshot inválido: {path}")
+        _, _, count, meta_len, dictionary_len = HEADER.unpack_from(self._mm, 0)
+
+        meta_start = HEADER.size
+        self.created = json.loads(self._mm[meta_start : meta_start + meta_len])["created"]
+        dictionary_start = meta_start + meta_len
+        self._dictionary = self._mm[dictionary_start : dictionary_start + dictionary_len]
+
+        self._ids: Dict[str, List[int]] = {resource: [] for resource in RESOURCES}
+        self._data: Dict[str, Dict[int, Tuple[int, int]]] = {r: {} for r in RESOURCES}
+        index_start = dictionary_start + dictionary_len
+        index_end = index_start + INDEX_ENTRY.size * count
+        for code, item_id, data_offset, data_len in INDEX_ENTRY.iter_unpack(
+            self._mm[index_start:index_end]
+        ):
+            resource = RESOURCES[code]
+            self._ids[resource].append(item_id)
+            self._data[resource][item_id] = (data_offset, data_len)
+
+        self._decoded: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._texts: Dict[str, List[str]] = {}
+
+    def ids(self, resource: str) -> List[int]:
+        return self._ids[resource]
+
+    def _decode(self, resource: str, item_id: int) -> Optional[Dict[str, Any]]:
+        span = self._data.get(resource, {}).get(item_id)
+        if span is None:
+            return None
+        offset, length = span
+        decompressor = zlib.decompressobj(zdict=self._dictionary)
+        return json.loads(decompressor.decompress(self._mm[offset : offset + length]))
+
+    def search_texts(self, resource: str) -> List[str]:
+        texts = self._texts.get(resource)
+        if texts is None:
+            # Registros decodificados só para a busca não ficam no cache de `get`
+            texts = [
+                search_text(resource, self._decoded.get((resource, i)) or self._decode(resource, i))
+                for i in self._ids[resource]
+            ]
+            self._texts[resource] = texts
+        return texts
+
+    def get(self, resource: str, item_id: int) -> Optional[Dict[str, Any]]:
+        key = (resource, item_id)
+        item = self._decoded.get(key)
+        if item is None:
+            item = self._decode(resource, item_id)
+            if item is None:
+                return None
+            self._decoded[key] = item
+        return item
+
+    def close(self) -> None:
+        self._mm.close()
@@ -0,0 +1,185 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+def make_cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Gera a chave de cache normalizada para um endpoint e seus parâmetros
+
+    'people/1/', '/people/1' e 'People/1' geram a mesma chave, e a ordem
+    dos parâmetros não importa.
+    """
+    path = endpoint.strip("/").lower()
+    if not params:
+        return path
+
+    query = "&".join(
+        f"{key}={str(value).strip().lower()}"
+        for key, value in sorted(params.items())
+        if value is not None
+    )
+    return f"{path}?{query}" if query else path
+
+
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+
+@dataclass
+class CacheEntry:
+    value: bytes
+    expires_at: float
+    revalidate_until: float
+    stale_until: float
+
+    @property
+    def size(self) -> int:
+        return len(self.value)
+
+    def state(self, now: float) -> str:
+        """
+        Estado da entrada no instante `now`
+
+        - fresh: dentro do TTL
+        - stale: pode ser servida enquanto é revalidada em segundo plano
+        - expired: só pode ser servida se a SWAPI falhar (stale-if-error)
+        """
+        if now < self.expires_at:
+            return FRESH
+        if now < self.revalidate_until:
+            return STALE
+        return EXPIRED
+
+
+class ResponseCache:
+    """
+    Cache em memória de respostas da SWAPI com TTL por entrada e evicção LRU
+
+    O tamanho é limitado tanto pelo número de entradas quanto pelo total de
+    bytes armazenados, para caber na memória de uma instância do Cloud Run.
+
+    Após o TTL, uma entrada continua disponível por `stale_while_revalidate`
+    segundos para ser servida enquanto é atualizada, e por `stale_if_error`
+    segundos para ser servida caso a SWAPI esteja fora do ar.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retorna a entrada enquanto ela ainda puder ser servida, fresca ou não
+
+        Entradas além da janela de stale-if-error são descartadas.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        now = time.monotonic()
+        if entry.stale_until <= now:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        state = entry.state(now)
+        if state == FRESH:
+            self.hits += 1
+        elif state == STALE:
+            self.stale_hits += 1
+        else:
+            self.misses += 1
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Retorna o valor armazenado ou None se ausente/expirado"""
+        entry = self.lookup(key)
+        if entry is None or entry.state(time.monotonic()) != FRESH:
+            return None
+        return entry.value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """Armazena um valor, removendo as entradas menos usadas se necessário"""
+        if len(value) > self.max_bytes or self.max_entries <= 0:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = time.monotonic() + (ttl or self.ttl)
+        entry = CacheEntry(
+            value=value,
+            expires_at=expires_at,
+            revalidate_until=expires_at + self.stale_while_revalidate,
+            stale_until=expires_at + max(self.stale_while_revalidate, self.stale_if_error),
+        )
+        self._entries[key] = entry
+        self._bytes += entry.size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest, _ = next(iter(self._entries.items()))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = self.stale_hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "stale_if_error": self.stale_if_error,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
@@ -0,0 +1,164 @@
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker para chamadas à SWAPI
+
+    - closed: as chamadas passam normalmente; o resultado de cada uma entra
+      em uma janela deslizante de `window_seconds`. Se a taxa de falhas atingir
+      `failure_rate_threshold` (com pelo menos `minimum_calls` chamadas na
+      janela), o circuito abre.
+    - open: as chamadas falham imediatamente por `open_seconds`.
+    - half_open: até `half_open_max_calls` chamadas de teste são liberadas. Se
+      todas tiverem sucesso o circuito fecha; qualquer falha o reabre.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float,
+        minimum_calls: int,
+        window_seconds: float,
+        open_seconds: float,
+        half_open_max_calls: int,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._outcomes: deque = deque()
+        self._half_open_inflight = 0
+        self._half_open_successes = 0
+
+        self.rejected = 0
+        self.transitions: deque = deque(maxlen=50)
+        self.transition_counts: Dict[str, int] = {CLOSED: 0, OPEN: 0, HALF_OPEN: 0}
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Indica se uma chamada pode ser feita agora, reservando a vaga de teste se preciso"""
+        state = self.state
+        if state == CLOSED:
+            return True
+
+        if state == HALF_OPEN and self._half_open_inflight < self.half_open_max_calls:
+            self._half_open_inflight += 1
+            return True
+
+        self.rejected += 1
+        return False
+
+    def retry_after(self) -> int:
+        """Segundos até o circuito aceitar chamadas de teste"""
+        remaining = self.open_seconds - (time.monotonic() - self._opened_at)
+        return max(1, int(remaining + 0.999))
+
+    def record_success(self) -> None:
+        if self._state == HALF_OPEN:
+            self._half_open_inflight = max(0, self._half_open_inflight - 1)
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(CLOSED)
+            return
+
+        self._record(ok=True)
+
+    def record_failure(self) -> None:
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+
+        self._record(ok=False)
+        if self._state == CLOSED and self._should_trip():
+            self._transition(OPEN)
+
+    def release(self) -> None:
+        """Libera a vaga de uma chamada que não chegou a ter resultado (ex: cancelada)"""
+        if self._state == HALF_OPEN:
+            self._half_open_inflight = max(0, self._half_open_inflight - 1)
+
+    def reset(self) -> None:
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._half_open_inflight = 0
+        self._half_open_successes = 0
+        self.rejected = 0
+        self.transitions.clear()
+        self.transition_counts = {CLOSED: 0, OPEN: 0, HALF_OPEN: 0}
+
+    def failure_rate(self) -> float:
+        self._trim(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes)
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.state
+        return {
+            "state": state,
+            "failure_rate": round(self.failure_rate(), 4),
+            "calls_in_window": len(self._outcomes),
+            "rejected": self.rejected,
+            "retry_after": self.retry_after() if state == OPEN else None,
+            "transition_counts": dict(self.transition_counts),
+            "transitions": list(self.transitions),
+            "config": {
+                "failure_rate_threshold": self.failure_rate_threshold,
+                "minimum_calls": self.minimum_calls,
+                "window_seconds": self.window_seconds,
+                "open_seconds": self.open_seconds,
+                "half_open_max_calls": self.half_open_max_calls,
+            },
+        }
+
+    def _record(self, ok: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, ok))
+        self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def _should_trip(self) -> bool:
+        return (
+            len(self._outcomes) >= self.minimum_calls
+            and self.failure_rate() >= self.failure_rate_threshold
+        )
+
+    def _transition(self, new_state: str) -> None:
+        previous = self._state
+        self._state = new_state
+        self.transition_counts[new_state] += 1
+        self.transitions.append(
+            {
+                "from": previous,
+                "to": new_state,
+                "at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+        if new_state == OPEN:
+            self._opened_at = time.monotonic()
+        if new_state in (OPEN, HALF_OPEN):
+            self._half_open_inflight = 0
+            self._half_open_successes = 0
+        if new_state == CLOSED:
+            self._outcomes.clear()
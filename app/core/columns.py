@@ -0,0 +1,363 @@
+"""
+Colunas tipadas das coleções da SWAPI
+
+A SWAPI guarda números como texto ("1,000", "unknown", "1000km"). As colunas
+são convertidas uma única vez por versão do dataset: campos numéricos viram
+arrays float64 (NaN para valores desconhecidos), campos categóricos viram
+códigos inteiros sobre um dicionário de valores (campos com listas separadas
+por vírgula, como `climate`, também guardam cada valor em formato CSR) e
+relações viram arrays de IDs no formato CSR. Filtros, ordenação e agregações rodam sobre esses arrays.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.core.dataset import dataset
+from app.core.relations import RELATION_FIELDS
+from app.core.search_index import fold
+from app.core.snapshot import RESOURCES, resource_id
+
+NUMERIC_FIELDS = {
+    "people": ("height", "mass"),
+    "planets": ("rotation_period", "orbital_period", "diameter", "surface_water", "population"),
+    "films": ("episode_id",),
+    "starships": (
+        "cost_in_credits",
+        "length",
+        "max_atmosphering_speed",
+        "crew",
+        "passengers",
+        "cargo_capacity",
+        "hyperdrive_rating",
+        "MGLT",
+    ),
+    "vehicles": (
+        "cost_in_credits",
+        "length",
+        "max_atmosphering_speed",
+        "crew",
+        "passengers",
+        "cargo_capacity",
+    ),
+    "species": ("average_height", "average_lifespan"),
+}
+
+CATEGORICAL_FIELDS = {
+    "people": ("gender", "eye_color", "hair_color", "skin_color", "birth_year"),
+    "planets": ("climate", "terrain", "gravity"),
+    "films": ("director", "producer", "release_date"),
+    "starships": ("manufacturer", "starship_class", "consumables"),
+    "vehicles": ("manufacturer", "vehicle_class", "consumables"),
+    "species": ("classification", "designation", "language"),
+}
+
+# Campos que a SWAPI preenche com listas separadas por vírgula ("temperate, arid")
+MULTI_VALUED_FIELDS = {
+    "people": ("hair_color", "skin_color", "eye_color"),
+    "planets": ("climate", "terrain"),
+    "starships": ("manufacturer",),
+    "vehicles": ("manufacturer",),
+}
+
+OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "in")
+# Operadores de ordem só fazem sentido em colunas numéricas
+ORDER_OPERATORS = ("gt", "gte", "lt", "lte")
+
+_LEADING_NUMBER = re.compile(r"\s*(-?\d+(?:\.\d+)?)")
+# Vírgula seguida de "Inc" faz parte do nome ("Gallofree Yards, Inc.")
+_VALUE_SEPARATOR = re.compile(r",(?!\s*inc\b)", re.IGNORECASE)
+
+
+def parse_number(value: Any) -> float:
+    """
+    Converte um valor da SWAPI em número
+
+    Separadores de milhar são ignorados e valores com unidade ou faixa usam
+    o número inicial ("1000km" -> 1000, "30-165" -> 30). Valores sem número
+    ("unknown", "n/a") viram NaN.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _LEADING_NUMBER.match(str(value or "").replace(",", ""))
+    return float(match.group(1)) if match else float("nan")
+
+
+class Categorical:
+    """Coluna com codificação por dicionário: `codes[i]` indexa `categories`"""
+
+    def __init__(self, values: Sequence[str]):
+        self.categories: List[str] = sorted(set(values))
+        lookup = {value: code for code, value in enumerate(self.categories)}
+        self.codes = np.fromiter((lookup[v] for v in values), dtype=np.int32, count=len(values))
+        self._folded = {fold(value): code for code, value in enumerate(self.categories)}
+
+    def code(self, value: str) -> int:
+        """Código de um valor (sem diferenciar maiúsculas e acentos), -1 se não existir"""
+        return self._folded.get(fold(value), -1)
+
+    def matches(self, values: Sequence[str]) -> np.ndarray:
+        """Linhas cujo valor é um dos `values`"""
+        return np.isin(self.codes, [self.code(value) for value in values])
+
+
+def split_values(value: str) -> List[str]:
+    """Valores de uma lista separada por vírgula ("temperate, arid" -> 2 valores)"""
+    return [part.strip() for part in _VALUE_SEPARATOR.split(value)]
+
+
+class MultiCategorical(Categorical):
+    """
+    Coluna categórica com vários valores por linha
+
+    `categories` e `codes` guardam o texto inteiro, usado na ordenação e na
+    exportação. Os valores separados ficam em `parts`, no formato CSR das
+    relações: os da linha i são `parts.codes[offsets[i]:offsets[i + 1]]`.
+    """
+
+    def __init__(self, values: Sequence[str]):
+        super().__init__(values)
+        lists = [split_values(value) for value in values]
+        self.parts = Categorical([part for parts in lists for part in parts])
+        self.lengths = np.fromiter(
+            (len(parts) for parts in lists), dtype=np.int64, count=len(lists)
+        )
+        self.offsets = np.concatenate(([0], np.cumsum(self.lengths)))
+
+    def matches(self, values: Sequence[str]) -> np.ndarray:
+        """Linhas com pelo menos um valor entre `values`"""
+        rows, _ = self.explode()
+        hits = rows[self.parts.matches(values)]
+        return np.bincount(hits, minlength=len(self.lengths)) > 0
+
+    def explode(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(linha, código em `parts.categories`) para cada valor"""
+        return np.repeat(np.arange(len(self.lengths)), self.lengths), self.parts.codes
+
+
+class RelationColumn:
+    """
+    Relação em formato CSR: os IDs de destino da linha i são
+    `targets[offsets[i]:offsets[i + 1]]`
+    """
+
+    def __init__(self, target: str, values: Sequence[Any]):
+        self.target = target
+        lists = [_relation_urls(value) for value in values]
+        self.lengths = np.fromiter((len(urls) for urls in lists), dtype=np.int64, count=len(lists))
+        self.offsets = np.concatenate(([0], np.cumsum(self.lengths)))
+        self.targets = np.fromiter(
+            (resource_id(url) for urls in lists for url in urls),
+            dtype=np.int64,
+            count=int(self.offsets[-1]),
+        )
+
+    def explode(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(linha, ID de destino) para cada par da relação"""
+        return np.repeat(np.arange(len(self.lengths)), self.lengths), self.targets
+
+
+def _relation_urls(value: Any) -> List[str]:
+    if not value:
+        return []
+    return list(value) if isinstance(value, list) else [value]
+
+
+class ResourceColumns:
+    """Colunas tipadas de um recurso, na ordem de ID"""
+
+    def __init__(self, resource: str, items: List[Dict[str, Any]]):
+        self.resource = resource
+        self.ids = np.fromiter(
+            (int(item["url"].rstrip("/").split("/")[-1]) for item in items),
+            dtype=np.int64,
+            count=len(items),
+        )
+        self._rows = {int(item_id): row for row, item_id in enumerate(self.ids)}
+        self.numeric: Dict[str, np.ndarray] = {
+            field: np.fromiter(
+                (parse_number(item.get(field)) for item in items),
+                dtype=np.float64,
+                count=len(items),
+            )
+            for field in NUMERIC_FIELDS[resource]
+        }
+        multi_valued = MULTI_VALUED_FIELDS.get(resource, ())
+        self.categorical: Dict[str, Categorical] = {
+            field: (MultiCategorical if field in multi_valued else Categorical)(
+                [str(item.get(field) or "") for item in items]
+            )
+            for field in CATEGORICAL_FIELDS[resource]
+        }
+        self.relations: Dict[str, RelationColumn] = {
+            field: RelationColumn(target, [item.get(field) for item in items])
+            for field, target in RELATION_FIELDS[resource].items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def rows(self, ids: Sequence[int]) -> np.ndarray:
+        return np.fromiter((self._rows[i] for i in ids), dtype=np.int64, count=len(ids))
+
+    def _mask(self, field: str, operator: str, value: str) -> np.ndarray:
+        if field in self.numeric:
+            column = self.numeric[field]
+            numbers = [float(v) for v in value.split("|")]
+            if operator == "in":
+                return np.isin(column, numbers)
+            number = numbers[0]
+            return {
+                "eq": column == number,
+                "ne": ~(column == number),
+                "gt": column > number,
+                "gte": column >= number,
+                "lt": column < number,
+                "lte": column <= number,
+            }[operator]
+
+        column = self.categorical[field]
+        values = value.split("|")
+        if operator == "in":
+            return column.matches(values)
+        if operator == "eq":
+            return column.matches(values[:1])
+        return ~column.matches(values[:1])
+
+    def mask(self, filters: List[Tuple[str, str, str]]) -> np.ndarray:
+        """Linhas que satisfazem todos os filtros"""
+        keep = np.ones(len(self.ids), dtype=bool)
+        for field, operator, value in filters:
+            keep &= self._mask(field, operator, value)
+        return keep
+
+    def _sort_keys(self, field: str, descending: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """(valor, ausente) para np.lexsort; valores ausentes ficam sempre no fim"""
+        if field == "id":
+            values = self.ids.astype(np.float64)
+            missing = np.zeros(len(values), dtype=bool)
+        elif field in self.numeric:
+            values = self.numeric[field]
+            missing = np.isnan(values)
+            values = np.where(missing, 0.0, values)
+        else:
+            column = self.categorical[field]
+            values = column.codes.astype(np.float64)
+            missing = np.array([not c for c in column.categories], dtype=bool)[column.codes]
+        return (-values if descending else values), missing
+
+    def select(
+        self,
+        ids: Sequence[int],
+        filters: List[Tuple[str, str, str]],
+        sort: List[Tuple[str, bool]],
+    ) -> List[int]:
+        """
+        Aplica filtros e ordenação aos IDs (que já vêm na ordem da busca)
+
+        Empates na ordenação mantêm a ordem recebida.
+        """
+        rows = self.rows(ids)
+        if filters:
+            rows = rows[self.mask(filters)[rows]]
+
+        if sort:
+            keys = [np.arange(len(rows))]
+            for field, descending in reversed(sort):
+                values, missing = self._sort_keys(field, descending)
+                keys += [values[rows], missing[rows]]
+            rows = rows[np.lexsort(keys)]
+
+        return [int(i) for i in self.ids[rows]]
+
+
+def parse_filters(resource: str, filters: Optional[List[str]]) -> List[Tuple[str, str, str]]:
+    """
+    Interpreta filtros no formato `campo:operador:valor`
+
+    Operadores: eq, ne, gt, gte, lt, lte e in (valores separados por `|`).
+    Em campos com listas (`climate`, `terrain`...), eq e in casam com qualquer
+    um dos valores da linha e ne exclui as linhas que têm o valor.
+
+    Raises:
+        HTTPException: 400 para campos, operadores ou formatos inválidos
+    """
+    parsed = []
+    allowed = (*NUMERIC_FIELDS[resource], *CATEGORICAL_FIELDS[resource])
+    for raw in filters or []:
+        parts = raw.split(":", 2)
+        if len(parts) != 3:
+            raise HTTPException(
+                status_code=400, detail=f"Filtro inválido: '{raw}' (use campo:operador:valor)"
+            )
+        field, operator, value = parts
+        if field not in allowed:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Campo '{field}' não pode ser filtrado em '{resource}'. "
+                f"Campos: {', '.join(allowed)}",
+            )
+        if operator not in OPERATORS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Operador '{operator}' inválido. Operadores: {', '.join(OPERATORS)}",
+            )
+        if operator in ORDER_OPERATORS and field not in NUMERIC_FIELDS[resource]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Operador '{operator}' não se aplica ao campo categórico '{field}'",
+            )
+        if field in NUMERIC_FIELDS[resource]:
+            try:
+                for number in value.split("|"):
+                    float(number)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400, detail=f"Valor numérico inválido para '{field}': {value}"
+                ) from e
+        parsed.append((field, operator, value))
+    return parsed
+
+
+def parse_sort(resource: str, sort: Optional[str]) -> List[Tuple[str, bool]]:
+    """
+    Interpreta `sort` como campos separados por vírgula; `-campo` é decrescente
+
+    Raises:
+        HTTPException: 400 para campos que não podem ser ordenados
+    """
+    if not sort:
+        return []
+
+    allowed = ("id", *NUMERIC_FIELDS[resource], *CATEGORICAL_FIELDS[resource])
+    parsed = []
+    for name in (part.strip() for part in sort.split(",")):
+        descending = name.startswith("-")
+        field = name.lstrip("-")
+        if field not in allowed:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Campo '{field}' não pode ser ordenado em '{resource}'. "
+                f"Campos: {', '.join(allowed)}",
+            )
+        parsed.append((field, descending))
+    return parsed
+
+
+class ColumnStore:
+    """Colunas tipadas de todos os recursos, derivadas do `dataset`"""
+
+    def table(self, resource: str) -> Optional[ResourceColumns]:
+        return dataset.derived(
+            f"columns:{resource}",
+            lambda store: ResourceColumns(resource, store.items(resource)),
+        )
+
+    def build(self) -> None:
+        for resource in RESOURCES:
+            self.table(resource)
+
+
+columns = ColumnStore()
@@ -0,0 +1,213 @@
+"""
+Coocorrência de itens nos filmes
+
+A incidência filme × item (personagens, planetas, naves, veículos ou
+espécies) vem das relações dos filmes como uma matriz densa, e a
+coocorrência é o produto `B.T @ B`: a célula (i, j) conta os filmes em que
+os itens i e j aparecem juntos. O produto é calculado em blocos de linhas,
+para não materializar a matriz item × item inteira, e guarda só os pares
+mais frequentes. Quando o dataset é atualizado, só as linhas dos itens
+cuja incidência mudou são calculadas de novo.
+"""
+
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.core.columns import columns
+from app.core.dataset import dataset
+from app.core.relations import RELATION_FIELDS
+
+# Recurso de destino -> campo do filme que aponta para ele
+FILM_FIELDS = {target: field for field, target in RELATION_FIELDS["films"].items()}
+# Pares pré-calculados por recurso (limite máximo de `limit`)
+TOP_PAIRS = 100
+# Pares guardados por recurso: a folga acima de TOP_PAIRS permite atualizar sem refazer o produto
+_CANDIDATES = 4 * TOP_PAIRS
+# Células item × item calculadas por bloco do produto
+_BLOCK_CELLS = 1 << 22
+
+# (linha i, linha j, filmes em comum)
+Pairs = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _top(pairs: Pairs, k: int) -> Pairs:
+    """Os k pares mais frequentes; empates pela ordem das linhas"""
+    rows, cols, counts = pairs
+    order = np.lexsort((cols, rows, -counts))[:k]
+    return rows[order], cols[order], counts[order]
+
+
+def _concat(*parts: Pairs) -> Pairs:
+    return tuple(np.concatenate([part[i] for part in parts]) for i in range(3))
+
+
+def _ranked_until(pairs: Pairs, last: Pairs) -> int:
+    """Quantos dos pares (ordenados) não vêm depois do último par de `last`"""
+    rows, cols, counts = pairs
+    row, col, count = (int(part[-1]) for part in last)
+    after = (counts < count) | ((counts == count) & ((rows > row) | ((rows == row) & (cols > col))))
+    return int(np.argmax(after)) if after.any() else len(rows)
+
+
+def _pairs(incidence: np.ndarray, k: int, items: Optional[np.ndarray] = None) -> Pairs:
+    """
+    Os k pares mais frequentes com ao menos um item em `items` (todos, por padrão)
+
+    O produto é feito em blocos de linhas (as dos itens de `items`).
+    """
+    size = incidence.shape[1]
+    items = np.arange(size) if items is None else items
+    in_items = np.zeros(size, dtype=bool)
+    in_items[items] = True
+    best: Pairs = (np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.int64))
+    block = max(1, _BLOCK_CELLS // max(size, 1))
+    for start in range(0, len(items), block):
+        chunk = items[start : start + block]
+        counts = incidence[:, chunk].T @ incidence
+        # Cada par uma vez e sem o próprio item: entre dois itens de `items`, só na linha do menor
+        counts[(chunk[:, None] >= np.arange(size)) & in_items] = 0
+        rows, cols = np.nonzero(counts)
+        values = counts[rows, cols].astype(np.int64)
+        if len(values) > k:
+            keep = values >= np.partition(values, len(values) - k)[len(values) - k]
+            rows, cols, values = rows[keep], cols[keep], values[keep]
+        rows = chunk[rows]
+        best = _top(_concat(best, (np.minimum(rows, cols), np.maximum(rows, cols), values)), k)
+    return best
+
+
+class Cooccurrence:
+    """Incidência filme × item de um recurso e os pares mais frequentes"""
+
+    def __init__(
+        self,
+        resource: str,
+        ids: np.ndarray,
+        incidence: np.ndarray,
+        pairs: Optional[Pairs] = None,
+        complete: bool = False,
+    ):
+        self.resource = resource
+        self.ids = ids
+        self.incidence = incidence
+        self.fingerprint = fingerprint(ids, incidence)
+        if pairs is None:
+            pairs = _pairs(incidence, _CANDIDATES)
+            complete = len(pairs[0]) < _CANDIDATES
+        # Pares mais frequentes, em ordem; os que não estão aqui vêm depois do último.
+        # `complete`: não há outros pares com filmes em comum
+        self.pairs = pairs
+        self.complete = complete
+
+    def update(self, ids: np.ndarray, incidence: np.ndarray) -> "Cooccurrence":
+        """
+        Coocorrência de uma nova incidência, recalculando só os itens que mudaram
+
+        Os pares entre itens que não mudaram mantêm a contagem; os dos itens
+        alterados vêm das linhas deles no produto. Pares que não estavam
+        guardados vêm depois do último guardado, então a nova lista só vale até
+        esse ponto; se ele não cobre TOP_PAIRS (ou os itens e filmes não são os
+        mesmos), o produto é refeito inteiro.
+        """
+        if not np.array_equal(ids, self.ids) or incidence.shape != self.incidence.shape:
+            return Cooccurrence(self.resource, ids, incidence)
+        changed = np.flatnonzero((incidence != self.incidence).any(axis=0))
+        rows, cols, _ = self.pairs
+        unchanged = ~(np.isin(rows, changed) | np.isin(cols, changed))
+        merged = _concat(
+            tuple(part[unchanged] for part in self.pairs),
+            _pairs(incidence, _CANDIDATES, changed),
+        )
+        pairs = _top(merged, _CANDIDATES)
+        if self.complete:
+            return Cooccurrence(
+                self.resource, ids, incidence, pairs, complete=len(merged[0]) < _CANDIDATES
+            )
+        exact = _ranked_until(pairs, self.pairs)
+        if exact < TOP_PAIRS:
+            return Cooccurrence(self.resource, ids, incidence)
+        return Cooccurrence(self.resource, ids, incidence, tuple(part[:exact] for part in pairs))
+
+    def top_pairs(self, limit: int) -> List[Tuple[int, int, int]]:
+        """(ID, ID, filmes em comum) dos pares mais frequentes"""
+        rows, cols, counts = (part[:limit] for part in self.pairs)
+        return list(zip(self.ids[rows].tolist(), self.ids[cols].tolist(), counts.tolist()))
+
+    def partners(self, item_id: int, limit: int) -> Optional[List[Tuple[int, int]]]:
+        """(ID, filmes em comum) dos itens que mais aparecem com `item_id`"""
+        row = int(np.searchsorted(self.ids, item_id))
+        if row >= len(self.ids) or self.ids[row] != item_id:
+            return None
+        counts = (self.incidence[:, row] @ self.incidence).astype(np.int64)
+        counts[row] = 0
+        rows = np.flatnonzero(counts)
+        rows = rows[np.lexsort((rows, -counts[rows]))][:limit]
+        return list(zip(self.ids[rows].tolist(), counts[rows].tolist()))
+
+
+def fingerprint(ids: np.ndarray, incidence: np.ndarray) -> str:
+    digest = hashlib.sha1(ids.tobytes())
+    digest.update(np.packbits(incidence > 0).tobytes())
+    return digest.hexdigest()
+
+
+def incidence(resource: str) -> Tuple[np.ndarray, np.ndarray]:
+    """IDs dos itens e a matriz filme × item (1 quando o item está no filme)"""
+    ids = columns.table(resource).ids
+    relation = columns.table("films").relations[FILM_FIELDS[resource]]
+    films, targets = relation.explode()
+    rows = np.searchsorted(ids, targets)
+    found = rows < len(ids)
+    found[found] = ids[rows[found]] == targets[found]
+    matrix = np.zeros((len(relation.lengths), len(ids)), dtype=np.float32)
+    matrix[films[found], rows[found]] = 1
+    return ids, matrix
+
+
+class CooccurrenceStore:
+    """
+    Coocorrências de todos os recursos, derivadas do `dataset`
+
+    Quando o dataset muda (nova versão ao vencer o TTL, ou outro snapshot), a
+    incidência é remontada (é barata); o produto é reaproveitado se ela não
+    mudou e, se mudou, recalculado só para os itens alterados.
+    """
+
+    def __init__(self):
+        self._previous: Dict[str, Cooccurrence] = {}
+
+    def _build(self, resource: str) -> Cooccurrence:
+        ids, matrix = incidence(resource)
+        previous = self._previous.get(resource)
+        if previous is None:
+            self._previous[resource] = Cooccurrence(resource, ids, matrix)
+        elif previous.fingerprint != fingerprint(ids, matrix):
+            self._previous[resource] = previous.update(ids, matrix)
+        return self._previous[resource]
+
+    def table(self, resource: str) -> Optional[Cooccurrence]:
+        return dataset.derived(f"cooccurrence:{resource}", lambda store: self._build(resource))
+
+    def build(self) -> None:
+        for resource in FILM_FIELDS:
+            self.table(resource)
+
+
+def parse_cooccurrence_resource(resource: str) -> str:
+    """
+    Raises:
+        HTTPException: 400 para recursos que não aparecem nos filmes
+    """
+    if resource not in FILM_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Coocorrência não disponível para '{resource}'. "
+            f"Recursos: {', '.join(FILM_FIELDS)}",
+        )
+    return resource
+
+
+cooccurrence = CooccurrenceStore()
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from app.core.request_context import record_cache_status
+from app.core.snapshot import RESOURCES, BaseSnapshot, crawl
+from app.core.swapi_client import swapi_client
+
+logger = logging.getLogger(__name__)
+
+
+class Dataset:
+    """
+    Coleções completas da SWAPI disponíveis localmente
+
+    A fonte é o snapshot do modo offline, quando configurado, ou as coleções
+    baixadas da SWAPI (pelo warm-up ou sob demanda). Estruturas derivadas
+    (índices, colunas) usam `version` para saber quando precisam ser refeitas.
+
+    Coleções baixadas da SWAPI vencem com o TTL do cache (`SWAPI_CACHE_TTL`):
+    depois disso continuam servindo enquanto são baixadas de novo em segundo
+    plano, e a nova versão substitui a anterior quando fica pronta.
+    """
+
+    def __init__(self):
+        self._store: Optional[BaseSnapshot] = None
+        self._loading: Optional[asyncio.Future] = None
+        self._refreshing: Optional[asyncio.Task] = None
+        # Instante (time.monotonic) do último download; None para coleções instaladas
+        self._loaded_at: Optional[float] = None
+        self._on_refresh: List[Callable[[], None]] = []
+        self.version = 0
+        self._derived: Dict[str, Any] = {}
+        self._derived_from: Optional[BaseSnapshot] = None
+        self._derived_version: Optional[int] = None
+
+    @property
+    def store(self) -> Optional[BaseSnapshot]:
+        snapshot = swapi_client._get_snapshot()
+        if snapshot is not None:
+            return snapshot
+        return self._store
+
+    @property
+    def available(self) -> bool:
+        return self.store is not None
+
+    @property
+    def expired(self) -> bool:
+        """Coleções baixadas da SWAPI há mais tempo que o TTL do cache"""
+        return (
+            self._loaded_at is not None
+            and swapi_client._get_snapshot() is None
+            and time.monotonic() - self._loaded_at >= swapi_client.cache.ttl
+        )
+
+    def install(self, store: BaseSnapshot) -> None:
+        """Substitui as coleções em memória (coleções instaladas não vencem)"""
+        self._store = store
+        self._loaded_at = None
+        self.version += 1
+
+    def on_refresh(self, callback: Callable[[], None]) -> None:
+        """Registra uma função chamada depois de cada atualização em segundo plano"""
+        self._on_refresh.append(callback)
+
+    def items(self, resource: str) -> List[Dict[str, Any]]:
+        store = self.store
+        return store.items(resource) if store is not None else []
+
+    async def load(
+        self,
+        resources: Iterable[str] = RESOURCES,
+        concurrency: int = 4,
+        on_page=None,
+        revalidate: bool = False,
+    ):
+        """
+        Baixa as coleções da SWAPI (passando pelo cache) e as instala
+
+        Com `revalidate`, as páginas vencidas no cache são buscadas de novo em
+        vez de reaproveitadas.
+        """
+        store = await crawl(
+            swapi_client,
+            resources,
+            concurrency=concurrency,
+            on_page=on_page,
+            revalidate=revalidate,
+        )
+        for resource in store.counts():
+            for item in store.items(resource):
+                swapi_client.prime(item["url"], item)
+        self.install(store)
+        self._loaded_at = time.monotonic()
+        return store
+
+    async def _refresh(self, resources: List[str]) -> None:
+        try:
+            await self.load(resources, revalidate=True)
+        except Exception as e:  # pylint: disable=broad-except
+            # As coleções atuais continuam servindo; nova tentativa depois de outro TTL
+            self._loaded_at = time.monotonic()
+            logger.warning("Falha ao atualizar o dataset local: %s", getattr(e, "detail", e))
+            return
+        for callback in self._on_refresh:
+            callback()
+
+    def refresh_if_expired(self) -> None:
+        """Baixa as coleções de novo em segundo plano, uma única vez, se venceram"""
+        if not self.expired or (self._refreshing is not None and not self._refreshing.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Fora do event loop (scripts, benchmarks): segue com as coleções atuais
+            return
+        self._refreshing = loop.create_task(self._refresh(list(self._store.counts())))
+
+    async def ensure_loaded(self) -> BaseSnapshot:
+        """Garante que as coleções estão disponíveis, baixando-as uma única vez"""
+        store = self.store
+        if store is not None:
+            self.refresh_if_expired()
+            return store
+
+        if self._loading is None or self._loading.done():
+            self._loading = asyncio.ensure_future(self.load())
+        return await asyncio.shield(self._loading)
+
+    def derived(self, name: str, build: Callable[[BaseSnapshot], Any]) -> Any:
+        """
+        Estrutura derivada das coleções (índice, colunas), construída uma vez
+
+        `build` recebe as coleções e só é chamado de novo quando elas mudam
+        (nova versão ou outro snapshot). Retorna None sem dataset disponível.
+        Coleções vencidas são atualizadas em segundo plano (`refresh_if_expired`).
+        """
+        store = self.store
+        if store is None:
+            return None
+        self.refresh_if_expired()
+        if store is not self._derived_from or self.version != self._derived_version:
+            self._derived = {}
+            self._derived_from = store
+            self._derived_version = self.version
+        if name not in self._derived:
+            self._derived[name] = build(store)
+        return self._derived[name]
+
+    def record_source(self) -> None:
+        """Marca a resposta em andamento como servida pelo dataset local"""
+        record_cache_status("snapshot" if swapi_client._get_snapshot() is not None else "local")
+
+    def reset(self) -> None:
+        self._store = None
+        self._loading = None
+        self._refreshing = None
+        self._loaded_at = None
+        self.version += 1
+
+
+dataset = Dataset()
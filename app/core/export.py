@@ -0,0 +1,48 @@
+"""
+Exportação de coleções inteiras em NDJSON
+
+As páginas vêm de `SWAPIClient.iter_pages`: buscadas concorrentemente dentro
+de uma janela deslizante e emitidas na ordem. A memória fica limitada a
+`window` páginas e um consumidor lento segura as buscas (backpressure).
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def first_page(client, resource: str, search: Optional[str] = None) -> Dict[str, Any]:
+    """Primeira página, buscada antes do streaming para que erros virem status HTTP"""
+    params: Dict[str, Any] = {"page": 1}
+    if search:
+        params["search"] = search
+    return await client._make_request(resource, params)
+
+
+async def ndjson_lines(
+    client,
+    resource: str,
+    first: Dict[str, Any],
+    search: Optional[str] = None,
+    window: int = 4,
+) -> AsyncIterator[bytes]:
+    """
+    Uma linha JSON por item
+
+    Como o status HTTP já foi enviado, uma falha no meio da exportação vira
+    uma última linha `{"error": ...}`.
+    """
+    try:
+        async for items in client.iter_pages(resource, first, search, window):
+            yield "".join(
+                json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n" for item in items
+            ).encode()
+    except HTTPException as e:
+        logger.warning("Exportação de %s interrompida: %s", resource, e.detail)
+        yield (json.dumps({"error": e.detail}, ensure_ascii=False) + "\n").encode()
@@ -0,0 +1,179 @@
+"""
+Grafo de relações entre todos os itens do dataset
+
+Cada item é um nó com ID inteiro (deslocamento do recurso + linha na coluna)
+e as arestas vêm das relações por URL de todos os recursos, sem direção. A
+adjacência fica em arrays CSR e as buscas em largura expandem um nível
+inteiro por vez com operações vetorizadas.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.core.columns import ResourceColumns, columns
+from app.core.dataset import dataset
+from app.core.snapshot import RESOURCES, SEARCH_FIELDS, parse_endpoint
+
+
+class GraphIndex:
+    """Adjacência CSR: os vizinhos do nó n são `indices[indptr[n]:indptr[n + 1]]`"""
+
+    def __init__(self, tables: Dict[str, ResourceColumns]):
+        self.resources = list(tables)
+        self.ids: Dict[str, np.ndarray] = {r: tables[r].ids for r in self.resources}
+        sizes = [len(self.ids[r]) for r in self.resources]
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int64)
+        self.base = dict(zip(self.resources, offsets.tolist()))
+        self.size = int(sum(sizes))
+        self.kind = np.repeat(np.arange(len(self.resources)), sizes)
+
+        sources = [np.empty(0, dtype=np.int64)]
+        targets = [np.empty(0, dtype=np.int64)]
+        for resource, table in tables.items():
+            for relation in table.relations.values():
+                rows, target_ids = relation.explode()
+                # Relações para itens fora do dataset são ignoradas
+                target_rows, found = self._rows(relation.target, target_ids)
+                sources.append(self.base[resource] + rows[found])
+                targets.append(self.base[relation.target] + target_rows[found])
+
+        # Arestas nos dois sentidos e sem repetição (a SWAPI lista a maioria dos dois lados)
+        edges = np.unique(
+            np.stack(
+                (np.concatenate(sources + targets), np.concatenate(targets + sources)), axis=1
+            ),
+            axis=0,
+        )
+        self.indices = edges[:, 1].copy()
+        self.indptr = np.concatenate(
+            ([0], np.cumsum(np.bincount(edges[:, 0], minlength=self.size)))
+        )
+
+    def _rows(self, resource: str, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Linha de cada ID (os IDs de cada recurso estão em ordem) e quais existem"""
+        known = self.ids[resource]
+        rows = np.searchsorted(known, ids)
+        found = rows < len(known)
+        found[found] = known[rows[found]] == ids[found]
+        return rows, found
+
+    def node(self, resource: str, item_id: int) -> Optional[int]:
+        if resource not in self.base:
+            return None
+        rows, found = self._rows(resource, np.array([item_id], dtype=np.int64))
+        return int(self.base[resource] + rows[0]) if found[0] else None
+
+    def describe(self, node: int) -> Tuple[str, int]:
+        resource = self.resources[int(self.kind[node])]
+        return resource, int(self.ids[resource][node - self.base[resource]])
+
+    def degree(self, node: int) -> int:
+        return int(self.indptr[node + 1] - self.indptr[node])
+
+    def _expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(vizinho, nó de origem) de todos os nós da fronteira de uma vez"""
+        starts = self.indptr[frontier]
+        lengths = self.indptr[frontier + 1] - starts
+        shift = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        positions = shift + np.arange(int(lengths.sum()))
+        return self.indices[positions], np.repeat(frontier, lengths)
+
+    def bfs(
+        self,
+        source: int,
+        max_depth: int,
+        target: Optional[int] = None,
+        passable: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Busca em largura a partir de `source`
+
+        Retorna (distância, pai) de cada nó; -1 para nós não alcançados. Nós
+        fora de `passable` podem ser alcançados, mas não servem de passagem.
+        Para assim que `target` é alcançado.
+        """
+        distance = np.full(self.size, -1, dtype=np.int64)
+        parent = np.full(self.size, -1, dtype=np.int64)
+        distance[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        for depth in range(1, max_depth + 1):
+            neighbors, origins = self._expand(frontier)
+            new = distance[neighbors] < 0
+            neighbors, first = np.unique(neighbors[new], return_index=True)
+            if not len(neighbors):
+                break
+            distance[neighbors] = depth
+            parent[neighbors] = origins[new][first]
+            if target is not None and distance[target] >= 0:
+                break
+            frontier = neighbors if passable is None else neighbors[passable[neighbors]]
+        return distance, parent
+
+    def passable(self, resources: Iterable[str]) -> np.ndarray:
+        """Máscara dos nós dos recursos informados"""
+        return np.isin(self.kind, [self.resources.index(r) for r in resources])
+
+    def path(self, parent: np.ndarray, target: int) -> List[int]:
+        """Caminho da origem da busca até `target`, a partir dos pais da BFS"""
+        path = [target]
+        while parent[path[-1]] >= 0:
+            path.append(int(parent[path[-1]]))
+        return path[::-1]
+
+
+def graph() -> Optional[GraphIndex]:
+    """Grafo do dataset atual, construído uma vez por versão"""
+    return dataset.derived(
+        "graph", lambda store: GraphIndex({r: columns.table(r) for r in RESOURCES})
+    )
+
+
+def parse_node(index: GraphIndex, value: str) -> int:
+    """
+    Converte "people/1" em nó do grafo
+
+    Raises:
+        HTTPException: 400 para formatos inválidos, 404 para itens inexistentes
+    """
+    try:
+        resource, item_id = parse_endpoint(value)
+    except ValueError:
+        resource, item_id = value, None
+    if item_id is None or resource not in RESOURCES:
+        raise HTTPException(
+            status_code=400, detail=f"Nó inválido: '{value}' (use recurso/id, ex: people/1)"
+        )
+    node = index.node(resource, item_id)
+    if node is None:
+        raise HTTPException(status_code=404, detail=f"Recurso não encontrado: {value}")
+    return node
+
+
+def parse_resources(value: Optional[str]) -> List[str]:
+    """
+    Raises:
+        HTTPException: 400 para recursos desconhecidos
+    """
+    if not value:
+        return []
+    resources = [part.strip() for part in value.split(",") if part.strip()]
+    unknown = [resource for resource in resources if resource not in RESOURCES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Recursos desconhecidos: {', '.join(unknown)}. Recursos: {', '.join(RESOURCES)}",
+        )
+    return resources
+
+
+def node_info(index: GraphIndex, node: int, **extra) -> Dict:
+    resource, item_id = index.describe(node)
+    item = dataset.store.get(resource, item_id) or {}
+    return {
+        "resource": resource,
+        "id": item_id,
+        "name": item.get(SEARCH_FIELDS[resource][0]),
+        **extra,
+    }
@@ -0,0 +1,155 @@
+import asyncio
+import statistics
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+
+class LimiterRejectedError(Exception):
+    """A chamada não conseguiu vaga no limitador dentro do tempo de espera permitido"""
+
+
+class TokenBucket:
+    """
+    Token bucket para limitar a taxa de requisições
+
+    `reserve` consome um token imediatamente (o saldo pode ficar negativo) e
+    devolve quanto tempo o chamador deve esperar para respeitar a taxa. Assim
+    os chamadores são atendidos na ordem de chegada.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def refill(self) -> None:
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    def cancel(self) -> None:
+        """Devolve um token reservado que não será usado"""
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class UpstreamLimiter:
+    """
+    Limita as chamadas simultâneas e a taxa de requisições à SWAPI
+
+    Chamadores excedentes esperam em fila por no máximo `max_wait` segundos;
+    se a fila já tiver `max_queue` chamadores, a chamada é recusada na hora.
+    Com `max_queue=0`, nenhuma chamada espera: só passam as que têm vaga livre.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate: float,
+        burst: int,
+        max_wait: float,
+        max_queue: int,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(rate, burst) if rate > 0 else None
+
+        self.queued = 0
+        self.peak_queued = 0
+        self.active = 0
+        self.acquired = 0
+        self.rejected = 0
+        self._waits: deque = deque(maxlen=1000)
+
+    @asynccontextmanager
+    async def slot(self, max_wait: float) -> AsyncIterator[None]:
+        """Ocupa uma vaga de chamada à SWAPI, esperando no máximo `max_wait` segundos"""
+        await self._acquire(min(max_wait, self.max_wait))
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+
+    def _enqueue(self, max_wait: float) -> None:
+        """Entra na fila de espera, ou recusa a chamada se não houver espaço ou tempo"""
+        if self.queued >= self.max_queue or max_wait <= 0:
+            self.rejected += 1
+            raise LimiterRejectedError()
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+
+    async def _acquire(self, max_wait: float) -> None:
+        """
+        Só entram na fila (e contam para `max_queue`) os chamadores que
+        realmente esperam: sem vaga livre ou com a taxa esgotada
+        """
+        started = time.monotonic()
+        if self._semaphore.locked():
+            self._enqueue(max_wait)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=max_wait)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise LimiterRejectedError()
+            finally:
+                self.queued -= 1
+        else:
+            # Vaga livre: o acquire retorna sem suspender
+            await self._semaphore.acquire()
+
+        if self._bucket is not None:
+            delay = self._bucket.reserve()
+            if delay:
+                try:
+                    if time.monotonic() - started + delay > max_wait:
+                        self.rejected += 1
+                        raise LimiterRejectedError()
+                    self._enqueue(max_wait)
+                except LimiterRejectedError:
+                    self._bucket.cancel()
+                    self._semaphore.release()
+                    raise
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    # Chamador desistiu (prazo, cliente desconectado): devolve o token reservado
+                    self._bucket.cancel()
+                    self._semaphore.release()
+                    raise
+                finally:
+                    self.queued -= 1
+
+        self.active += 1
+        self.acquired += 1
+        self._waits.append(time.monotonic() - started)
+
+    def reset(self) -> None:
+        if self._bucket is not None:
+            self._bucket.refill()
+        self.peak_queued = self.acquired = self.rejected = 0
+        self._waits.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "max_concurrency": self.max_concurrency,
+            "rate": self._bucket.rate if self._bucket else None,
+            "active": self.active,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "wait_p50_ms": round(statistics.median(waits) * 1000, 3) if waits else None,
+            "wait_max_ms": round(waits[-1] * 1000, 3) if waits else None,
+        }
@@ -0,0 +1,170 @@
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Query
+from starlette.datastructures import URL
+
+from app.config import settings
+from app.core.columns import columns, parse_filters, parse_sort
+from app.core.dataset import dataset
+from app.core.search_index import search_index
+
+
+def query_key(
+    search: Optional[str],
+    fuzzy: bool,
+    filters: List[Tuple[str, str, str]],
+    sort: List[Tuple[str, bool]],
+) -> str:
+    """Identifica a listagem (busca, filtros e ordenação) a que um cursor pertence"""
+    state = json.dumps([search or "", fuzzy, filters, sort], separators=(",", ":"))
+    return hashlib.sha1(state.encode()).hexdigest()[:12]
+
+
+def encode_cursor(offset: int, page_size: int, key: str) -> str:
+    """Cursor opaco: posição, tamanho da página e a listagem a que pertence"""
+    payload = json.dumps({"o": offset, "n": page_size, "k": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Raises:
+        HTTPException: 400 para cursores malformados
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset, page_size, key = int(data["o"]), int(data["n"]), str(data["k"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Cursor inválido") from e
+    if offset < 0 or page_size < 1:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    return {"offset": offset, "page_size": page_size, "key": key}
+
+
+async def local_page(
+    resource: str,
+    url: URL,
+    search: Optional[str] = None,
+    fuzzy: bool = False,
+    page: int = 1,
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    filters: Optional[List[Tuple[str, str, str]]] = None,
+    sort: Optional[List[Tuple[str, bool]]] = None,
+) -> Dict[str, Any]:
+    """
+    Página com tamanho escolhido pelo cliente, montada sobre o dataset local
+
+    Mantém o formato de `PaginatedResponse`; `next`/`previous` apontam para a
+    própria URL da requisição (preservando os demais parâmetros) com um
+    cursor no lugar de `page`. `filters` e `sort` (já interpretados por
+    `parse_filters`/`parse_sort`) rodam sobre as colunas tipadas. Sem snapshot
+    ou aquecimento, as coleções são baixadas uma única vez.
+
+    Raises:
+        HTTPException: 400 para tamanhos de página ou cursores inválidos,
+            404 para páginas inexistentes
+    """
+    if page_size is not None and not 1 <= page_size <= settings.max_page_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"page_size deve estar entre 1 e {settings.max_page_size}",
+        )
+
+    filters, sort = filters or [], sort or []
+    key = query_key(search, fuzzy, filters, sort)
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position["key"] != key:
+            raise HTTPException(status_code=400, detail="Cursor não pertence a esta listagem")
+        offset = position["offset"]
+        page_size = page_size or position["page_size"]
+    else:
+        page_size = page_size or settings.default_page_size
+        offset = (page - 1) * page_size
+
+    await dataset.ensure_loaded()
+    ids = search_index.matching_ids(resource, search, fuzzy=fuzzy and bool(search))
+    if filters or sort:
+        ids = columns.table(resource).select(ids, filters, sort)
+    if offset and offset >= len(ids):
+        raise HTTPException(status_code=404, detail=f"Página inexistente: {resource}")
+
+    base = url.remove_query_params(["page", "page_size", "cursor"])
+
+    def link(start: int) -> str:
+        return str(base.include_query_params(cursor=encode_cursor(start, page_size, key)))
+
+    return {
+        "count": len(ids),
+        "next": link(offset + page_size) if offset + page_size < len(ids) else None,
+        "previous": link(max(0, offset - page_size)) if offset > 0 else None,
+        "results": search_index.load_items(resource, ids[offset : offset + page_size]),
+    }
+
+
+class ListParams:
+    """Parâmetros de paginação, busca aproximada, filtro e ordenação das rotas de listagem"""
+
+    def __init__(
+        self,
+        page: int = Query(1, ge=1, description="Número da página", examples=1),
+        fuzzy: bool = Query(False, description="Busca aproximada, tolerante a erros de digitação"),
+        page_size: Optional[int] = Query(
+            None, ge=1, description="Itens por página (paginação local, até SWAPI_MAX_PAGE_SIZE)"
+        ),
+        cursor: Optional[str] = Query(None, description="Cursor opaco retornado em next/previous"),
+        filters: Optional[List[str]] = Query(
+            None,
+            alias="filter",
+            description="Filtro campo:operador:valor (eq, ne, gt, gte, lt, lte, in); pode repetir",
+        ),
+        sort: Optional[str] = Query(
+            None, description="Campos de ordenação separados por vírgula; -campo é decrescente"
+        ),
+    ):
+        self.page = page
+        self.fuzzy = fuzzy
+        self.page_size = page_size
+        self.cursor = cursor
+        self.filters = filters
+        self.sort = sort
+
+
+async def list_page(
+    resource: str,
+    url: URL,
+    search: Optional[str],
+    params: ListParams,
+    service: Callable[..., Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Página de uma rota de listagem
+
+    Com `page_size`, `cursor`, filtros, ordenação ou busca aproximada, a página
+    é montada localmente (`local_page`); senão vem da SWAPI via `service`.
+
+    Raises:
+        HTTPException: 400 para filtros ou ordenações inválidos (antes de
+            qualquer acesso aos dados)
+    """
+    filters = parse_filters(resource, params.filters)
+    sort = parse_sort(resource, params.sort)
+    if params.page_size or params.cursor or filters or sort or (params.fuzzy and search):
+        return await local_page(
+            resource,
+            url,
+            search,
+            params.fuzzy,
+            params.page,
+            page_size=params.page_size,
+            cursor=params.cursor,
+            filters=filters,
+            sort=sort,
+        )
+    return await service(search=search, page=params.page)
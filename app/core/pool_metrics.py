@@ -0,0 +1,78 @@
+import statistics
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Eventos do httpcore que marcam o fim da espera por uma conexão do pool
+_NEW_CONNECTION_EVENTS = {"connection.connect_tcp.started"}
+_REUSED_CONNECTION_EVENTS = {
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+}
+
+
+class PoolMonitor:
+    """
+    Mede a ocupação e o tempo de espera do pool de conexões do httpx
+
+    O tempo de espera é medido pela extensão de trace do httpcore: é o intervalo
+    entre o início da requisição e o momento em que ela começa a abrir uma nova
+    conexão ou a enviar os headers por uma conexão reaproveitada.
+    """
+
+    def __init__(self, max_connections: Optional[int] = None):
+        self.max_connections = max_connections
+        self.inflight = 0
+        self.peak_inflight = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self._waits: deque = deque(maxlen=1000)
+
+    def request_started(self) -> Callable[[str, Dict[str, Any]], Awaitable[None]]:
+        """Registra o início de uma requisição e devolve o callback de trace dela"""
+        self.inflight += 1
+        self.peak_inflight = max(self.peak_inflight, self.inflight)
+        started = time.monotonic()
+        acquired = False
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal acquired
+            if acquired:
+                return
+            if event_name in _NEW_CONNECTION_EVENTS:
+                self.new_connections += 1
+            elif event_name in _REUSED_CONNECTION_EVENTS:
+                self.reused_connections += 1
+            else:
+                return
+            acquired = True
+            self._waits.append(time.monotonic() - started)
+
+        return trace
+
+    def request_finished(self) -> None:
+        self.inflight = max(0, self.inflight - 1)
+
+    def reset(self) -> None:
+        self.inflight = self.peak_inflight = 0
+        self.new_connections = self.reused_connections = 0
+        self._waits.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "max_connections": self.max_connections,
+            "inflight": self.inflight,
+            "peak_inflight": self.peak_inflight,
+            "occupancy": (
+                round(self.inflight / self.max_connections, 4) if self.max_connections else None
+            ),
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "wait_p50_ms": round(statistics.median(waits) * 1000, 3) if waits else None,
+            "wait_p99_ms": (
+                round(waits[min(len(waits) - 1, int(len(waits) * 0.99))] * 1000, 3)
+                if waits
+                else None
+            ),
+        }
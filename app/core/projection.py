@@ -0,0 +1,54 @@
+from typing import Any, Dict, List, Optional, Type, Union
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def parse_fields(model: Type[BaseModel], fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Valida o parâmetro `fields` contra os campos do schema do recurso
+
+    Raises:
+        HTTPException: 400 para campos que não existem no schema
+    """
+    if not fields:
+        return None
+
+    selected = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [field for field in selected if field not in model.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campos inexistentes em {model.__name__}: {', '.join(unknown)}",
+        )
+    return selected or None
+
+
+def project_item(item: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    return {field: item[field] for field in fields if field in item}
+
+
+def project(
+    data: Dict[str, Any], fields: Optional[List[str]], paginated: bool = False
+) -> Union[Dict[str, Any], JSONResponse]:
+    """
+    Reduz a resposta aos campos pedidos em `?fields=`
+
+    Sem `fields`, devolve os dados como estão para a validação normal do
+    `response_model`. Com `fields`, devolve diretamente um JSONResponse com os
+    campos pedidos, evitando validar e serializar o restante do objeto.
+    """
+    if fields is None:
+        return data
+
+    if paginated:
+        content = {
+            "count": data.get("count"),
+            "next": data.get("next"),
+            "previous": data.get("previous"),
+            "results": [project_item(item, fields) for item in data.get("results", [])],
+        }
+    else:
+        content = project_item(data, fields)
+    return JSONResponse(content=content)
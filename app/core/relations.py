@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.core.swapi_client import swapi_client
+
+# Campos de cada recurso que apontam para outros recursos (por URL)
+RELATION_FIELDS: Dict[str, Dict[str, str]] = {
+    "people": {
+        "homeworld": "planets",
+        "films": "films",
+        "species": "species",
+        "vehicles": "vehicles",
+        "starships": "starships",
+    },
+    "planets": {"residents": "people", "films": "films"},
+    "films": {
+        "characters": "people",
+        "planets": "planets",
+        "starships": "starships",
+        "vehicles": "vehicles",
+        "species": "species",
+    },
+    "starships": {"pilots": "people", "films": "films"},
+    "vehicles": {"pilots": "people", "films": "films"},
+    "species": {"homeworld": "planets", "people": "people", "films": "films"},
+}
+
+
+def url_to_endpoint(url: str) -> str:
+    """https://swapi.dev/api/people/1/ -> people/1"""
+    return url.split("/api/", 1)[-1].strip("/")
+
+
+def parse_expand(resource: str, expand: Optional[str]) -> List[List[str]]:
+    """
+    Valida o parâmetro `expand` de um recurso
+
+    Aceita campos separados por vírgula e caminhos aninhados com ponto
+    (ex: "homeworld,films.characters"), até a profundidade máxima configurada.
+
+    Raises:
+        HTTPException: 400 para campos inexistentes ou caminhos profundos demais
+    """
+    if not expand:
+        return []
+
+    paths = []
+    for raw in expand.split(","):
+        path = [segment.strip() for segment in raw.split(".") if segment.strip()]
+        if not path:
+            continue
+        if len(path) > settings.expand_max_depth:
+            raise HTTPException(
+                status_code=400,
+                detail=f"'{raw.strip()}' excede a profundidade máxima de expansão "
+                f"({settings.expand_max_depth})",
+            )
+
+        current = resource
+        for field in path:
+            target = RELATION_FIELDS[current].get(field)
+            if target is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"'{field}' não é uma relação expansível de '{current}'",
+                )
+            current = target
+        paths.append(path)
+    return paths
+
+
+async def expand_relations(items: List[Dict[str, Any]], paths: List[List[str]]) -> None:
+    """
+    Substitui, nos itens, as URLs das relações pedidas pelos objetos referenciados
+
+    Cada nível é resolvido de uma vez: todas as URLs do nível, em todos os itens,
+    são deduplicadas e buscadas concorrentemente (passando pelo cache). Se uma
+    URL falhar, ela permanece no lugar do objeto.
+    """
+    if not paths or not items:
+        return
+
+    # Agrupa os caminhos por campo do primeiro nível: {"films": [["characters"]], ...}
+    children: Dict[str, List[List[str]]] = {}
+    for path in paths:
+        children.setdefault(path[0], [])
+        if len(path) > 1:
+            children[path[0]].append(path[1:])
+
+    urls = {
+        url
+        for item in items
+        for field in children
+        for url in _as_list(item.get(field))
+        if isinstance(url, str)
+    }
+    resolved = await _fetch_all(urls)
+
+    expanded: Dict[str, List[Dict[str, Any]]] = {field: [] for field in children}
+    for item in items:
+        for field in children:
+            value = item.get(field)
+            if isinstance(value, list):
+                item[field] = [_resolve(url, resolved) for url in value]
+                expanded[field].extend(v for v in item[field] if isinstance(v, dict))
+            elif isinstance(value, str):
+                item[field] = _resolve(value, resolved)
+                if isinstance(item[field], dict):
+                    expanded[field].append(item[field])
+
+    for field, subpaths in children.items():
+        if subpaths:
+            # Objetos repetidos são expandidos uma única vez
+            unique = list({id(obj): obj for obj in expanded[field]}.values())
+            await expand_relations(unique, subpaths)
+
+
+async def _fetch_all(urls) -> Dict[str, Optional[Dict[str, Any]]]:
+    semaphore = asyncio.Semaphore(settings.expand_concurrency)
+
+    async def fetch(url: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                return await swapi_client._make_request(url_to_endpoint(url))
+            except HTTPException:
+                return None
+
+    urls = list(urls)
+    results = await asyncio.gather(*(fetch(url) for url in urls))
+    return dict(zip(urls, results))
+
+
+def _resolve(url: Any, resolved: Dict[str, Optional[Dict[str, Any]]]) -> Any:
+    if not isinstance(url, str):
+        return url
+    return resolved.get(url) or url
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
@@ -0,0 +1,62 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+# Ordem de prioridade: o status "pior" observado na requisição é o reportado
+CACHE_STATUS_PRIORITY = {
+    "snapshot": 0,
+    "local": 1,
+    "fresh": 2,
+    "miss": 3,
+    "revalidating": 4,
+    "stale": 5,
+}
+
+
+@dataclass
+class RequestContext:
+    """Informações sobre as chamadas à SWAPI feitas durante uma requisição"""
+
+    cache_status: Optional[str] = None
+    # Instante (time.monotonic) até o qual as chamadas à SWAPI podem ser feitas
+    deadline: Optional[float] = None
+    upstream_retries: int = 0
+    retry_seconds: float = 0.0
+    # Entradas vencidas do cache são buscadas de novo em vez de servidas enquanto atualizam
+    revalidate: bool = False
+
+    def record_cache_status(self, status: str) -> None:
+        current = CACHE_STATUS_PRIORITY.get(self.cache_status, -1)
+        if CACHE_STATUS_PRIORITY[status] > current:
+            self.cache_status = status
+
+    def record_retry(self, waited: float) -> None:
+        self.upstream_retries += 1
+        self.retry_seconds += waited
+
+    def add_retries(self, other: "RequestContext") -> None:
+        """Soma as retentativas de uma chamada compartilhada que esta requisição aguardou"""
+        self.upstream_retries += other.upstream_retries
+        self.retry_seconds += other.retry_seconds
+
+
+_current: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def get_request_context() -> Optional[RequestContext]:
+    """Contexto da requisição HTTP em andamento, se houver"""
+    return _current.get()
+
+
+def set_request_context(context: RequestContext):
+    return _current.set(context)
+
+
+def reset_request_context(token) -> None:
+    _current.reset(token)
+
+
+def record_cache_status(status: str) -> None:
+    context = _current.get()
+    if context is not None:
+        context.record_cache_status(status)
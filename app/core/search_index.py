@@ -0,0 +1,305 @@
+import bisect
+import copy
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.core.dataset import dataset
+from app.core.snapshot import RESOURCES, SEARCH_FIELDS, BaseSnapshot, paginate, resource_id
+
+_TOKEN = re.compile(r"\w+")
+# Limite de termos de busca com candidatos memorizados por índice
+_MAX_CACHED_TERMS = 4096
+
+
+def fold(text: str) -> str:
+    """Normaliza o texto para busca: sem acentos e sem diferenciar maiúsculas"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(fold(text))
+
+
+def relevance(query: str, name: str) -> float:
+    """
+    Relevância de um resultado da busca pelo nome (ou título)
+
+    1.0 para o nome exato, 0.9 quando o nome começa com a consulta, 0.75
+    quando alguma palavra começa com ela, 0.6 quando ela aparece no meio do
+    nome e 0.4 quando o item casou por outro campo (ex: `model`).
+    """
+    needle = fold(query).strip()
+    text = fold(name)
+    if text == needle:
+        return 1.0
+    if text.startswith(needle):
+        return 0.9
+    if any(text.startswith(needle, match.start()) for match in _TOKEN.finditer(text)):
+        return 0.75
+    if needle in text:
+        return 0.6
+    return 0.4
+
+
+def trigrams(token: str) -> Set[str]:
+    """Trigramas de um token, com o mesmo preenchimento do pg_trgm ("  luke ")"""
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ResourceIndex:
+    """
+    Índice invertido dos campos de busca de um recurso
+
+    Cada token aponta para as posições (na ordem de ID) dos itens que o contêm.
+    A busca mantém a semântica da SWAPI (substring, inclusive no meio de uma
+    palavra): os tokens da consulta selecionam candidatos pelo vocabulário e
+    cada candidato é confirmado no texto normalizado.
+    """
+
+    def __init__(self, ids: List[int], texts: List[str]):
+        self.ids = ids
+        self.texts = [fold(text) for text in texts]
+        postings: Dict[str, set] = {}
+        for position, text in enumerate(self.texts):
+            for token in _TOKEN.findall(text):
+                postings.setdefault(token, set()).add(position)
+        self.postings: Dict[str, FrozenSet[int]] = {
+            token: frozenset(positions) for token, positions in postings.items()
+        }
+        self._candidates: Dict[str, FrozenSet[int]] = {}
+        # Índice de trigramas do vocabulário, construído no aquecimento (`SearchIndex.build`)
+        # ou, sem ele, na primeira busca aproximada
+        self._vocabulary: Optional[List[str]] = None
+        self._trigram_counts: List[int] = []
+        self._trigram_postings: Dict[str, List[int]] = {}
+
+    def build_trigrams(self) -> None:
+        if self._vocabulary is not None:
+            return
+        self._vocabulary = list(self.postings)
+        postings: Dict[str, List[int]] = {}
+        for token_id, token in enumerate(self._vocabulary):
+            grams = trigrams(token)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(token_id)
+        self._trigram_postings = postings
+
+    def _matching(self, term: str) -> FrozenSet[int]:
+        """Posições com algum token que contém `term`"""
+        cached = self._candidates.get(term)
+        if cached is not None:
+            return cached
+
+        positions = self.postings.get(term, frozenset())
+        for token, token_positions in self.postings.items():
+            if term in token and token != term:
+                positions = positions | token_positions
+
+        if len(self._candidates) >= _MAX_CACHED_TERMS:
+            self._candidates.clear()
+        self._candidates[term] = positions
+        return positions
+
+    def _positions(self, needle: str) -> List[int]:
+        terms = _TOKEN.findall(needle)
+        if not terms:
+            return [p for p, text in enumerate(self.texts) if needle in text]
+
+        candidates = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            positions = self._matching(term)
+            candidates = positions if candidates is None else candidates & positions
+            if not candidates:
+                return []
+        return [p for p in sorted(candidates) if needle in self.texts[p]]
+
+    def search(self, query: str) -> List[int]:
+        """IDs dos itens cujo texto de busca contém `query`, em ordem de ID"""
+        return [self.ids[p] for p in self._positions(fold(query))]
+
+    def _similar_tokens(self, term: str) -> Dict[int, float]:
+        """Similaridade (Jaccard de trigramas) de `term` com cada token do vocabulário"""
+        grams = trigrams(term)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._trigram_postings.get(gram, ()))
+        return {
+            token_id: count / (len(grams) + self._trigram_counts[token_id] - count)
+            for token_id, count in shared.items()
+        }
+
+    def fuzzy_search(self, query: str, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Busca aproximada por similaridade de trigramas
+
+        A nota de um item é a média, entre os termos da consulta, da melhor
+        similaridade do termo com os tokens do item; itens que contêm a consulta
+        (a busca exata) recebem nota 1. Retorna (ID, nota) da maior para a menor
+        nota, desempatando pelo ID.
+        """
+        self.build_trigrams()
+
+        needle = fold(query)
+        terms = _TOKEN.findall(needle)
+        scores: Dict[int, float] = {}
+        for term in terms:
+            best: Dict[int, float] = {}
+            for token_id, similarity in self._similar_tokens(term).items():
+                for position in self.postings[self._vocabulary[token_id]]:
+                    if similarity > best.get(position, 0.0):
+                        best[position] = similarity
+            for position, similarity in best.items():
+                scores[position] = scores.get(position, 0.0) + similarity / len(terms)
+
+        for position in self._positions(needle):
+            scores[position] = 1.0
+
+        ranked = sorted(
+            (item for item in scores.items() if item[1] >= threshold),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return [(self.ids[position], score) for position, score in ranked]
+
+
+class PrefixIndex:
+    """
+    Índice de prefixos dos nomes (ou títulos) de todos os recursos
+
+    Dois arrays ordenados: os nomes completos normalizados e os sufixos que
+    começam em cada palavra do nome. Uma consulta é uma busca binária seguida
+    da leitura sequencial de no máximo `limit` entradas por array.
+    """
+
+    def __init__(self, entries: List[Tuple[str, int, str]]):
+        # entries: (recurso, ID, nome de exibição)
+        self.entries = entries
+        names, words = [], []
+        for entry_id, (_, _, name) in enumerate(entries):
+            folded = fold(name)
+            names.append((folded, entry_id))
+            for match in _TOKEN.finditer(folded):
+                if match.start() > 0:
+                    words.append((folded[match.start() :], entry_id))
+        names.sort()
+        words.sort()
+        self._name_keys = [key for key, _ in names]
+        self._name_ids = [entry_id for _, entry_id in names]
+        self._word_keys = [key for key, _ in words]
+        self._word_ids = [entry_id for _, entry_id in words]
+
+    @staticmethod
+    def _scan(keys: List[str], ids: List[int], prefix: str, limit: int, found: Dict[int, None]):
+        position = bisect.bisect_left(keys, prefix)
+        while position < len(keys) and len(found) < limit and keys[position].startswith(prefix):
+            found.setdefault(ids[position])
+            position += 1
+
+    def complete(self, query: str, limit: int) -> List[Tuple[str, int, str]]:
+        """
+        Até `limit` itens cujo nome (ou alguma palavra do nome) começa com `query`
+
+        Nomes que começam com a consulta vêm antes; dentro de cada grupo, em
+        ordem alfabética.
+        """
+        prefix = fold(query).lstrip()
+        if not prefix:
+            return []
+        found: Dict[int, None] = {}
+        self._scan(self._name_keys, self._name_ids, prefix, limit, found)
+        self._scan(self._word_keys, self._word_ids, prefix, limit, found)
+        return [self.entries[entry_id] for entry_id in found]
+
+
+def _build_prefixes(store: BaseSnapshot) -> PrefixIndex:
+    entries = []
+    for resource in RESOURCES:
+        field = SEARCH_FIELDS[resource][0]
+        for item in store.items(resource):
+            entries.append((resource, resource_id(item["url"]), item.get(field) or ""))
+    return PrefixIndex(entries)
+
+
+class SearchIndex:
+    """
+    Índices de busca de todos os recursos do dataset local
+
+    Os índices são estruturas derivadas do `dataset`: refeitos sob demanda
+    quando ele muda (nova versão ou outro snapshot).
+    """
+
+    def index(self, resource: str) -> Optional[ResourceIndex]:
+        return dataset.derived(
+            f"search:{resource}",
+            lambda store: ResourceIndex(store.ids(resource), store.search_texts(resource)),
+        )
+
+    def matching_ids(
+        self, resource: str, query: Optional[str] = None, fuzzy: bool = False
+    ) -> List[int]:
+        """
+        IDs do recurso que casam com a busca, na ordem de listagem
+
+        Sem busca, todos os IDs em ordem; com `fuzzy`, da maior para a menor
+        similaridade. O dataset local precisa estar disponível.
+        """
+        index = self.index(resource)
+        if not query:
+            return list(index.ids)
+        if fuzzy:
+            return [item_id for item_id, _ in index.fuzzy_search(query, settings.fuzzy_threshold)]
+        return index.search(query)
+
+    def load_items(self, resource: str, ids: List[int]) -> List[Dict[str, Any]]:
+        """Cópias dos itens do dataset local (quem chama pode modificá-las)"""
+        store = dataset.store
+        dataset.record_source()
+        return [copy.deepcopy(store.get(resource, item_id)) for item_id in ids]
+
+    def search(self, resource: str, query: str, page: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        Responde a `search` de um recurso a partir do dataset local
+
+        Retorna None quando o dataset não está disponível, para que a busca
+        siga para a SWAPI. O formato é o mesmo da paginação da SWAPI.
+
+        Raises:
+            HTTPException: 404 para páginas inexistentes
+        """
+        if self.index(resource) is None:
+            return None
+
+        data = paginate(resource, self.matching_ids(resource, query), page, query)
+        data["results"] = self.load_items(resource, data["results"])
+        return data
+
+    def prefixes(self) -> Optional[PrefixIndex]:
+        return dataset.derived("prefixes", _build_prefixes)
+
+    async def autocomplete(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Completa `query` com nomes de todos os recursos do dataset local
+
+        Sem snapshot ou aquecimento, as coleções são baixadas uma única vez.
+        """
+        await dataset.ensure_loaded()
+        completions = self.prefixes().complete(query, limit)
+        dataset.record_source()
+        return [
+            {"resource": resource, "id": item_id, "name": name}
+            for resource, item_id, name in completions
+        ]
+
+    def build(self) -> None:
+        """Constrói os índices de todos os recursos de uma vez, inclusive os de trigramas"""
+        for resource in RESOURCES:
+            self.index(resource).build_trigrams()
+        self.prefixes()
+
+
+search_index = SearchIndex()
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes idênticas em uma única execução
+
+    Enquanto uma chamada para uma chave está em andamento, novos chamadores
+    com a mesma chave aguardam o mesmo future e recebem o mesmo resultado
+    (ou a mesma exceção).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def is_inflight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        # shield: o cancelamento de um chamador não cancela a chamada compartilhada
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        # Marca a exceção como consumida mesmo que todos os chamadores tenham desistido
+        if not task.cancelled():
+            task.exception()
+
+    def reset_stats(self) -> None:
+        self.calls = self.coalesced = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
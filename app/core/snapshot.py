@@ -0,0 +1,322 @@
+"""
+Snapshot local do dataset da SWAPI
+
+Uso:
+    python -m app.core.snapshot crawl --output data/swapi-snapshot.json
+    python -m app.core.snapshot crawl --output data/swapi-snapshot.swsnap
+    python -m app.core.snapshot convert data/swapi-snapshot.json data/swapi-snapshot.swsnap
+
+Com SWAPI_SNAPSHOT_PATH apontando para o arquivo gerado, o SWAPIClient responde
+todas as requisições a partir do snapshot, sem nenhuma chamada de rede.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import math
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from fastapi import HTTPException
+
+SWAPI_BASE_URL = "https://swapi.dev/api"
+RESOURCES = ("people", "planets", "films", "starships", "vehicles", "species")
+PAGE_SIZE = 10
+SNAPSHOT_VERSION = 1
+BINARY_SUFFIX = ".swsnap"
+
+# Campos em que a SWAPI aplica o parâmetro `search`
+SEARCH_FIELDS = {
+    "people": ("name",),
+    "planets": ("name",),
+    "films": ("title",),
+    "starships": ("name", "model"),
+    "vehicles": ("name", "model"),
+    "species": ("name",),
+}
+
+
+def resource_id(url: str) -> int:
+    """Extrai o ID de uma URL da SWAPI (ex: https://swapi.dev/api/people/1/ -> 1)"""
+    return int(url.rstrip("/").split("/")[-1])
+
+
+def parse_endpoint(endpoint: str) -> Tuple[str, Optional[int]]:
+    """Separa 'people/1' em ('people', 1) e 'people' em ('people', None)"""
+    parts = endpoint.strip("/").split("/")
+    if len(parts) == 1:
+        return parts[0], None
+    if len(parts) == 2 and parts[1].isdigit():
+        return parts[0], int(parts[1])
+    raise ValueError(endpoint)
+
+
+def search_text(resource: str, item: Dict[str, Any]) -> str:
+    """Texto em que a SWAPI aplica o parâmetro `search`, já em minúsculas"""
+    return "\x1f".join(str(item.get(field) or "") for field in SEARCH_FIELDS[resource]).lower()
+
+
+def matches_search(resource: str, item: Dict[str, Any], search: str) -> bool:
+    """Replica o filtro `search` da SWAPI: substring sem diferenciar maiúsculas"""
+    return search.lower() in search_text(resource, item)
+
+
+def page_url(resource: str, page: int, search: Optional[str] = None) -> str:
+    params = {"search": search, "page": page} if search else {"page": page}
+    return f"{SWAPI_BASE_URL}/{resource}/?{urlencode(params)}"
+
+
+def paginate(
+    resource: str, items: List[Any], page: int, search: Optional[str] = None
+) -> Dict[str, Any]:
+    """Monta uma página no mesmo formato da SWAPI"""
+    pages = max(1, math.ceil(len(items) / PAGE_SIZE))
+    if page < 1 or page > pages:
+        raise HTTPException(status_code=404, detail=f"Recurso não encontrado na SWAPI: {resource}")
+
+    start = (page - 1) * PAGE_SIZE
+    return {
+        "count": len(items),
+        "next": page_url(resource, page + 1, search) if page < pages else None,
+        "previous": page_url(resource, page - 1, search) if page > 1 else None,
+        "results": items[start : start + PAGE_SIZE],
+    }
+
+
+class BaseSnapshot(ABC):
+    """
+    Dataset completo da SWAPI respondendo como a própria SWAPI
+
+    As implementações só precisam fornecer os IDs de cada recurso (em ordem),
+    o texto de busca de cada item e o item decodificado por ID.
+    """
+
+    created: Optional[str] = None
+
+    @abstractmethod
+    def ids(self, resource: str) -> List[int]:
+        """IDs dos itens do recurso, em ordem crescente"""
+
+    @abstractmethod
+    def search_texts(self, resource: str) -> List[str]:
+        """Texto de busca de cada item, na mesma ordem de `ids`"""
+
+    @abstractmethod
+    def get(self, resource: str, item_id: int) -> Optional[Dict[str, Any]]:
+        """Item decodificado, ou None se o ID não existir"""
+
+    def items(self, resource: str) -> List[Dict[str, Any]]:
+        return [self.get(resource, item_id) for item_id in self.ids(resource)]
+
+    def counts(self) -> Dict[str, int]:
+        return {resource: len(self.ids(resource)) for resource in RESOURCES}
+
+    def resolve(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Responde a uma requisição da SWAPI a partir do snapshot
+
+        Só os itens da página pedida são decodificados.
+
+        Raises:
+            HTTPException: 404 para recursos, IDs ou páginas inexistentes
+        """
+        try:
+            resource, item_id = parse_endpoint(endpoint)
+        except ValueError:
+            resource, item_id = "", None
+        if resource not in RESOURCES:
+            raise HTTPException(
+                status_code=404, detail=f"Recurso não encontrado na SWAPI: {endpoint}"
+            )
+
+        params = params or {}
+        if item_id is not None:
+            item = self.get(resource, item_id)
+            if item is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Recurso não encontrado na SWAPI: {endpoint}"
+                )
+            return copy.deepcopy(item)
+
+        search = params.get("search")
+        ids = self.ids(resource)
+        if search:
+            needle = str(search).lower()
+            texts = self.search_texts(resource)
+            ids = [item_id for item_id, text in zip(ids, texts) if needle in text]
+
+        try:
+            page = int(params.get("page", 1))
+        except ValueError:
+            page = 0
+        data = paginate(resource, ids, page, search)
+        data["results"] = [copy.deepcopy(self.get(resource, i)) for i in data["results"]]
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "created": self.created,
+            "resources": {resource: self.items(resource) for resource in RESOURCES},
+        }
+
+
+class SnapshotStore(BaseSnapshot):
+    """Snapshot totalmente decodificado em memória"""
+
+    def __init__(self, resources: Dict[str, List[Dict[str, Any]]], created: Optional[str] = None):
+        self.created = created
+        self._ids: Dict[str, List[int]] = {}
+        self._texts: Dict[str, List[str]] = {}
+        self._by_id: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for resource in RESOURCES:
+            items = sorted(resources.get(resource, []), key=lambda i: resource_id(i["url"]))
+            self._ids[resource] = [resource_id(item["url"]) for item in items]
+            self._texts[resource] = [search_text(resource, item) for item in items]
+            self._by_id[resource] = {resource_id(item["url"]): item for item in items}
+
+    def ids(self, resource: str) -> List[int]:
+        return self._ids[resource]
+
+    def search_texts(self, resource: str) -> List[str]:
+        return self._texts[resource]
+
+    def get(self, resource: str, item_id: int) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(resource, {}).get(item_id)
+
+
+def load_snapshot(path: str) -> BaseSnapshot:
+    """
+    Carrega um snapshot salvo por `save_snapshot`
+
+    Snapshots binários são mapeados em memória; snapshots JSON são
+    decodificados por completo.
+    """
+    from app.core.binary_snapshot import BinarySnapshot, is_binary_snapshot
+
+    if is_binary_snapshot(path):
+        return BinarySnapshot(path)
+
+    with open(path, "rb") as f:
+        data = json.load(f)
+    return SnapshotStore(data["resources"], created=data.get("created"))
+
+
+def save_snapshot(store: BaseSnapshot, path: str, binary: Optional[bool] = None) -> None:
+    """Grava o snapshot em JSON ou no formato binário (padrão para arquivos .swsnap)"""
+    from app.core.binary_snapshot import save_binary_snapshot
+
+    if binary is None:
+        binary = path.endswith(BINARY_SUFFIX)
+    if binary:
+        save_binary_snapshot(store, path)
+        return
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(store.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+
+
+async def crawl(
+    client,
+    resources: Iterable[str] = RESOURCES,
+    concurrency: int = 4,
+    on_page: Optional[Callable[[str, int, int], None]] = None,
+    revalidate: bool = False,
+) -> SnapshotStore:
+    """
+    Baixa todas as páginas de cada recurso da SWAPI
+
+    No máximo `concurrency` páginas são buscadas ao mesmo tempo. `on_page` é
+    chamado a cada página baixada com (recurso, páginas baixadas, total de páginas).
+    Com `revalidate`, páginas vencidas no cache do cliente são buscadas de novo.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def crawl_resource(resource: str) -> List[Dict[str, Any]]:
+        def progress(done: int, pages: int) -> None:
+            if on_page:
+                on_page(resource, done, pages)
+
+        return await client.fetch_all(
+            resource, on_page=progress, semaphore=semaphore, revalidate=revalidate
+        )
+
+    resources = list(resources)
+    results = await asyncio.gather(*(crawl_resource(resource) for resource in resources))
+    return SnapshotStore(
+        dict(zip(resources, results)), created=datetime.now(timezone.utc).isoformat()
+    )
+
+
+async def _crawl_command(output: str) -> None:
+    from app.core.swapi_client import SWAPIClient
+
+    client = SWAPIClient()
+    client.snapshot_path = None
+    try:
+        store = await crawl(client)
+    finally:
+        await client.close()
+
+    save_snapshot(store, output)
+    total = sum(store.counts().values())
+    print(f"✅ Snapshot salvo em {output} ({total} itens: {store.counts()})")
+
+
+def _export_command(path: str, output_dir: str, formats: List[str]) -> None:
+    from app.core.dataset import dataset
+    from app.core.tabular import parse_format, render
+
+    for output_format in formats:
+        parse_format(output_format)
+    dataset.install(load_snapshot(path))
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    for resource in RESOURCES:
+        for output_format in formats:
+            target = directory / f"{resource}.{output_format}"
+            target.write_bytes(render(resource, output_format))
+    print(f"✅ {len(RESOURCES) * len(formats)} arquivos exportados em {output_dir}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Snapshot local do dataset da SWAPI")
+    commands = parser.add_subparsers(dest="command", required=True)
+    crawl_parser = commands.add_parser("crawl", help="Baixa todos os recursos da SWAPI")
+    crawl_parser.add_argument(
+        "--output",
+        default="data/swapi-snapshot.json",
+        help=f"Arquivo de saída; a extensão {BINARY_SUFFIX} grava no formato binário",
+    )
+    convert_parser = commands.add_parser("convert", help="Converte um snapshot entre formatos")
+    convert_parser.add_argument("input")
+    convert_parser.add_argument("output")
+    export_parser = commands.add_parser(
+        "export", help="Exporta cada recurso do snapshot em CSV, Arrow ou Parquet"
+    )
+    export_parser.add_argument("input")
+    export_parser.add_argument("output_dir")
+    export_parser.add_argument(
+        "--format", default="csv", help="Formatos separados por vírgula: csv, arrow, parquet"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "crawl":
+        asyncio.run(_crawl_command(args.output))
+    elif args.command == "convert":
+        save_snapshot(load_snapshot(args.input), args.output)
+        print(f"✅ Snapshot convertido: {args.input} -> {args.output}")
+    elif args.command == "export":
+        try:
+            _export_command(args.input, args.output_dir, args.format.split(","))
+        except HTTPException as e:
+            parser.error(e.detail)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,68 @@
-from typing import Any, Dict, Optional
+import asyncio
+import importlib.util
+import json
+import logging
+import math
+import random
+import statistics
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
 
 import httpx
 from fastapi import HTTPException
 
+from app.config import settings
+from app.core.cache import FRESH, STALE, ResponseCache, make_cache_key
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.limiter import LimiterRejectedError, UpstreamLimiter
+from app.core.pool_metrics import PoolMonitor
+from app.core.request_context import (
+    RequestContext,
+    get_request_context,
+    record_cache_status,
+    reset_request_context,
+    set_request_context,
+)
+from app.core.singleflight import SingleFlight
+from app.core.snapshot import BaseSnapshot, load_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+def _is_upstream_failure(status_code: int) -> bool:
+    """Erros que indicam indisponibilidade da SWAPI (e não um recurso inexistente)"""
+    return status_code >= 500 or status_code == 429
+
+
+class CircuitOpenError(HTTPException):
+    """Chamada recusada porque o circuit breaker da SWAPI está aberto"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=503,
+            detail="SWAPI indisponível no momento (circuit breaker aberto)",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class UpstreamBusyError(HTTPException):
+    """Chamada recusada pelo limitador de concorrência/taxa para a SWAPI"""
+
+    def __init__(self):
+        super().__init__(
+            status_code=503,
+            detail="Muitas requisições simultâneas para a SWAPI, tente novamente",
+            headers={"Retry-After": "1"},
+        )
+
+
+class DeadlineExceededError(HTTPException):
+    """O prazo da requisição acabou antes de uma resposta da SWAPI"""
+
+    def __init__(self):
+        super().__init__(status_code=504, detail="Prazo esgotado aguardando a SWAPI")
+
 
 class SWAPIClient:
     """Cliente HTTP para interagir com a API do Star Wars (SWAPI)"""
@@ -10,11 +70,122 @@ class SWAPIClient:
     BASE_URL = "https://swapi.dev/api"
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=10.0, headers={"User-Agent": "StarWars-API/1.0"})
+        self._client: Optional[httpx.AsyncClient] = None
+        self.snapshot_path: Optional[str] = settings.snapshot_path
+        self.snapshot: Optional[BaseSnapshot] = None
+        self.pool = PoolMonitor(max_connections=settings.http_max_connections)
+        self.cache = ResponseCache(
+            ttl=settings.cache_ttl,
+            max_entries=settings.cache_max_entries,
+            max_bytes=settings.cache_max_bytes,
+            stale_while_revalidate=settings.cache_stale_while_revalidate,
+            stale_if_error=settings.cache_stale_if_error,
+        )
+        self.singleflight = SingleFlight()
+        self.breaker = CircuitBreaker(
+            failure_rate_threshold=settings.breaker_failure_rate,
+            minimum_calls=settings.breaker_minimum_calls,
+            window_seconds=settings.breaker_window_seconds,
+            open_seconds=settings.breaker_open_seconds,
+            half_open_max_calls=settings.breaker_half_open_calls,
+        )
+        self.limiter = UpstreamLimiter(
+            max_concurrency=settings.upstream_max_concurrency,
+            rate=settings.upstream_rate_limit,
+            burst=settings.upstream_rate_burst,
+            max_wait=settings.upstream_max_wait,
+            max_queue=settings.upstream_max_queue,
+        )
+        self.upstream_requests = 0
+        self.retries = 0
+        self.retry_seconds = 0.0
+        self.deadline_exceeded = 0
+        self.revalidations = 0
+        self.stale_if_error_served = 0
+        self._upstream_latencies: deque = deque(maxlen=1000)
+        self._background: set = set()
+        # Retentativas de cada chamada compartilhada em andamento, por chave do cache
+        self._flights: Dict[str, RequestContext] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Cliente HTTP compartilhado
+
+        Normalmente criado no lifespan da aplicação; fora dele (scripts, testes)
+        é criado sob demanda no primeiro uso.
+        """
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    def _build_client(self) -> httpx.AsyncClient:
+        http2 = settings.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "SWAPI_HTTP2 ativo, mas o pacote 'h2' não está instalado; usando HTTP/1.1"
+            )
+            http2 = False
+
+        return httpx.AsyncClient(
+            headers={"User-Agent": "StarWars-API/1.0"},
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.timeout_connect,
+                read=settings.timeout_read,
+                write=settings.timeout_write,
+                pool=settings.timeout_pool,
+            ),
+        )
+
+    async def start(self):
+        """Cria o cliente HTTP com as configurações de pool e timeouts"""
+        if self._client is None:
+            self._client = self._build_client()
+        self._get_snapshot()
+
+    def _get_snapshot(self) -> Optional[BaseSnapshot]:
+        """Snapshot local configurado em SWAPI_SNAPSHOT_PATH, carregado no primeiro uso"""
+        if self.snapshot is None and self.snapshot_path:
+            self.snapshot = load_snapshot(self.snapshot_path)
+            logger.info("Modo offline: respondendo a partir de %s", self.snapshot_path)
+        return self.snapshot
 
     async def close(self):
         """Fecha o cliente HTTP"""
-        await self.client.aclose()
+        for task in list(self._background):
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Métricas do cliente: cache, circuit breaker, pool de conexões e chamadas à SWAPI"""
+        latencies = list(self._upstream_latencies)
+        return {
+            "snapshot": self.snapshot.counts() if self.snapshot is not None else None,
+            "cache": self.cache.stats(),
+            "singleflight": self.singleflight.stats(),
+            "circuit_breaker": self.breaker.stats(),
+            "pool": self.pool.stats(),
+            "limiter": self.limiter.stats(),
+            "revalidations": self.revalidations,
+            "stale_if_error_served": self.stale_if_error_served,
+            "upstream": {
+                "requests": self.upstream_requests,
+                "retries": self.retries,
+                "retry_seconds": round(self.retry_seconds, 3),
+                "deadline_exceeded": self.deadline_exceeded,
+                "latency_p50_ms": (
+                    round(statistics.median(latencies) * 1000, 2) if latencies else None
+                ),
+            },
+        }
 
     async def _make_request(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
@@ -22,6 +193,13 @@ class SWAPIClient:
         """
         Faz uma requisição genérica à SWAPI
 
+        Respostas bem-sucedidas ficam em cache por endpoint e parâmetros, e
+        requisições idênticas simultâneas compartilham uma única chamada à SWAPI.
+        Respostas vencidas são servidas imediatamente enquanto são atualizadas
+        em segundo plano (ou buscadas na hora, com `revalidate` no contexto da
+        requisição), e também quando a SWAPI falha (stale-if-error).
+        No modo offline, tudo é respondido a partir do snapshot local.
+
         Args:
             endpoint: Endpoint da API (ex: 'people', 'planets')
             params: Parâmetros de query
@@ -32,11 +210,310 @@ class SWAPIClient:
         Raises:
             HTTPException: Se houver erro na requisição
         """
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            record_cache_status("snapshot")
+            return snapshot.resolve(endpoint, params)
+
+        key = make_cache_key(endpoint, params)
+
+        entry = self.cache.lookup(key)
+        state = entry.state(time.monotonic()) if entry is not None else None
+        context = get_request_context()
+        if state == STALE and context is not None and context.revalidate:
+            # Busca agora; a entrada vencida ainda serve se a SWAPI falhar
+            state = None
+
+        if state == FRESH:
+            record_cache_status("fresh")
+            content = entry.value
+        elif state == STALE:
+            record_cache_status("revalidating")
+            self._revalidate(key, endpoint, params)
+            content = entry.value
+        else:
+            try:
+                content = await self._shared_fetch(key, endpoint, params)
+                record_cache_status("miss")
+            except HTTPException as e:
+                if entry is None or not _is_upstream_failure(e.status_code):
+                    raise
+                self.stale_if_error_served += 1
+                record_cache_status("stale")
+                content = entry.value
+
+        # Cada chamador recebe sua própria cópia dos dados
+        return json.loads(content)
+
+    def prime(self, url: str, data: Dict[str, Any]) -> None:
+        """Coloca no cache um item já conhecido (ex: vindo de uma página da listagem)"""
+        endpoint = url.replace(self.BASE_URL, "", 1).strip("/")
+        self.cache.set(make_cache_key(endpoint), json.dumps(data).encode())
+
+    async def _fetch_page(
+        self, resource: str, page: int, search: Optional[str] = None, revalidate: bool = False
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"page": page}
+        if search:
+            params["search"] = search
+        # Cada página tem o próprio prazo: uma coleção inteira não cabe no de uma requisição
+        token = set_request_context(RequestContext(revalidate=revalidate))
+        try:
+            return await self._make_request(resource, params)
+        finally:
+            reset_request_context(token)
+
+    @staticmethod
+    def _page_count(first: Dict[str, Any]) -> int:
+        per_page = len(first["results"])
+        return math.ceil(first["count"] / per_page) if per_page else 1
+
+    async def fetch_all(
+        self,
+        resource: str,
+        search: Optional[str] = None,
+        concurrency: int = 4,
+        on_page: Optional[Callable[[int, int], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        revalidate: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Todos os itens de um recurso (ou de uma busca), na ordem da SWAPI
+
+        A primeira página informa `count`; as demais são buscadas
+        concorrentemente, no máximo `concurrency` ao mesmo tempo (ou o limite
+        de `semaphore`, para dividir o limite entre várias chamadas), e
+        montadas na ordem. `on_page` recebe (páginas baixadas, total) a cada página.
+        Com `revalidate`, páginas vencidas no cache são buscadas de novo na SWAPI.
+        """
+        semaphore = semaphore or asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_page(resource, page, search, revalidate)
+
+        first = await fetch(1)
+        pages = self._page_count(first)
+        done = 1
+        if on_page:
+            on_page(done, pages)
+
+        async def fetch_rest(page: int) -> Dict[str, Any]:
+            nonlocal done
+            data = await fetch(page)
+            done += 1
+            if on_page:
+                on_page(done, pages)
+            return data
+
+        rest = await asyncio.gather(*(fetch_rest(page) for page in range(2, pages + 1)))
+        return first["results"] + [item for data in rest for item in data["results"]]
+
+    async def iter_pages(
+        self,
+        resource: str,
+        first: Dict[str, Any],
+        search: Optional[str] = None,
+        window: int = 4,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Itens de cada página de um recurso, página a página e em ordem
+
+        Versão em streaming de `fetch_all`: `first` é a primeira página já
+        buscada e no máximo `window` páginas estão em andamento ou aguardando
+        o consumidor. Uma nova página só é pedida quando a mais antiga é
+        consumida, então um consumidor lento segura as buscas.
+        """
+        yield first["results"]
+
+        pages = self._page_count(first)
+        pending: Deque[asyncio.Task] = deque()
+        next_page = 2
+        try:
+            while next_page <= pages or pending:
+                while next_page <= pages and len(pending) < window:
+                    pending.append(
+                        asyncio.create_task(self._fetch_page(resource, next_page, search))
+                    )
+                    next_page += 1
+                yield (await pending.popleft())["results"]
+        finally:
+            # Consumidor desconectado ou falha: nada continua rodando em segundo plano
+            for task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()
+                task.cancel()
+
+    def _revalidate(self, key: str, endpoint: str, params: Optional[Dict[str, Any]]) -> None:
+        """Atualiza uma entrada vencida em segundo plano"""
+        if self.singleflight.is_inflight(key):
+            return
+
+        async def refresh():
+            # A atualização tem seu próprio prazo, independente da requisição que a disparou
+            set_request_context(RequestContext())
+            try:
+                await self._shared_fetch(key, endpoint, params)
+            except HTTPException:
+                # A entrada antiga continua disponível até o fim da janela
+                pass
+
+        self.revalidations += 1
+        task = asyncio.create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _shared_fetch(
+        self, key: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Busca compartilhada (singleflight) de uma chave
+
+        As retentativas ficam registradas na chamada compartilhada e são somadas
+        ao contexto de cada chamador que a aguardou, não só ao do primeiro.
+        """
+        flight = self._flights.get(key)
+        if flight is None or not self.singleflight.is_inflight(key):
+            # Primeiro chamador: registrado antes de a chamada começar a rodar
+            flight = self._flights[key] = RequestContext()
+        try:
+            return await self.singleflight.do(
+                key, lambda: self._fetch_and_store(key, endpoint, params, flight)
+            )
+        finally:
+            context = get_request_context()
+            if context is not None:
+                context.add_retries(flight)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        flight: Optional[RequestContext] = None,
+    ) -> bytes:
+        if flight is not None:
+            # Roda na task do singleflight: o contexto trocado aqui não vaza para o chamador
+            leader = get_request_context()
+            flight.deadline = leader.deadline if leader is not None else None
+            set_request_context(flight)
+        try:
+            content = await self._fetch(endpoint, params)
+        finally:
+            self._flights.pop(key, None)
+        self.cache.set(key, content)
+        return content
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Busca o corpo bruto da resposta na SWAPI
+
+        Falhas transitórias são retentadas com backoff exponencial e jitter,
+        respeitando o prazo da requisição em andamento. Todas as chamadas são
+        GETs, portanto idempotentes.
+        """
+        context = get_request_context()
+        if context is None:
+            context = RequestContext()
+        if context.deadline is None:
+            context.deadline = time.monotonic() + settings.request_deadline
+
+        attempt = 0
+        while True:
+            remaining = context.deadline - time.monotonic()
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                raise DeadlineExceededError()
+
+            try:
+                return await self._attempt(endpoint, params, context.deadline)
+            except (CircuitOpenError, UpstreamBusyError, DeadlineExceededError):
+                raise
+            except HTTPException as e:
+                if (
+                    not _is_upstream_failure(e.status_code)
+                    or attempt >= settings.retry_max_attempts
+                ):
+                    raise
+
+                delay = random.uniform(
+                    0, min(settings.retry_max_delay, settings.retry_base_delay * 2**attempt)
+                )
+                if time.monotonic() + delay >= context.deadline:
+                    # Não há tempo para outra tentativa dentro do prazo
+                    raise
+
+                await asyncio.sleep(delay)
+                attempt += 1
+                self.retries += 1
+                self.retry_seconds += delay
+                context.record_retry(delay)
+
+    def _attempt_timeout(self, remaining: float) -> httpx.Timeout:
+        """Limita os timeouts do cliente ao tempo restante do prazo"""
+        timeout = self.client.timeout
+
+        def cap(value: Optional[float]) -> float:
+            return remaining if value is None else min(value, remaining)
+
+        return httpx.Timeout(
+            connect=cap(timeout.connect),
+            read=cap(timeout.read),
+            write=cap(timeout.write),
+            pool=cap(timeout.pool),
+        )
+
+    async def _attempt(
+        self, endpoint: str, params: Optional[Dict[str, Any]], deadline: float
+    ) -> bytes:
+        """Faz uma única chamada à SWAPI, passando pelo circuit breaker e pelo limitador"""
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(self.breaker.retry_after())
+
         try:
             url = f"{self.BASE_URL}/{endpoint}/"
-            response = await self.client.get(url, params=params or {})
+            async with self.limiter.slot(max_wait=deadline - time.monotonic()):
+                # A espera pela vaga pode ter consumido o resto do prazo
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.deadline_exceeded += 1
+                    raise DeadlineExceededError()
+                timeout = self._attempt_timeout(remaining)
+                started = time.monotonic()
+                self.upstream_requests += 1
+                trace = self.pool.request_started()
+                try:
+                    response = await self.client.get(
+                        url, params=params or {}, timeout=timeout, extensions={"trace": trace}
+                    )
+                finally:
+                    self.pool.request_finished()
+                self._upstream_latencies.append(time.monotonic() - started)
+
+        except LimiterRejectedError:
+            self.breaker.release()
+            raise UpstreamBusyError()
+
+        except httpx.TimeoutException:
+            self.breaker.record_failure()
+            raise HTTPException(status_code=504, detail="Timeout ao conectar com SWAPI")
+
+        except httpx.RequestError as e:
+            self.breaker.record_failure()
+            raise HTTPException(status_code=503, detail=f"Erro ao conectar com SWAPI: {str(e)}")
+
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        if _is_upstream_failure(response.status_code):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        try:
             response.raise_for_status()
-            return response.json()
+            return response.content
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -48,11 +525,5 @@ class SWAPIClient:
                 status_code=e.response.status_code, detail=f"Erro na SWAPI: {str(e)}"
             )
 
-        except httpx.TimeoutException:
-            raise HTTPException(status_code=504, detail="Timeout ao conectar com SWAPI")
-
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=503, detail=f"Erro ao conectar com SWAPI: {str(e)}")
-
 
 swapi_client = SWAPIClient()
@@ -0,0 +1,178 @@
+"""
+Exportação tabular das coleções (CSV, Arrow IPC e Parquet)
+
+As colunas vêm das colunas tipadas do dataset: campos numéricos já
+convertidos (nulos para valores desconhecidos), campos categóricos com
+codificação por dicionário e relações como listas de IDs inteiros (ou um
+único ID, para relações como `homeworld`). Cada arquivo é gerado uma vez
+por versão do dataset e fica em memória como artefato pronto.
+
+Arrow e Parquet dependem do pyarrow, instalado com o extra `arrow`.
+"""
+
+import csv
+import hashlib
+import io
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.core.columns import ResourceColumns, columns
+from app.core.dataset import dataset
+
+# formato -> (media type, extensão)
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "arrow": ("application/vnd.apache.arrow.file", "arrow"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+ARROW_FORMATS = ("arrow", "parquet")
+# Separador dos IDs de uma relação no CSV (o mesmo do operador `in` dos filtros)
+LIST_SEPARATOR = "|"
+
+# (nome, tipo, dados): tipo é id, number, category, relation, relations ou text
+Column = Tuple[str, str, Any]
+
+
+def _pyarrow():
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise HTTPException(
+            status_code=501,
+            detail="Exportação Arrow/Parquet requer o pyarrow: instale o extra 'arrow' "
+            "(pip install 'py-sw[arrow]')",
+        ) from e
+    return pyarrow
+
+
+def parse_format(value: str) -> str:
+    """
+    Raises:
+        HTTPException: 400 para formatos desconhecidos
+    """
+    if value not in FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato '{value}' inválido. Formatos: ndjson, {', '.join(FORMATS)}",
+        )
+    return value
+
+
+def table_columns(table: ResourceColumns, items: List[Dict[str, Any]]) -> List[Column]:
+    """Colunas de um recurso na ordem dos campos da SWAPI, com `id` primeiro"""
+    result: List[Column] = [("id", "id", table.ids)]
+    for field in items[0] if items else []:
+        if field in table.numeric:
+            result.append((field, "number", table.numeric[field]))
+        elif field in table.categorical:
+            result.append((field, "category", table.categorical[field]))
+        elif field in table.relations:
+            relation = table.relations[field]
+            # Relações com um único destino (homeworld) viram um ID, não uma lista
+            kind = "relations" if isinstance(items[0].get(field), list) else "relation"
+            result.append((field, kind, relation))
+        else:
+            result.append((field, "text", [item.get(field) for item in items]))
+    return result
+
+
+def _single_ids(relation) -> Tuple[np.ndarray, np.ndarray]:
+    """(ID, ausente) de uma relação com no máximo um destino por linha"""
+    missing = relation.lengths == 0
+    values = np.zeros(len(relation.lengths), dtype=np.int64)
+    values[~missing] = relation.targets[relation.offsets[:-1][~missing]]
+    return values, missing
+
+
+def _csv_values(kind: str, data: Any) -> List[str]:
+    if kind == "id":
+        return data.astype(str).tolist()
+    if kind == "number":
+        # Inteiros sem ".0" e desconhecidos vazios
+        integral = np.isfinite(data) & (data == np.round(data))
+        text = np.where(integral, np.char.mod("%d", np.nan_to_num(data)), data.astype(str))
+        return np.where(np.isnan(data), "", text).tolist()
+    if kind == "category":
+        return np.asarray(data.categories, dtype=object)[data.codes].tolist()
+    if kind == "relation":
+        values, missing = _single_ids(data)
+        return np.where(missing, "", values.astype(str)).tolist()
+    if kind == "relations":
+        targets = data.targets.astype(str).tolist()
+        offsets = data.offsets.tolist()
+        return [
+            LIST_SEPARATOR.join(targets[start:stop]) for start, stop in zip(offsets, offsets[1:])
+        ]
+    return ["" if value is None else str(value) for value in data]
+
+
+def to_csv(table_cols: List[Column]) -> bytes:
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(name for name, _, _ in table_cols)
+    writer.writerows(zip(*(_csv_values(kind, data) for _, kind, data in table_cols)))
+    return output.getvalue().encode("utf-8")
+
+
+def _arrow_array(pa, kind: str, data: Any):
+    if kind == "id":
+        return pa.array(data)
+    if kind == "number":
+        return pa.array(data, from_pandas=True)
+    if kind == "category":
+        return pa.DictionaryArray.from_arrays(
+            pa.array(data.codes), pa.array(data.categories, type=pa.string())
+        )
+    if kind == "relation":
+        values, missing = _single_ids(data)
+        return pa.array(values, mask=missing)
+    if kind == "relations":
+        offsets = pa.array(data.offsets.astype(np.int32))
+        return pa.ListArray.from_arrays(offsets, pa.array(data.targets))
+    return pa.array([None if value is None else str(value) for value in data], type=pa.string())
+
+
+def to_arrow_table(table_cols: List[Column]):
+    pa = _pyarrow()
+    return pa.table({name: _arrow_array(pa, kind, data) for name, kind, data in table_cols})
+
+
+def render(resource: str, output_format: str) -> bytes:
+    """Arquivo de um recurso no formato pedido, a partir do dataset atual"""
+    if output_format in ARROW_FORMATS:
+        _pyarrow()
+    table_cols = table_columns(columns.table(resource), dataset.store.items(resource))
+    if output_format == "csv":
+        return to_csv(table_cols)
+
+    import pyarrow.ipc  # pylint: disable=import-outside-toplevel
+    import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+
+    sink = io.BytesIO()
+    arrow_table = to_arrow_table(table_cols)
+    if output_format == "parquet":
+        pyarrow.parquet.write_table(arrow_table, sink)
+    else:
+        with pyarrow.ipc.new_file(sink, arrow_table.schema) as writer:
+            writer.write_table(arrow_table)
+    return sink.getvalue()
+
+
+class Artifact:
+    """Arquivo exportado pronto para servir, com ETag pelo conteúdo"""
+
+    def __init__(self, resource: str, output_format: str, content: bytes):
+        self.media_type, extension = FORMATS[output_format]
+        self.filename = f"{resource}.{extension}"
+        self.content = content
+        self.etag = f'"{hashlib.sha1(content).hexdigest()}"'
+
+
+def artifact(resource: str, output_format: str) -> Optional[Artifact]:
+    """Arquivo do recurso, gerado uma vez por versão do dataset"""
+    return dataset.derived(
+        f"tabular:{resource}:{output_format}",
+        lambda store: Artifact(resource, output_format, render(resource, output_format)),
+    )
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.columns import columns
+from app.core.cooccurrence import cooccurrence
+from app.core.dataset import dataset
+from app.core.graph import graph
+from app.core.search_index import search_index
+
+logger = logging.getLogger(__name__)
+
+DISABLED = "disabled"
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def build_derived() -> None:
+    """Índices derivados prontos antes da primeira requisição que os usa"""
+    search_index.build()
+    columns.build()
+    graph()
+    cooccurrence.build()
+
+
+# Cada atualização do dataset (ao vencer o TTL) já deixa os índices novos prontos
+dataset.on_refresh(build_derived)
+
+
+class WarmUp:
+    """
+    Aquecimento do cache na inicialização
+
+    Baixa todas as páginas dos recursos com paralelismo limitado, preenche o
+    cache (páginas e itens individuais), instala as coleções no `dataset` e
+    constrói os índices de busca e as colunas tipadas.
+    Enquanto roda, a aplicação não é considerada pronta (`/health/ready`).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = DISABLED
+        self.progress: Dict[str, Dict[str, int]] = {}
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        # Uma falha no aquecimento não deve tirar a instância de serviço
+        return self.state in (DISABLED, DONE, FAILED)
+
+    def start(self, resources: Iterable[str], concurrency: int) -> asyncio.Task:
+        resources = list(resources)
+        self.state = PENDING
+        self.progress = {resource: {"pages_done": 0, "pages_total": 0} for resource in resources}
+        self._task = asyncio.create_task(self.run(resources, concurrency))
+        return self._task
+
+    async def run(self, resources: Iterable[str], concurrency: int) -> None:
+        self.state = RUNNING
+        self.error = None
+        self.started_at = time.monotonic()
+        try:
+            store = await dataset.load(resources, concurrency=concurrency, on_page=self._on_page)
+        except Exception as e:  # pylint: disable=broad-except
+            self.state = FAILED
+            self.error = getattr(e, "detail", None) or str(e)
+            logger.warning("Falha no aquecimento do cache: %s", self.error)
+        else:
+            build_derived()
+            self.state = DONE
+            for resource, count in store.counts().items():
+                if resource in self.progress:
+                    self.progress[resource]["items"] = count
+        finally:
+            self.finished_at = time.monotonic()
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def _on_page(self, resource: str, done: int, total: int) -> None:
+        self.progress[resource] = {"pages_done": done, "pages_total": total}
+
+    def status(self) -> Dict[str, Any]:
+        pages_done = sum(p["pages_done"] for p in self.progress.values())
+        pages_total = sum(p["pages_total"] for p in self.progress.values())
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.monotonic()) - self.started_at, 3)
+        return {
+            "state": self.state,
+            "ready": self.ready,
+            "pages_done": pages_done,
+            "pages_total": pages_total,
+            "percent": round(100 * pages_done / pages_total, 1) if pages_total else None,
+            "elapsed_seconds": elapsed,
+            "error": self.error,
+            "resources": self.progress,
+        }
+
+
+warmup = WarmUp()
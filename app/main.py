@@ -1,15 +1,20 @@
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from app.config import settings
+from app.core.request_context import RequestContext, reset_request_context, set_request_context
 from app.core.swapi_client import swapi_client
+from app.core.warmup import warmup
 from app.modules.films.router import router as films_router
 from app.modules.people.router import router as people_router
 from app.modules.planets.router import router as planets_router
 from app.modules.species.router import router as species_router
 from app.modules.starships.router import router as starships_router
+from app.modules.swapi.router import RESOURCE_MAP
 from app.modules.swapi.router import router as swapi_router
 from app.modules.vehicles.router import router as vehicles_router
 
@@ -17,8 +22,12 @@ from app.modules.vehicles.router import router as vehicles_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀 Iniciando Star Wars API...")
+    await swapi_client.start()
+    if settings.warmup_enabled and swapi_client.snapshot is None:
+        warmup.start(RESOURCE_MAP.keys(), concurrency=settings.warmup_concurrency)
     yield
     print("🛑 Encerrando Star Wars API...")
+    await warmup.stop()
     await swapi_client.close()
 
 
@@ -52,8 +61,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Cache-Status", "X-Upstream-Retries", "X-Upstream-Retry-Time"],
 )
 
+
+@app.middleware("http")
+async def swapi_request_context(request: Request, call_next):
+    """
+    Define o prazo da requisição para as chamadas à SWAPI e expõe nos headers
+    da resposta como o cache foi usado e quantas retentativas foram feitas
+    """
+    context = RequestContext(deadline=time.monotonic() + settings.request_deadline)
+    token = set_request_context(context)
+    try:
+        response = await call_next(request)
+    finally:
+        reset_request_context(token)
+
+    if context.cache_status:
+        response.headers["X-Cache-Status"] = context.cache_status
+    if context.upstream_retries:
+        response.headers["X-Upstream-Retries"] = str(context.upstream_retries)
+        response.headers["X-Upstream-Retry-Time"] = f"{context.retry_seconds * 1000:.0f}ms"
+    return response
+
+
 app.include_router(people_router, tags=["People"])
 app.include_router(films_router, tags=["Films"])
 app.include_router(planets_router, tags=["Planets"])
@@ -72,3 +104,27 @@ async def root():
 async def health_check():
     """Verifica se a API está funcionando"""
     return {"status": "healthy", "service": "Star Wars API", "version": "1.0.0"}
+
+
+@app.get("/health/ready", tags=["System"])
+async def readiness_check(response: Response):
+    """
+    Verifica se a API está pronta para receber tráfego
+
+    Retorna 503 enquanto o aquecimento do cache estiver em andamento.
+    """
+    if not warmup.ready:
+        response.status_code = 503
+    return {"status": "ready" if warmup.ready else "warming_up", "warmup": warmup.status()}
+
+
+@app.get("/health/upstream", tags=["System"])
+async def upstream_health():
+    """Estado do circuit breaker da SWAPI"""
+    return swapi_client.breaker.stats()
+
+
+@app.get("/metrics", tags=["System"])
+async def metrics():
+    """Métricas do cliente SWAPI (cache, circuit breaker e chamadas à SWAPI)"""
+    return swapi_client.stats()
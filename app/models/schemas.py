@@ -1,9 +1,12 @@
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel
 
 T = TypeVar("T")
 
+# URL de outro recurso da SWAPI, ou o próprio objeto quando expandido com ?expand=
+Relation = Union[str, Dict[str, Any]]
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     count: int
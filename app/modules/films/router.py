@@ -1,7 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
+from app.core.pagination import ListParams, list_page
+from app.core.projection import parse_fields, project
+from app.core.relations import expand_relations, parse_expand
 from app.models.schemas import PaginatedResponse
 from app.modules.films.schema import Film
 from app.modules.films.service import FilmService
@@ -15,16 +18,22 @@ router = APIRouter(
 
 @router.get("/", summary="Listar filmes", response_model=PaginatedResponse[Film])
 async def search_films(
+    request: Request,
     search: Optional[str] = Query(
         None,
         description="Buscar filme por título",
         examples="hope",
     ),
-    page: int = Query(
-        1,
-        ge=1,
-        description="Número da página",
-        examples=1,
+    params: ListParams = Depends(),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: characters,planets)",
+        examples="characters",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: title,episode_id,release_date)",
+        examples="title,episode_id,release_date",
     ),
 ):
     """
@@ -32,13 +41,19 @@ async def search_films(
 
     A paginação é aplicada localmente, pois a SWAPI
     retorna todos os filmes de uma vez.
+
+    Com `fuzzy=true`, a busca tolera erros de digitação (ex: empyre).
     """
-    data = await FilmService.search_films(search=search, page=page)
+    selected_fields = parse_fields(Film, fields)
+    expand_paths = parse_expand("films", expand)
+    data = await list_page("films", request.url, search, params, FilmService.search_films)
 
     for film in data.get("results", []):
         film["film_id"] = film["url"].split("/")[-2]
 
-    return data
+    await expand_relations(data.get("results", []), expand_paths)
+
+    return project(data, selected_fields, paginated=True)
 
 
 @router.get("/{film_id}", summary="Buscar filme por ID", response_model=Film)
@@ -48,7 +63,17 @@ async def get_film(
         ge=1,
         description="ID do filme",
         examples=1,
-    )
+    ),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: characters,planets)",
+        examples="characters",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: title,episode_id,release_date)",
+        examples="title,episode_id,release_date",
+    ),
 ):
     """
     Busca um filme específico por ID.
@@ -58,5 +83,8 @@ async def get_film(
     - 2: The Empire Strikes Back
     - 3: Return of the Jedi
     """
+    selected_fields = parse_fields(Film, fields)
+    expand_paths = parse_expand("films", expand)
     data = await FilmService.get_film(film_id)
-    return data
+    await expand_relations([data], expand_paths)
+    return project(data, selected_fields)
@@ -2,6 +2,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from app.models.schemas import Relation
+
 
 class Film(BaseModel):
     """Modelo de filme do Star Wars"""
@@ -12,11 +14,11 @@ class Film(BaseModel):
     director: str
     producer: str
     release_date: str
-    characters: List[str]
-    planets: List[str]
-    starships: List[str]
-    vehicles: List[str]
-    species: List[str]
+    characters: List[Relation]
+    planets: List[Relation]
+    starships: List[Relation]
+    vehicles: List[Relation]
+    species: List[Relation]
     created: str
     edited: str
     url: str
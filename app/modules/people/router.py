@@ -1,7 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
+from app.core.pagination import ListParams, list_page
+from app.core.projection import parse_fields, project
+from app.core.relations import expand_relations, parse_expand
 from app.models.schemas import PaginatedResponse
 from app.modules.people.schema import People
 from app.modules.people.service import PeopleService
@@ -15,38 +18,74 @@ router = APIRouter(
 
 @router.get("/", summary="Listar personagens", response_model=PaginatedResponse[People])
 async def list_people(
+    request: Request,
     search: Optional[str] = Query(None, description="Buscar personagem por nome", examples="luke"),
-    page: int = Query(1, ge=1, description="Número da página", examples=1),
+    params: ListParams = Depends(),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: homeworld,films.characters)",
+        examples="homeworld",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,height,mass)",
+        examples="name,height,mass",
+    ),
 ):
     """
     Lista personagens do Star Wars com suporte a busca e paginação.
 
     - **search**: Nome do personagem (ex: luke, vader, leia)
     - **page**: Página de resultados (padrão: 1)
+    - **fuzzy**: Busca aproximada, ordenada por similaridade (ex: skywaker)
+    - **page_size** / **cursor**: Paginação local com tamanho de página escolhido
+    - **filter** / **sort**: Filtros e ordenação sobre campos numéricos e categóricos
+    - **expand**: Relações a incluir no lugar das URLs (ex: homeworld, films)
 
     Retorna dados paginados com informações detalhadas de cada personagem.
     """
-    data = await PeopleService.search_people(search=search, page=page)
+    selected_fields = parse_fields(People, fields)
+    expand_paths = parse_expand("people", expand)
+    data = await list_page("people", request.url, search, params, PeopleService.search_people)
 
     for person in data.get("results", []):
         person["person_id"] = person["url"].split("/")[-2]
         person["homeworld_id"] = person["homeworld"].split("/")[-2]
 
-    return data
+    await expand_relations(data.get("results", []), expand_paths)
+
+    return project(data, selected_fields, paginated=True)
 
 
 @router.get("/{person_id}", summary="Buscar personagem por ID", response_model=People)
-async def get_person(person_id: int = Path(..., ge=1, description="ID do personagem", examples=1)):
+async def get_person(
+    person_id: int = Path(..., ge=1, description="ID do personagem", examples=1),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: homeworld,films.characters)",
+        examples="homeworld",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,height,mass)",
+        examples="name,height,mass",
+    ),
+):
     """
     Busca um personagem específico por ID.
 
     - **person_id**: ID do personagem (1 = Luke Skywalker)
+    - **expand**: Relações a incluir no lugar das URLs (ex: homeworld, films)
 
     Exemplos:
     - 1: Luke Skywalker
     - 4: Darth Vader
     - 5: Leia Organa
     """
+    selected_fields = parse_fields(People, fields)
+    expand_paths = parse_expand("people", expand)
     data = await PeopleService.get_person(person_id)
 
-    return data
+    await expand_relations([data], expand_paths)
+
+    return project(data, selected_fields)
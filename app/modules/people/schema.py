@@ -2,6 +2,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from app.models.schemas import Relation
+
 
 class People(BaseModel):
     name: str
@@ -13,14 +15,14 @@ class People(BaseModel):
     birth_year: str
     gender: str
 
-    homeworld: str
+    homeworld: Relation
     homeworld_id: Optional[str] = None
     person_id: Optional[str] = None
 
-    films: List[str]
-    species: List[str]
-    vehicles: List[str]
-    starships: List[str]
+    films: List[Relation]
+    species: List[Relation]
+    vehicles: List[Relation]
+    starships: List[Relation]
 
     created: str
     edited: str
@@ -1,7 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
+from app.core.pagination import ListParams, list_page
+from app.core.projection import parse_fields, project
+from app.core.relations import expand_relations, parse_expand
 from app.models.schemas import PaginatedResponse
 from app.modules.planets.schema import Planet
 from app.modules.planets.service import PlanetService
@@ -15,27 +18,39 @@ router = APIRouter(
 
 @router.get("/", summary="Listar planetas", response_model=PaginatedResponse[Planet])
 async def search_planets(
+    request: Request,
     search: Optional[str] = Query(
         None,
         description="Buscar planeta por nome",
         examples="tatooine",
     ),
-    page: int = Query(
-        1,
-        ge=1,
-        description="Número da página",
-        examples=1,
+    params: ListParams = Depends(),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: residents,films)",
+        examples="residents",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,population)",
+        examples="name,population",
     ),
 ):
     """
     Lista planetas do universo Star Wars com busca e paginação.
+
+    Com `fuzzy=true`, a busca tolera erros de digitação (ex: tatoine).
     """
-    data = await PlanetService.search_planets(search=search, page=page)
+    selected_fields = parse_fields(Planet, fields)
+    expand_paths = parse_expand("planets", expand)
+    data = await list_page("planets", request.url, search, params, PlanetService.search_planets)
 
     for planet in data.get("results", []):
         planet["planet_id"] = planet["url"].split("/")[-2]
 
-    return data
+    await expand_relations(data.get("results", []), expand_paths)
+
+    return project(data, selected_fields, paginated=True)
 
 
 @router.get("/{planet_id}", summary="Buscar planeta por ID", response_model=Planet)
@@ -45,7 +60,17 @@ async def get_planet(
         ge=1,
         description="ID do planeta",
         examples=1,
-    )
+    ),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: residents,films)",
+        examples="residents",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,population)",
+        examples="name,population",
+    ),
 ):
     """
     Busca um planeta específico por ID.
@@ -55,4 +80,8 @@ async def get_planet(
     - 2: Alderaan
     - 8: Naboo
     """
-    return await PlanetService.get_planet(planet_id)
+    selected_fields = parse_fields(Planet, fields)
+    expand_paths = parse_expand("planets", expand)
+    data = await PlanetService.get_planet(planet_id)
+    await expand_relations([data], expand_paths)
+    return project(data, selected_fields)
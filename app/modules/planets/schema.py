@@ -2,6 +2,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel
 
+from app.models.schemas import Relation
+
 
 class Planet(BaseModel):
     """Modelo de planeta do Star Wars"""
@@ -15,8 +17,8 @@ class Planet(BaseModel):
     terrain: str
     surface_water: str
     population: str
-    residents: List[str]
-    films: List[str]
+    residents: List[Relation]
+    films: List[Relation]
     created: str
     edited: str
     url: str
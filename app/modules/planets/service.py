@@ -1,5 +1,6 @@
 from typing import Any, Dict, Optional
 
+from app.core.search_index import search_index
 from app.core.swapi_client import swapi_client
 
 
@@ -25,6 +26,12 @@ class PlanetService:
         - search
         - page
         """
+        # Com o dataset local disponível, a busca não vai à SWAPI
+        if search:
+            local = search_index.search("planets", search, page)
+            if local is not None:
+                return local
+
         params = {"page": page}
 
         if search:
@@ -1,7 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
+from app.core.pagination import ListParams, list_page
+from app.core.projection import parse_fields, project
+from app.core.relations import expand_relations, parse_expand
 from app.models.schemas import PaginatedResponse
 from app.modules.species.schema import Species
 from app.modules.species.service import SpeciesService
@@ -19,22 +22,34 @@ router = APIRouter(
     response_model=PaginatedResponse[Species],
 )
 async def search_species(
+    request: Request,
     search: Optional[str] = Query(
         None,
         description="Buscar espécie pelo nome",
         examples=["wookiee"],
     ),
-    page: int = Query(
-        1,
-        ge=1,
-        description="Número da página",
-        examples=[1],
+    params: ListParams = Depends(),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: homeworld,people)",
+        examples=["homeworld"],
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,classification)",
+        examples=["name,classification"],
     ),
 ):
     """
     Lista espécies do universo Star Wars com paginação e busca.
+
+    Com `fuzzy=true`, a busca tolera erros de digitação (ex: wokie).
     """
-    return await SpeciesService.search_species(search=search, page=page)
+    selected_fields = parse_fields(Species, fields)
+    expand_paths = parse_expand("species", expand)
+    data = await list_page("species", request.url, search, params, SpeciesService.search_species)
+    await expand_relations(data.get("results", []), expand_paths)
+    return project(data, selected_fields, paginated=True)
 
 
 @router.get(
@@ -49,8 +64,22 @@ async def get_species(
         description="ID da espécie",
         examples=[1],
     ),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: homeworld,people)",
+        examples=["homeworld"],
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,classification)",
+        examples=["name,classification"],
+    ),
 ):
     """
     Busca uma espécie específica pelo ID.
     """
-    return await SpeciesService.get_species(species_id)
+    selected_fields = parse_fields(Species, fields)
+    expand_paths = parse_expand("species", expand)
+    data = await SpeciesService.get_species(species_id)
+    await expand_relations([data], expand_paths)
+    return project(data, selected_fields)
@@ -2,6 +2,8 @@ from typing import List
 
 from pydantic import BaseModel
 
+from app.models.schemas import Relation
+
 
 class Species(BaseModel):
     """Modelo de espécie do Star Wars"""
@@ -14,10 +16,10 @@ class Species(BaseModel):
     hair_colors: str
     eye_colors: str
     average_lifespan: str
-    homeworld: str | None
+    homeworld: Relation | None
     language: str
-    people: List[str]
-    films: List[str]
+    people: List[Relation]
+    films: List[Relation]
     created: str
     edited: str
     url: str
@@ -1,7 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
+from app.core.pagination import ListParams, list_page
+from app.core.projection import parse_fields, project
+from app.core.relations import expand_relations, parse_expand
 from app.models.schemas import PaginatedResponse
 from app.modules.starships.schema import Starship
 from app.modules.starships.service import StarshipService
@@ -19,27 +22,41 @@ router = APIRouter(
     response_model=PaginatedResponse[Starship],
 )
 async def list_starships(
+    request: Request,
     search: Optional[str] = Query(
         None,
         description="Buscar nave por nome ou modelo",
         examples=["falcon"],
     ),
-    page: int = Query(
-        1,
-        ge=1,
-        description="Número da página",
-        examples=1,
+    params: ListParams = Depends(),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: pilots,films)",
+        examples=["pilots"],
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,model)",
+        examples=["name,model"],
     ),
 ):
     """
     Lista naves do universo Star Wars com suporte a busca e paginação.
+
+    Com `fuzzy=true`, a busca tolera erros de digitação (ex: milenium).
     """
-    data = await StarshipService.search_starships(search=search, page=page)
+    selected_fields = parse_fields(Starship, fields)
+    expand_paths = parse_expand("starships", expand)
+    data = await list_page(
+        "starships", request.url, search, params, StarshipService.search_starships
+    )
 
     for starship in data.get("results", []):
         starship["starship_id"] = starship["url"].split("/")[-2]
 
-    return data
+    await expand_relations(data.get("results", []), expand_paths)
+
+    return project(data, selected_fields, paginated=True)
 
 
 @router.get(
@@ -53,7 +70,17 @@ async def get_starship(
         ge=1,
         description="ID da nave",
         examples=9,
-    )
+    ),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: pilots,films)",
+        examples=["pilots"],
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,model)",
+        examples=["name,model"],
+    ),
 ):
     """
     Busca uma nave específica por ID.
@@ -62,5 +89,8 @@ async def get_starship(
     - 9: Death Star
     - 10: Millennium Falcon
     """
+    selected_fields = parse_fields(Starship, fields)
+    expand_paths = parse_expand("starships", expand)
     data = await StarshipService.get_starship(starship_id)
-    return data
+    await expand_relations([data], expand_paths)
+    return project(data, selected_fields)
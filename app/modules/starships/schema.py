@@ -2,6 +2,8 @@ from typing import List
 
 from pydantic import BaseModel
 
+from app.models.schemas import Relation
+
 
 class Starship(BaseModel):
     """Modelo de nave do Star Wars"""
@@ -19,8 +21,8 @@ class Starship(BaseModel):
     hyperdrive_rating: str
     MGLT: str
     starship_class: str
-    pilots: List[str]
-    films: List[str]
+    pilots: List[Relation]
+    films: List[Relation]
     created: str
     edited: str
     url: str
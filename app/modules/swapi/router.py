@@ -1,12 +1,38 @@
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
+from app.config import settings
+from app.core.cooccurrence import TOP_PAIRS
+from app.core.dataset import dataset
+from app.core.export import NDJSON_MEDIA_TYPE, first_page, ndjson_lines
+from app.core.pagination import ListParams, list_page
+from app.core.search_index import search_index
+from app.core.swapi_client import swapi_client
+from app.core.tabular import artifact, parse_format
 from app.modules.films.service import FilmService
 from app.modules.people.service import PeopleService
 from app.modules.planets.service import PlanetService
 from app.modules.species.service import SpeciesService
 from app.modules.starships.service import StarshipService
+from app.modules.swapi.schema import (
+    AggregateResponse,
+    AutocompleteResponse,
+    BatchRequest,
+    BatchResponse,
+    CooccurrenceResponse,
+    NeighborsResponse,
+    PathResponse,
+    SearchResponse,
+)
+from app.modules.swapi.service import (
+    AggregationService,
+    BatchService,
+    CooccurrenceService,
+    GraphService,
+    SearchService,
+)
 from app.modules.vehicles.service import VehicleService
 
 router = APIRouter(
@@ -24,11 +50,96 @@ RESOURCE_MAP = {
 }
 
 
+@router.get("/autocomplete", summary="Autocompletar nomes", response_model=AutocompleteResponse)
+async def autocomplete(
+    q: str = Query(..., min_length=1, description="Início do nome", examples="sky"),
+    limit: int = Query(10, ge=1, le=50, description="Número máximo de sugestões"),
+):
+    """
+    Sugere nomes de personagens, planetas, filmes, naves, veículos e espécies
+    que começam com o texto digitado (ou com alguma palavra que começa com ele).
+
+    Respondido a partir de um índice de prefixos em memória, sem chamadas à SWAPI.
+
+    Exemplos:
+    - /swapi/autocomplete?q=sky
+    - /swapi/autocomplete?q=tat&limit=5
+    """
+    return {"query": q, "results": await search_index.autocomplete(q, limit)}
+
+
+@router.get("/search", summary="Buscar em todos os recursos", response_model=SearchResponse)
+async def unified_search(
+    q: str = Query(..., min_length=1, description="Texto de busca", examples="sky"),
+    limit: int = Query(20, ge=1, le=100, description="Número máximo de resultados"),
+):
+    """
+    Busca o texto em todos os recursos ao mesmo tempo e retorna uma única
+    lista ordenada por relevância.
+
+    Cada recurso contribui com a primeira página da sua busca. Recursos que
+    falham ou excedem `SWAPI_SEARCH_TIMEOUT` não seguram a resposta: ela
+    volta com `partial: true` e o motivo em `errors`.
+
+    Exemplos:
+    - /swapi/search?q=sky
+    - /swapi/search?q=death&limit=5
+    """
+    return await SearchService.search(RESOURCE_MAP, q, limit=limit, timeout=settings.search_timeout)
+
+
+@router.get("/graph/path", summary="Graus de separação", response_model=PathResponse)
+async def graph_path(
+    source: str = Query(..., description="Item de origem (recurso/id)", examples="people/1"),
+    target: str = Query(..., description="Item de destino (recurso/id)", examples="people/16"),
+    via: Optional[str] = Query(
+        None, description="Recursos permitidos no meio do caminho", examples="films,starships"
+    ),
+):
+    """
+    Menor caminho de relações entre dois itens quaisquer (personagens,
+    planetas, filmes, naves, veículos e espécies).
+
+    Respondido por busca em largura sobre o grafo em memória, sem chamadas à SWAPI.
+
+    Exemplos:
+    - /swapi/graph/path?source=people/1&target=people/16
+    - /swapi/graph/path?source=people/1&target=people/4&via=films,starships
+    - /swapi/graph/path?source=planets/2&target=species/2
+    """
+    return await GraphService.path(source, target, via)
+
+
+@router.get(
+    "/graph/{resource}/{item_id}/neighbors",
+    summary="Vizinhos no grafo de relações",
+    response_model=NeighborsResponse,
+)
+async def graph_neighbors(
+    resource: str = Path(..., description="Recurso da SWAPI"),
+    item_id: int = Path(..., ge=1, description="ID do item"),
+    depth: int = Query(1, ge=1, le=3, description="Distância máxima em relações"),
+    resources: Optional[str] = Query(
+        None, description="Recursos a listar, separados por vírgula", examples="people"
+    ),
+):
+    """
+    Itens ligados a um item por até `depth` relações, do mais próximo ao mais
+    distante.
+
+    Exemplos:
+    - /swapi/graph/people/1/neighbors
+    - /swapi/graph/people/1/neighbors?depth=2&resources=people
+    """
+    return await GraphService.neighbors(resource, item_id, depth, resources)
+
+
 @router.get("/{resource}")
 async def generic_search(
+    request: Request,
     resource: str = Path(..., description="Recurso da SWAPI"),
     search: Optional[str] = Query(None, description="Texto de busca"),
-    page: int = Query(1, ge=1),
+    params: ListParams = Depends(),
 ):
     """
     Endpoint genérico para consulta de recursos da SWAPI.
@@ -37,6 +148,9 @@ async def generic_search(
     - /swapi/people?search=luke
     - /swapi/planets?search=tatooine
     - /swapi/starships?search=death
+    - /swapi/people?search=skywaker&fuzzy=true
+    - /swapi/people?page_size=100
+    - /swapi/planets?filter=population:gte:1000000&sort=-diameter
     """
 
     service = RESOURCE_MAP.get(resource)
@@ -44,4 +158,151 @@ async def generic_search(
     if not service:
         raise HTTPException(status_code=400, detail=f"Recurso '{resource}' não é suportado")
 
-    return await service(search=search, page=page)
+    return await list_page(resource, request.url, search, params, service)
+
+
+@router.get("/{resource}/aggregate", summary="Agregar um recurso", response_model=AggregateResponse)
+async def aggregate_resource(
+    resource: str = Path(..., description="Recurso da SWAPI"),
+    group_by: Optional[str] = Query(
+        None, description="Campo categórico ou relação para agrupar", examples="species"
+    ),
+    metrics: str = Query(
+        "count",
+        description="Métricas operação:campo separadas por vírgula "
+        "(count, sum, mean, min, max, median, pNN)",
+        examples="count,mean:height,p90:mass",
+    ),
+    filters: Optional[List[str]] = Query(
+        None, alias="filter", description="Filtro campo:operador:valor; pode repetir"
+    ),
+):
+    """
+    Agrupa os itens de um recurso e calcula métricas por grupo, a partir das
+    colunas tipadas do dataset local (sem baixar a coleção no cliente).
+
+    Exemplos:
+    - /swapi/people/aggregate?group_by=species&metrics=count,mean:height
+    - /swapi/starships/aggregate?group_by=manufacturer&metrics=sum:cargo_capacity
+    - /swapi/planets/aggregate?metrics=median:population,p90:diameter
+    """
+    if resource not in RESOURCE_MAP:
+        raise HTTPException(status_code=400, detail=f"Recurso '{resource}' não é suportado")
+
+    return await AggregationService.aggregate(resource, group_by, metrics, filters)
+
+
+@router.get(
+    "/{resource}/export",
+    summary="Exportar um recurso inteiro (NDJSON, CSV, Arrow ou Parquet)",
+    response_class=StreamingResponse,
+)
+async def export_resource(
+    request: Request,
+    resource: str = Path(..., description="Recurso da SWAPI"),
+    search: Optional[str] = Query(None, description="Exporta só os itens da busca (NDJSON)"),
+    output_format: str = Query(
+        "ndjson", alias="format", description="ndjson, csv, arrow ou parquet"
+    ),
+):
+    """
+    Transmite todos os itens de um recurso, um objeto JSON por linha
+    (`application/x-ndjson`), na ordem das páginas da SWAPI.
+
+    As páginas são buscadas concorrentemente (até `SWAPI_EXPORT_CONCURRENCY`
+    à frente do consumidor) e a memória não cresce com o tamanho da coleção.
+    Uma falha no meio da exportação encerra o stream com uma linha `{"error": ...}`.
+
+    Com `format=csv`, `arrow` (Arrow IPC) ou `parquet`, retorna o arquivo
+    tabular gerado a partir do dataset local, com colunas numéricas tipadas e
+    relações como IDs inteiros. O arquivo é gerado uma vez por versão do
+    dataset e respeita `If-None-Match`. Arrow e Parquet exigem o extra `arrow`.
+
+    Exemplos:
+    - /swapi/people/export
+    - /swapi/starships/export?search=star
+    - /swapi/people/export?format=parquet
+    """
+    if resource not in RESOURCE_MAP:
+        raise HTTPException(status_code=400, detail=f"Recurso '{resource}' não é suportado")
+
+    if output_format != "ndjson":
+        parse_format(output_format)
+        if search:
+            raise HTTPException(
+                status_code=400, detail="search só é suportado na exportação ndjson"
+            )
+        await dataset.ensure_loaded()
+        exported = artifact(resource, output_format)
+        dataset.record_source()
+        headers = {"ETag": exported.etag}
+        if request.headers.get("if-none-match") == exported.etag:
+            return Response(status_code=304, headers=headers)
+        headers["Content-Disposition"] = f'attachment; filename="{exported.filename}"'
+        return Response(exported.content, media_type=exported.media_type, headers=headers)
+
+    first = await first_page(swapi_client, resource, search)
+    return StreamingResponse(
+        ndjson_lines(swapi_client, resource, first, search, window=settings.export_concurrency),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/{resource}/cooccurrence",
+    summary="Itens que aparecem juntos nos filmes",
+    response_model=CooccurrenceResponse,
+)
+async def resource_cooccurrence(
+    resource: str = Path(..., description="people, planets, starships, vehicles ou species"),
+    item_id: Optional[int] = Query(
+        None, alias="id", ge=1, description="Lista os parceiros deste item"
+    ),
+    limit: int = Query(10, ge=1, le=TOP_PAIRS, description="Número máximo de pares"),
+):
+    """
+    Pares de itens que aparecem juntos em mais filmes (ex: personagens que
+    contracenam mais, planetas que dividem mais filmes).
+
+    Calculado por produtos da matriz de incidência filme × item, pré-calculados
+    por versão do dataset, sem chamadas à SWAPI.
+
+    Exemplos:
+    - /swapi/people/cooccurrence?limit=5
+    - /swapi/people/cooccurrence?id=1
+    - /swapi/planets/cooccurrence
+    """
+    return await CooccurrenceService.cooccurrence(resource, item_id, limit)
+
+
+@router.post("/batch", summary="Buscar vários recursos por ID", response_model=BatchResponse)
+async def batch_lookup(
+    batch: BatchRequest = Body(
+        ...,
+        examples=[
+            {
+                "items": [
+                    {"resource": "people", "id": 1},
+                    {"resource": "planets", "id": 1},
+                    {"resource": "starships", "id": 12},
+                ]
+            }
+        ],
+    ),
+):
+    """
+    Busca vários recursos por ID em uma única chamada.
+
+    Os itens são buscados concorrentemente, pares repetidos são buscados uma
+    única vez e cada item traz seu próprio status e erro, sem falhar o lote.
+
+    Exemplo:
+    - {"items": [{"resource": "people", "id": 1}, {"resource": "planets", "id": 1}]}
+    """
+    if len(batch.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"O lote aceita no máximo {settings.batch_max_items} itens",
+        )
+
+    return await BatchService.fetch(batch.items, concurrency=settings.batch_concurrency)
@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class BatchItem(BaseModel):
+    """Item de uma consulta em lote"""
+
+    resource: str = Field(..., examples=["people"])
+    id: int = Field(..., ge=1, examples=[1])
+
+
+class BatchRequest(BaseModel):
+    """Consulta em lote de vários recursos por ID"""
+
+    items: List[BatchItem] = Field(..., min_length=1)
+
+
+class BatchResult(BaseModel):
+    """Resultado de um item da consulta em lote"""
+
+    resource: str
+    id: int
+    status: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    count: int
+    errors: int
+    results: List[BatchResult]
+
+
+class Completion(BaseModel):
+    """Sugestão de autocompletar"""
+
+    resource: str
+    id: int
+    name: str
+
+
+class AutocompleteResponse(BaseModel):
+    query: str
+    results: List[Completion]
+
+
+class SearchHit(BaseModel):
+    """Resultado da busca unificada"""
+
+    resource: str
+    id: int
+    name: str
+    score: float
+    data: Dict[str, Any]
+
+
+class SearchResponse(BaseModel):
+    query: str
+    count: int
+    # True quando algum recurso falhou ou excedeu o tempo limite
+    partial: bool
+    errors: Dict[str, str]
+    results: List[SearchHit]
+
+
+class AggregateGroup(BaseModel):
+    """Grupo de uma agregação; `key` é o valor categórico ou o ID da relação"""
+
+    key: Optional[Union[int, str]] = None
+    label: Optional[str] = None
+    count: int
+    metrics: Dict[str, Optional[float]]
+
+
+class AggregateResponse(BaseModel):
+    resource: str
+    group_by: Optional[str] = None
+    groups: List[AggregateGroup]
+
+
+class GraphNode(BaseModel):
+    """Item do grafo de relações"""
+
+    resource: str
+    id: int
+    name: Optional[str] = None
+    # Número de relações do item (só no nó consultado)
+    degree: Optional[int] = None
+    # Relações de distância até o nó consultado (só nos vizinhos)
+    distance: Optional[int] = None
+
+
+class NeighborsResponse(BaseModel):
+    node: GraphNode
+    depth: int
+    count: int
+    results: List[GraphNode]
+
+
+class PathResponse(BaseModel):
+    source: GraphNode
+    target: GraphNode
+    found: bool
+    # Número de relações no caminho; None quando não há caminho
+    distance: Optional[int] = None
+    path: List[GraphNode]
+
+
+class CooccurrenceItem(BaseModel):
+    id: int
+    name: Optional[str] = None
+
+
+class CooccurrencePair(BaseModel):
+    """Par de itens e o número de filmes em que aparecem juntos"""
+
+    source: CooccurrenceItem
+    target: CooccurrenceItem
+    films: int
+
+
+class CooccurrenceResponse(BaseModel):
+    resource: str
+    # Item consultado, quando a busca é pelos parceiros de um item
+    item: Optional[CooccurrenceItem] = None
+    count: int
+    results: List[CooccurrencePair]
@@ -0,0 +1,256 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+
+from app.core.aggregation import aggregate, parse_group_by, parse_metrics
+from app.core.columns import columns, parse_filters
+from app.core.cooccurrence import cooccurrence, parse_cooccurrence_resource
+from app.core.dataset import dataset
+from app.core.graph import graph, node_info, parse_node, parse_resources
+from app.core.search_index import relevance
+from app.core.snapshot import SEARCH_FIELDS, resource_id
+from app.modules.films.service import FilmService
+from app.modules.people.service import PeopleService
+from app.modules.planets.service import PlanetService
+from app.modules.species.service import SpeciesService
+from app.modules.starships.service import StarshipService
+from app.modules.swapi.schema import BatchItem
+from app.modules.vehicles.service import VehicleService
+
+DETAIL_MAP = {
+    "people": PeopleService.get_person,
+    "planets": PlanetService.get_planet,
+    "films": FilmService.get_film,
+    "starships": StarshipService.get_starship,
+    "vehicles": VehicleService.get_vehicle,
+    "species": SpeciesService.get_species,
+}
+
+
+class BatchService:
+    """Consulta de vários recursos por ID em uma única chamada"""
+
+    @staticmethod
+    async def fetch(items: List[BatchItem], concurrency: int) -> Dict[str, Any]:
+        """
+        Busca os itens concorrentemente, no máximo `concurrency` ao mesmo tempo
+
+        Pares (recurso, id) repetidos são buscados uma única vez. Um erro em um
+        item não falha a consulta inteira: ele é reportado no próprio item.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        unique = list(dict.fromkeys((item.resource, item.id) for item in items))
+
+        async def fetch_one(key: Tuple[str, int]) -> Dict[str, Any]:
+            resource, item_id = key
+            service = DETAIL_MAP.get(resource)
+            if service is None:
+                return {"status": 400, "error": f"Recurso '{resource}' não é suportado"}
+
+            async with semaphore:
+                try:
+                    return {"status": 200, "data": await service(item_id)}
+                except HTTPException as e:
+                    return {"status": e.status_code, "error": e.detail}
+
+        fetched = dict(zip(unique, await asyncio.gather(*(fetch_one(key) for key in unique))))
+
+        results = [
+            {"resource": item.resource, "id": item.id, **fetched[(item.resource, item.id)]}
+            for item in items
+        ]
+        return {
+            "count": len(results),
+            "errors": sum(1 for result in results if result["status"] != 200),
+            "results": results,
+        }
+
+
+class SearchService:
+    """Busca em todos os recursos ao mesmo tempo"""
+
+    @staticmethod
+    async def search(
+        searches: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]],
+        query: str,
+        limit: int,
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """
+        Consulta a primeira página de busca de cada recurso concorrentemente
+
+        Cada recurso tem até `timeout` segundos; os que falham ou demoram demais
+        ficam de fora e a resposta é marcada como parcial. Os resultados são
+        ordenados por relevância do nome em relação à consulta.
+        """
+
+        async def search_one(resource: str) -> List[Dict[str, Any]]:
+            data = await asyncio.wait_for(searches[resource](search=query, page=1), timeout)
+            field = SEARCH_FIELDS[resource][0]
+            return [
+                {
+                    "resource": resource,
+                    "id": resource_id(item["url"]),
+                    "name": item.get(field) or "",
+                    "score": relevance(query, item.get(field) or ""),
+                    "data": item,
+                }
+                for item in data.get("results", [])
+            ]
+
+        resources = list(searches)
+        outcomes = await asyncio.gather(
+            *(search_one(resource) for resource in resources), return_exceptions=True
+        )
+
+        hits, errors = [], {}
+        for resource, outcome in zip(resources, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                errors[resource] = f"Tempo limite de {timeout:g}s excedido"
+            elif isinstance(outcome, HTTPException):
+                errors[resource] = str(outcome.detail)
+            elif isinstance(outcome, Exception):
+                errors[resource] = str(outcome) or type(outcome).__name__
+            else:
+                hits.extend(outcome)
+
+        order = {resource: position for position, resource in enumerate(resources)}
+        hits.sort(key=lambda h: (-h["score"], len(h["name"]), order[h["resource"]], h["id"]))
+        return {
+            "query": query,
+            "count": len(hits[:limit]),
+            "partial": bool(errors),
+            "errors": errors,
+            "results": hits[:limit],
+        }
+
+
+class AggregationService:
+    """Agregações sobre as colunas tipadas do dataset local"""
+
+    @staticmethod
+    async def aggregate(
+        resource: str,
+        group_by: Optional[str] = None,
+        metrics: Optional[str] = None,
+        filters: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Agrupa os itens de um recurso e calcula as métricas pedidas
+
+        Os parâmetros são validados antes de qualquer acesso aos dados. Sem
+        snapshot ou aquecimento, as coleções são baixadas uma única vez.
+        """
+        selected_filters = parse_filters(resource, filters)
+        selected_metrics = parse_metrics(resource, metrics)
+        group = parse_group_by(resource, group_by)
+
+        await dataset.ensure_loaded()
+        groups = aggregate(columns.table(resource), group, selected_metrics, selected_filters)
+        dataset.record_source()
+        return {"resource": resource, "group_by": group, "groups": groups}
+
+
+class GraphService:
+    """Consultas ao grafo de relações do dataset local"""
+
+    @staticmethod
+    async def neighbors(
+        resource: str, item_id: int, depth: int = 1, resources: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Itens a até `depth` relações de distância, do mais próximo ao mais distante
+
+        `resources` restringe os recursos listados (a busca passa por todos).
+        """
+        selected = parse_resources(resources)
+        await dataset.ensure_loaded()
+        index = graph()
+        node = parse_node(index, f"{resource}/{item_id}")
+
+        distance, _ = index.bfs(node, depth)
+        reached = distance > 0
+        if selected:
+            reached &= index.passable(selected)
+        nodes = np.flatnonzero(reached)
+        nodes = nodes[np.lexsort((nodes, distance[nodes]))]
+        dataset.record_source()
+        return {
+            "node": node_info(index, node, degree=index.degree(node)),
+            "depth": depth,
+            "count": len(nodes),
+            "results": [node_info(index, n, distance=int(distance[n])) for n in nodes.tolist()],
+        }
+
+    @staticmethod
+    async def path(source: str, target: str, via: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Menor caminho entre dois itens (graus de separação)
+
+        `via` restringe os recursos dos nós intermediários; por exemplo,
+        `via=films,starships` liga personagens só por filmes e naves em comum.
+        """
+        selected = parse_resources(via)
+        await dataset.ensure_loaded()
+        index = graph()
+        start, end = parse_node(index, source), parse_node(index, target)
+
+        passable = index.passable(selected) if selected else None
+        distance, parent = index.bfs(start, index.size, target=end, passable=passable)
+        found = distance[end] >= 0
+        dataset.record_source()
+        return {
+            "source": node_info(index, start),
+            "target": node_info(index, end),
+            "found": bool(found),
+            "distance": int(distance[end]) if found else None,
+            "path": [node_info(index, n) for n in index.path(parent, end)] if found else [],
+        }
+
+
+class CooccurrenceService:
+    """Itens que aparecem juntos nos mesmos filmes"""
+
+    @staticmethod
+    async def cooccurrence(
+        resource: str, item_id: Optional[int] = None, limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Pares de itens com mais filmes em comum ou, com `item_id`, os itens
+        que mais aparecem junto com ele
+
+        Raises:
+            HTTPException: 404 quando `item_id` não existe
+        """
+        parse_cooccurrence_resource(resource)
+        await dataset.ensure_loaded()
+        table = cooccurrence.table(resource)
+        field = SEARCH_FIELDS[resource][0]
+
+        def describe(key: int) -> Dict[str, Any]:
+            return {"id": key, "name": dataset.store.get(resource, key).get(field)}
+
+        if item_id is None:
+            item = None
+            pairs = table.top_pairs(limit)
+        else:
+            partners = table.partners(item_id, limit)
+            if partners is None:
+                raise HTTPException(
+                    status_code=404, detail=f"Recurso não encontrado: {resource}/{item_id}"
+                )
+            item = describe(item_id)
+            pairs = [(item_id, other, films) for other, films in partners]
+
+        dataset.record_source()
+        return {
+            "resource": resource,
+            "item": item,
+            "count": len(pairs),
+            "results": [
+                {"source": describe(a), "target": describe(b), "films": films}
+                for a, b, films in pairs
+            ],
+        }
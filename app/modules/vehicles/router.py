@@ -1,7 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 
+from app.core.pagination import ListParams, list_page
+from app.core.projection import parse_fields, project
+from app.core.relations import expand_relations, parse_expand
 from app.models.schemas import PaginatedResponse
 from app.modules.vehicles.schema import Vehicle
 from app.modules.vehicles.service import VehicleService
@@ -19,27 +22,39 @@ router = APIRouter(
     response_model=PaginatedResponse[Vehicle],
 )
 async def list_vehicles(
+    request: Request,
     search: Optional[str] = Query(
         None,
         description="Buscar veículo por nome ou modelo",
         examples=["speeder"],
     ),
-    page: int = Query(
-        1,
-        ge=1,
-        description="Número da página",
-        examples=1,
+    params: ListParams = Depends(),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: pilots,films)",
+        examples=["pilots"],
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,model)",
+        examples=["name,model"],
     ),
 ):
     """
     Lista veículos do universo Star Wars com suporte a busca e paginação.
+
+    Com `fuzzy=true`, a busca tolera erros de digitação (ex: speedr).
     """
-    data = await VehicleService.search_vehicles(search=search, page=page)
+    selected_fields = parse_fields(Vehicle, fields)
+    expand_paths = parse_expand("vehicles", expand)
+    data = await list_page("vehicles", request.url, search, params, VehicleService.search_vehicles)
 
     for vehicle in data.get("results", []):
         vehicle["vehicle_id"] = vehicle["url"].split("/")[-2]
 
-    return data
+    await expand_relations(data.get("results", []), expand_paths)
+
+    return project(data, selected_fields, paginated=True)
 
 
 @router.get(
@@ -53,7 +68,17 @@ async def get_vehicle(
         ge=1,
         description="ID do veículo",
         examples=4,
-    )
+    ),
+    expand: Optional[str] = Query(
+        None,
+        description="Relações a expandir, separadas por vírgula (ex: pilots,films)",
+        examples=["pilots"],
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Campos a retornar, separados por vírgula (ex: name,model)",
+        examples=["name,model"],
+    ),
 ):
     """
     Busca um veículo específico por ID.
@@ -62,5 +87,8 @@ async def get_vehicle(
     - 4: Sand Crawler
     - 6: T-16 skyhopper
     """
+    selected_fields = parse_fields(Vehicle, fields)
+    expand_paths = parse_expand("vehicles", expand)
     data = await VehicleService.get_vehicle(vehicle_id)
-    return data
+    await expand_relations([data], expand_paths)
+    return project(data, selected_fields)
@@ -2,6 +2,8 @@ from typing import List
 
 from pydantic import BaseModel
 
+from app.models.schemas import Relation
+
 
 class Vehicle(BaseModel):
     """Modelo de veículo do Star Wars"""
@@ -17,8 +19,8 @@ class Vehicle(BaseModel):
     cargo_capacity: str
     consumables: str
     vehicle_class: str
-    pilots: List[str]
-    films: List[str]
+    pilots: List[Relation]
+    films: List[Relation]
     created: str
     edited: str
     url: str
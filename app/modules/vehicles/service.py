@@ -1,5 +1,6 @@
 from typing import Any, Dict, Optional
 
+from app.core.search_index import search_index
 from app.core.swapi_client import swapi_client
 
 
@@ -22,6 +23,12 @@ class VehicleService:
         """
         Busca veículos com filtros e paginação
         """
+        # Com o dataset local disponível, a busca não vai à SWAPI
+        if search:
+            local = search_index.search("vehicles", search, page)
+            if local is not None:
+                return local
+
         params = {"page": page}
         if search:
             params["search"] = search
@@ -0,0 +1,65 @@
+"""
+Benchmark: latência do índice de prefixos do /swapi/autocomplete
+
+Constrói o índice sobre um dataset sintético (`--scale` vezes o tamanho da
+SWAPI) e mede p50/p99 por consulta para prefixos de 1 a 4 letras.
+
+Uso:
+    python -m benchmarks.autocomplete
+    python -m benchmarks.autocomplete --scale 100 --iterations 20000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from app.core.dataset import dataset
+from app.core.search_index import search_index
+from benchmarks.fuzzy_search import synthetic_names
+from benchmarks.snapshot_load import synthetic_dataset
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    store = synthetic_dataset(args.scale)
+    names = iter(synthetic_names(sum(store.counts().values())))
+    for resource in store.counts():
+        for item in store.items(resource):
+            item["name"] = item["title"] = next(names)
+    dataset.install(store)
+
+    started = time.perf_counter()
+    index = search_index.prefixes()
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(0)
+    words = [entry[2].split()[rng.randrange(2)] for entry in index.entries]
+    queries = [rng.choice(words)[: rng.randint(1, 4)] for _ in range(args.iterations)]
+
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        index.complete(query, args.limit)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+
+    latencies.sort()
+    total_s = sum(latencies) / 1_000_000
+    print(f"Itens indexados: {len(index.entries)} (construção: {build_ms:.1f} ms)")
+    print(
+        f"p50: {statistics.median(latencies):.1f} µs  "
+        f"p99: {latencies[int(len(latencies) * 0.99)]:.1f} µs  "
+        f"máx: {latencies[-1]:.1f} µs  "
+        f"({len(latencies) / total_s:,.0f} consultas/s em um núcleo)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: coocorrência por produto de incidência vs. laços Python aninhados
+
+Monta filmes sintéticos com elenco aleatório e calcula os pares de
+personagens que mais aparecem juntos.
+
+Uso:
+    python -m benchmarks.cooccurrence
+    python -m benchmarks.cooccurrence --people 5000 --films 300 --cast 60
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+from itertools import combinations
+
+from app.core.cooccurrence import Cooccurrence, incidence
+from app.core.dataset import dataset
+from app.core.snapshot import SnapshotStore, resource_id
+
+BASE = "https://swapi.dev/api"
+
+
+def synthetic_films(people: int, films: int, cast: int) -> SnapshotStore:
+    rng = random.Random(0)
+    return SnapshotStore(
+        {
+            "people": [
+                {"name": f"person {i}", "url": f"{BASE}/people/{i}/"} for i in range(1, people + 1)
+            ],
+            "films": [
+                {
+                    "title": f"film {i}",
+                    "characters": [
+                        f"{BASE}/people/{j}/" for j in rng.sample(range(1, people + 1), cast)
+                    ],
+                    "url": f"{BASE}/films/{i}/",
+                }
+                for i in range(1, films + 1)
+            ],
+        },
+        created="synthetic",
+    )
+
+
+def python_top_pairs(films, limit: int):
+    """O que um cliente faz hoje: todos os pares de cada filme em um Counter"""
+    counts = Counter()
+    for film in films:
+        ids = sorted(resource_id(url) for url in film["characters"])
+        counts.update(combinations(ids, 2))
+    return sorted(((a, b, n) for (a, b), n in counts.items()), key=lambda p: (-p[2], p[0], p[1]))[
+        :limit
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--films", type=int, default=200)
+    parser.add_argument("--cast", type=int, default=40)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    store = synthetic_films(args.people, args.films, args.cast)
+    dataset.install(store)
+    ids, matrix = incidence("people")
+
+    started = time.perf_counter()
+    table = Cooccurrence("people", ids, matrix)
+    vectorized = table.top_pairs(args.limit)
+    vectorized_ms = (time.perf_counter() - started) * 1000
+
+    # Atualização do dataset em que o elenco de um filme mudou
+    changed = matrix.copy()
+    changed[0] = 0
+    changed[0, : args.cast] = 1
+    started = time.perf_counter()
+    updated = table.update(ids, changed)
+    update_ms = (time.perf_counter() - started) * 1000
+    assert updated.top_pairs(args.limit) == Cooccurrence("people", ids, changed).top_pairs(
+        args.limit
+    )
+
+    started = time.perf_counter()
+    python = python_top_pairs(store.items("films"), args.limit)
+    python_ms = (time.perf_counter() - started) * 1000
+
+    assert vectorized == python
+    print(f"Personagens: {args.people}, filmes: {args.films}, elenco: {args.cast}")
+    print(f"{'incidência (numpy)':<20}{vectorized_ms:>10.2f} ms")
+    print(f"{'laços Python':<20}{python_ms:>10.2f} ms")
+    print(f"Ganho: {python_ms / vectorized_ms:.1f}x")
+    print(f"{'1 filme alterado':<20}{update_ms:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
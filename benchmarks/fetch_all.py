@@ -0,0 +1,83 @@
+"""
+Benchmark: `SWAPIClient.fetch_all` vs. percorrer `next` página a página
+
+Simula a SWAPI com latência fixa por página sobre um dataset sintético
+(`--scale` vezes o tamanho real) e mede o tempo total para baixar todos os
+personagens. O cache é limpo antes de cada execução.
+
+Uso:
+    python -m benchmarks.fetch_all
+    python -m benchmarks.fetch_all --scale 10 --latency 50 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from app.core.swapi_client import SWAPIClient
+from benchmarks.snapshot_load import synthetic_dataset
+
+
+class SimulatedClient(SWAPIClient):
+    """Cliente real (cache, singleflight) com a chamada HTTP trocada por uma espera"""
+
+    def __init__(self, store, latency: float):
+        super().__init__()
+        self.snapshot_path = None
+        self.store = store
+        self.latency = latency
+
+    async def _fetch(self, endpoint, params=None) -> bytes:
+        await asyncio.sleep(self.latency)
+        return json.dumps(self.store.resolve(endpoint, params)).encode()
+
+
+async def serial_walk(client: SWAPIClient, resource: str):
+    """O que o ETL faz hoje: uma página de cada vez, até `next` acabar"""
+    items, page = [], 1
+    while True:
+        data = await client._make_request(resource, {"page": page})
+        items += data["results"]
+        if not data["next"]:
+            return items
+        page += 1
+
+
+async def timed(client: SWAPIClient, walk) -> float:
+    client.cache.clear()
+    started = time.perf_counter()
+    await walk()
+    return (time.perf_counter() - started) * 1000
+
+
+async def run(args) -> None:
+    client = SimulatedClient(synthetic_dataset(args.scale), args.latency / 1000)
+    serial = await serial_walk(client, "people")
+    client.cache.clear()
+    concurrent = await client.fetch_all("people", concurrency=args.concurrency)
+    assert [item["url"] for item in concurrent] == [item["url"] for item in serial]
+
+    serial_ms = await timed(client, lambda: serial_walk(client, "people"))
+    concurrent_ms = await timed(
+        client, lambda: client.fetch_all("people", concurrency=args.concurrency)
+    )
+    pages = -(-len(serial) // 10)
+    print(f"Personagens: {len(serial)} em {pages} páginas, {args.latency:.0f} ms por página")
+    print(f"{'serial (next)':<26}{serial_ms:>10.1f} ms")
+    print(f"{f'fetch_all ({args.concurrency} concorrentes)':<26}{concurrent_ms:>10.1f} ms")
+    print(f"Ganho: {serial_ms / concurrent_ms:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--scale", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=20.0, help="Latência por página, em ms")
+    parser.add_argument("--concurrency", type=int, default=4)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark: tamanho e tempo de resposta de /films com e sem ?fields=
+
+Responde a partir de um snapshot sintético em memória (sem rede). Mede a
+requisição completa (TestClient) e, isoladamente, a etapa de validação do
+response_model + codificação JSON que o ?fields= evita.
+
+Uso:
+    python -m benchmarks.fields_projection
+    python -m benchmarks.fields_projection --iterations 500 --fields title,episode_id
+"""
+
+import argparse
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.core.projection import project
+from app.core.snapshot import SnapshotStore
+from app.core.swapi_client import swapi_client
+from app.main import app
+from app.models.schemas import PaginatedResponse
+from app.modules.films.schema import Film
+
+BASE = "https://swapi.dev/api"
+
+
+def synthetic_films(count: int = 10):
+    """Filmes com o tamanho típico da SWAPI: opening_crawl longo e muitas relações"""
+    return [
+        {
+            "title": f"Episode {i}",
+            "episode_id": i,
+            "opening_crawl": "It is a period of civil war. Rebel spaceships... " * 12,
+            "director": "George Lucas",
+            "producer": "Gary Kurtz, Rick McCallum",
+            "release_date": "1977-05-25",
+            "characters": [f"{BASE}/people/{j}/" for j in range(1, 41)],
+            "planets": [f"{BASE}/planets/{j}/" for j in range(1, 14)],
+            "starships": [f"{BASE}/starships/{j}/" for j in range(1, 15)],
+            "vehicles": [f"{BASE}/vehicles/{j}/" for j in range(1, 14)],
+            "species": [f"{BASE}/species/{j}/" for j in range(1, 16)],
+            "created": "2014-12-10T14:23:31.880000Z",
+            "edited": "2014-12-20T19:49:45.256000Z",
+            "url": f"{BASE}/films/{i}/",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(client: TestClient, url: str, iterations: int):
+    client.get(url)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        response = client.get(url)
+    elapsed = (time.perf_counter() - started) / iterations
+    return len(response.content), elapsed * 1000
+
+
+def measure_encoding(page: dict, fields: list, iterations: int):
+    """Validação + serialização do response_model vs. projeção direta"""
+    adapter = TypeAdapter(PaginatedResponse[Film])
+
+    def full() -> bytes:
+        model = adapter.validate_python(page)
+        return JSONResponse(jsonable_encoder(adapter.dump_python(model, mode="json"))).body
+
+    def projected() -> bytes:
+        return project(page, fields, paginated=True).body
+
+    results = []
+    for encode in (full, projected):
+        encode()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            encode()
+        results.append((time.perf_counter() - started) / iterations * 1000)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--fields", default="title,episode_id,release_date")
+    args = parser.parse_args()
+
+    store = SnapshotStore({"films": synthetic_films()})
+    swapi_client.snapshot = store
+    client = TestClient(app)
+
+    full_size, full_ms = measure(client, "/films/", args.iterations)
+    slim_size, slim_ms = measure(client, f"/films/?fields={args.fields}", args.iterations)
+
+    print(f"{'':<28}{'bytes':>10}{'ms/req':>10}")
+    print(f"{'/films/':<28}{full_size:>10}{full_ms:>10.3f}")
+    print(f"{'/films/?fields=' + args.fields[:13]:<28}{slim_size:>10}{slim_ms:>10.3f}")
+    print(
+        f"Redução: {100 * (1 - slim_size / full_size):.1f}% no payload, "
+        f"{100 * (1 - slim_ms / full_ms):.1f}% no tempo por requisição"
+    )
+
+    full_enc, slim_enc = measure_encoding(
+        store.resolve("films"), args.fields.split(","), args.iterations
+    )
+    print(
+        f"Validação + codificação: {full_enc:.3f} ms -> {slim_enc:.3f} ms "
+        f"({full_enc / slim_enc:.1f}x mais rápido)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: busca aproximada com índice de trigramas vs. varredura por distância de edição
+
+Gera nomes sintéticos (combinações de prenomes e sobrenomes) e mede o tempo
+por consulta com erros de digitação, para tamanhos crescentes de coleção.
+
+Uso:
+    python -m benchmarks.fuzzy_search
+    python -m benchmarks.fuzzy_search --sizes 100 1000 10000 --iterations 50
+"""
+
+import argparse
+import itertools
+import time
+from typing import List, Tuple
+
+from app.core.search_index import ResourceIndex, fold, tokenize
+
+FIRST = [
+    "luke", "leia", "anakin", "padme", "obi-wan", "han", "lando", "mace", "qui-gon", "jango",
+    "boba", "wedge", "biggs", "owen", "beru", "shmi", "cliegg", "jar jar", "watto", "sebulba",
+]  # fmt: skip
+LAST = [
+    "skywalker", "organa", "amidala", "kenobi", "solo", "calrissian", "windu", "jinn", "fett",
+    "antilles", "darklighter", "lars", "naberrie", "binks", "tarkin", "tano", "dooku", "maul",
+]  # fmt: skip
+QUERIES = ["skywaker", "organna", "calrisian", "kenobbi", "darklightr", "qui gonn jin"]
+
+
+def synthetic_names(size: int) -> List[str]:
+    names = (f"{first} {last}" for first, last in itertools.product(FIRST, LAST))
+    return [f"{name} {i}" for i, name in zip(range(size), itertools.cycle(names))]
+
+
+def edit_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            )
+        previous = current
+    return previous[-1]
+
+
+def brute_force(names: List[str], query: str, threshold: float) -> List[Tuple[int, float]]:
+    """Nota de cada nome pela melhor distância de edição de cada termo da consulta"""
+    terms = tokenize(query)
+    results = []
+    for item_id, name in enumerate(names, start=1):
+        tokens = tokenize(name)
+        score = 0.0
+        for term in terms:
+            score += max(
+                1 - edit_distance(term, token) / max(len(term), len(token)) for token in tokens
+            ) / len(terms)
+        if score >= threshold:
+            results.append((item_id, score))
+    return sorted(results, key=lambda item: (-item[1], item[0]))
+
+
+def timed(func, iterations: int) -> Tuple[float, object]:
+    result = func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.3)
+    args = parser.parse_args()
+
+    print(f"{'itens':>8}{'trigramas (ms)':>16}{'edição (ms)':>14}{'ganho':>8}  top-1 igual")
+    for size in args.sizes:
+        names = synthetic_names(size)
+        index = ResourceIndex(list(range(1, size + 1)), [fold(name) for name in names])
+        index.fuzzy_search("warm", args.threshold)
+
+        trigram_ms = edit_ms = 0.0
+        same_top = 0
+        for query in QUERIES:
+            elapsed, indexed = timed(
+                lambda q=query: index.fuzzy_search(q, args.threshold), args.iterations
+            )
+            trigram_ms += elapsed
+            elapsed, scanned = timed(
+                lambda q=query: brute_force(names, q, args.threshold), max(1, args.iterations // 10)
+            )
+            edit_ms += elapsed
+            top = lambda ranked: names[ranked[0][0] - 1].rsplit(" ", 1)[0] if ranked else None
+            same_top += top(indexed) == top(scanned)
+
+        trigram_ms /= len(QUERIES)
+        edit_ms /= len(QUERIES)
+        print(
+            f"{size:>8}{trigram_ms:>16.3f}{edit_ms:>14.3f}{edit_ms / trigram_ms:>7.0f}x"
+            f"  {same_top}/{len(QUERIES)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
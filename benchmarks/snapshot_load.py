@@ -0,0 +1,137 @@
+"""
+Benchmark: carregamento do snapshot JSON vs binário (mmap)
+
+Mede, em processos separados, o tempo até responder o primeiro `/people/{id}`
+e a memória residente depois disso.
+
+Uso:
+    python -m benchmarks.snapshot_load                       # dataset sintético
+    python -m benchmarks.snapshot_load --scale 50            # 50x o tamanho da SWAPI
+    python -m benchmarks.snapshot_load --snapshot data/swapi-snapshot.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app.core.snapshot import RESOURCES, SnapshotStore, load_snapshot, save_snapshot
+
+# Tamanho aproximado de cada coleção na SWAPI
+SWAPI_COUNTS = {
+    "people": 82,
+    "planets": 60,
+    "films": 6,
+    "starships": 36,
+    "vehicles": 39,
+    "species": 37,
+}
+
+
+def synthetic_dataset(scale: int) -> SnapshotStore:
+    """Dataset com registros no formato da SWAPI, `scale` vezes maior que o real"""
+    base = "https://swapi.dev/api"
+    resources = {}
+    for resource in RESOURCES:
+        count = SWAPI_COUNTS[resource] * scale
+        resources[resource] = [
+            {
+                "name": f"{resource} {i}",
+                "title": f"{resource} {i}",
+                "model": f"model {i}",
+                "description": "lorem ipsum dolor sit amet " * 8,
+                "height": str(100 + i % 120),
+                "films": [f"{base}/films/{j}/" for j in range(1, 4)],
+                "people": [f"{base}/people/{j}/" for j in range(i % 10, i % 10 + 8)],
+                "created": "2014-12-09T13:50:51.644000Z",
+                "edited": "2014-12-20T21:17:56.891000Z",
+                "url": f"{base}/{resource}/{i}/",
+            }
+            for i in range(1, count + 1)
+        ]
+    return SnapshotStore(resources, created="synthetic")
+
+
+def current_rss_kb() -> int:
+    """Memória residente atual do processo (Linux), ou o pico quando indisponível"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child(path: str) -> None:
+    rss_before = current_rss_kb()
+    started = time.perf_counter()
+    store = load_snapshot(path)
+    loaded = time.perf_counter()
+    store.resolve("people/1")
+    first_answer = time.perf_counter()
+    print(
+        json.dumps(
+            {
+                "load_ms": (loaded - started) * 1000,
+                "first_answer_ms": (first_answer - started) * 1000,
+                "rss_delta_kb": current_rss_kb() - rss_before,
+            }
+        )
+    )
+
+
+def run_child(path: str, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.snapshot_load", "--child", path],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output))
+    return {key: min(run[key] for run in runs) for key in runs[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--snapshot", help="Snapshot JSON real (senão usa um dataset sintético)")
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    store = load_snapshot(args.snapshot) if args.snapshot else synthetic_dataset(args.scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = str(Path(tmp) / "snapshot.json")
+        binary_path = str(Path(tmp) / "snapshot.swsnap")
+        save_snapshot(store, json_path)
+        save_snapshot(store, binary_path)
+
+        total = sum(store.counts().values())
+        print(f"Registros: {total}")
+        print(
+            f"{'formato':<10}{'tamanho (KB)':>14}{'load (ms)':>12}{'1ª resposta (ms)':>18}{'RSS (KB)':>10}"
+        )
+        for name, path in (("json", json_path), ("binário", binary_path)):
+            result = run_child(path, args.repeat)
+            print(
+                f"{name:<10}{Path(path).stat().st_size / 1024:>14.0f}"
+                f"{result['load_ms']:>12.2f}{result['first_answer_ms']:>18.2f}"
+                f"{result['rss_delta_kb']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
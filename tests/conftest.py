@@ -0,0 +1,32 @@
+import pytest
+
+from app.config import settings
+from app.core.dataset import dataset
+from app.core.snapshot import SnapshotStore
+from app.core.swapi_client import swapi_client
+from app.core.warmup import warmup
+from tests.factories.dataset import make_dataset
+
+
+@pytest.fixture(autouse=True)
+def reset_swapi_client(monkeypatch):
+    """Garante que o estado do cliente compartilhado não vaza entre testes"""
+    # Retentativas sem espera para não deixar os testes lentos
+    monkeypatch.setattr(settings, "retry_base_delay", 0.0)
+    swapi_client.cache.clear()
+    swapi_client.cache.reset_stats()
+    swapi_client.singleflight.reset_stats()
+    swapi_client.breaker.reset()
+    swapi_client.limiter.reset()
+    dataset.reset()
+    warmup.reset()
+    yield
+    swapi_client.cache.clear()
+
+
+@pytest.fixture
+def local_dataset() -> SnapshotStore:
+    """Dataset da factory instalado como dataset local, sem chamadas à SWAPI"""
+    store = SnapshotStore(make_dataset())
+    dataset.install(store)
+    return store
@@ -0,0 +1,96 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.dataset import dataset
+from app.core.snapshot import SnapshotStore
+from app.main import app
+from tests.factories.dataset import make_dataset
+
+client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("local_dataset")
+
+
+def groups(path, **params):
+    response = client.get(path, params=params)
+    assert response.status_code == 200, response.json()
+    return {group["key"]: group for group in response.json()["groups"]}
+
+
+def test_group_by_categorical_field():
+    result = groups(
+        "/swapi/people/aggregate", group_by="gender", metrics="count,mean:height,max:mass"
+    )
+
+    assert list(result) == ["male", "n/a", "female", "hermaphrodite"]
+    assert result["male"]["count"] == 19
+    assert result["male"]["metrics"] == {"count": 19, "mean:height": 187.0, "max:mass": 136.0}
+    assert result["n/a"]["metrics"]["mean:height"] == 131.5
+    assert result["hermaphrodite"]["metrics"]["max:mass"] == 1358.0
+
+
+def test_group_by_comma_separated_field_counts_each_value():
+    data = make_dataset()
+    data["planets"][2]["climate"] = "temperate, tropical"
+    dataset.install(SnapshotStore(data))
+
+    result = groups("/swapi/planets/aggregate", group_by="climate", metrics="max:diameter")
+
+    assert {key: group["count"] for key, group in result.items()} == {
+        "temperate": 2,
+        "arid": 1,
+        "tropical": 1,
+    }
+    assert result["tropical"]["metrics"]["max:diameter"] == 12120.0
+
+
+def test_ties_order_ids_numerically():
+    result = groups("/swapi/films/aggregate", group_by="vehicles")
+
+    assert list(result) == [4, 30, None]
+
+
+def test_percentiles_interpolate_without_grouping():
+    result = groups("/swapi/planets/aggregate", metrics="median:population,p90:diameter")
+
+    assert result[None]["count"] == 3
+    assert result[None]["metrics"] == {"median:population": 2e9, "p90:diameter": 12424.0}
+
+
+def test_group_by_relation_uses_target_names():
+    by_species = groups("/swapi/people/aggregate", group_by="species", metrics="mean:height")
+    by_film = groups("/swapi/people/aggregate", group_by="films")
+
+    assert by_species[2]["label"] == "Droid"
+    assert by_species[2]["metrics"]["mean:height"] == 131.5
+    assert by_species[None]["count"] == 21
+    assert by_film[1]["count"] == 5
+    assert by_film[1]["label"] == "A New Hope"
+
+
+def test_filters_apply_before_grouping_and_unknown_values_are_null():
+    result = groups(
+        "/swapi/people/aggregate",
+        group_by="gender",
+        metrics="count:height,sum:mass",
+        filter="mass:lt:100",
+    )
+
+    assert list(result) == ["n/a", "female", "male"]
+    assert result["male"]["metrics"] == {"count:height": 1, "sum:mass": 77.0}
+
+    empty = groups("/swapi/people/aggregate", metrics="mean:height", filter="height:gt:1000")
+    assert empty[None] == {"key": None, "label": None, "count": 0, "metrics": {"mean:height": None}}
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/swapi/people/aggregate", {"metrics": "avg:height"}),
+        ("/swapi/people/aggregate", {"metrics": "mean:name"}),
+        ("/swapi/people/aggregate", {"metrics": "mean"}),
+        ("/swapi/people/aggregate", {"group_by": "height"}),
+        ("/swapi/droids/aggregate", {}),
+    ],
+)
+def test_invalid_aggregations_are_rejected(path, params):
+    assert client.get(path, params=params).status_code == 400
@@ -0,0 +1,86 @@
+import os
+import struct
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.binary_snapshot import BinarySnapshot, is_binary_snapshot
+from app.core.snapshot import BaseSnapshot, SnapshotStore, load_snapshot, save_snapshot
+from tests.factories.dataset import make_dataset
+
+
+@pytest.fixture
+def binary_path(tmp_path):
+    path = str(tmp_path / "snapshot.swsnap")
+    save_snapshot(SnapshotStore(make_dataset(), created="2026-01-01T00:00:00+00:00"), path)
+    return path
+
+
+def test_binary_snapshot_is_detected(binary_path):
+    store = load_snapshot(binary_path)
+
+    assert is_binary_snapshot(binary_path)
+    assert isinstance(store, BinarySnapshot)
+    assert store.created == "2026-01-01T00:00:00+00:00"
+
+
+def test_binary_snapshot_decodes_lazily(binary_path):
+    store = load_snapshot(binary_path)
+
+    assert store.resolve("people/4")["name"] == "Darth Vader"
+    assert len(store._decoded) == 1
+
+
+def test_binary_snapshot_answers_like_json(binary_path):
+    json_store = SnapshotStore(make_dataset())
+    binary_store = load_snapshot(binary_path)
+
+    for endpoint, params in [
+        ("people", {"page": 3}),
+        ("starships", {"search": "x1"}),
+        ("vehicles", {"search": "SPEEDER", "page": 1}),
+        ("films/6", None),
+    ]:
+        assert binary_store.resolve(endpoint, params) == json_store.resolve(endpoint, params)
+
+    with pytest.raises(HTTPException):
+        binary_store.resolve("planets/99")
+
+
+def test_binary_snapshot_is_smaller_than_json(binary_path, tmp_path):
+    json_path = tmp_path / "snapshot.json"
+    save_snapshot(SnapshotStore(make_dataset()), str(json_path))
+
+    assert os.path.getsize(binary_path) < json_path.stat().st_size / 2
+
+
+def test_search_does_not_keep_decoded_records(binary_path):
+    store = load_snapshot(binary_path)
+
+    assert store.resolve("people", {"search": "figurante"})["count"] == 17
+    assert len(store._decoded) == 10
+
+
+def test_old_format_version_is_rejected(binary_path):
+    with open(binary_path, "r+b") as f:
+        f.seek(8)
+        f.write(struct.pack("<I", 1))
+
+    with pytest.raises(ValueError):
+        load_snapshot(binary_path)
+
+
+def test_binary_snapshot_round_trip(binary_path, tmp_path):
+    json_path = str(tmp_path / "snapshot.json")
+    save_snapshot(load_snapshot(binary_path), json_path)
+
+    assert load_snapshot(json_path).to_dict() == load_snapshot(binary_path).to_dict()
+
+
+def test_incomplete_backend_fails_on_creation():
+    class OnlyIds(BaseSnapshot):
+        def ids(self, resource):
+            return []
+
+    with pytest.raises(TypeError):
+        OnlyIds()
@@ -0,0 +1,61 @@
+import pytest
+import respx
+from httpx import Response
+
+from app.core.cache import ResponseCache, make_cache_key
+from app.core.swapi_client import swapi_client
+
+
+def test_cache_key_is_normalized():
+    assert make_cache_key("/People/1/") == make_cache_key("people/1")
+    assert make_cache_key("people", {"page": 1, "search": "Luke"}) == make_cache_key(
+        "people", {"search": "luke", "page": "1"}
+    )
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(ttl=60, max_entries=2, max_bytes=1024)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.evictions == 1
+
+
+def test_cache_respects_max_bytes():
+    cache = ResponseCache(ttl=60, max_entries=10, max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"123456")
+
+    assert cache.size_bytes <= 10
+    assert cache.get("a") is None
+
+
+def test_cache_expires_entries(monkeypatch):
+    cache = ResponseCache(ttl=10, max_entries=10, max_bytes=1024)
+    now = 1000.0
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now)
+    cache.set("a", b"1")
+
+    now = 1011.0
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_serves_from_cache():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(
+        return_value=Response(200, json={"name": "Luke Skywalker"})
+    )
+
+    first = await swapi_client._make_request("people/1")
+    first["name"] = "alterado"
+    second = await swapi_client._make_request("people/1")
+
+    assert route.call_count == 1
+    assert second["name"] == "Luke Skywalker"
+    assert swapi_client.cache.hits == 1
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from app.core.swapi_client import swapi_client
+from app.main import app
+
+client = TestClient(app)
+
+
+def make_breaker(**overrides) -> CircuitBreaker:
+    config = {
+        "failure_rate_threshold": 0.5,
+        "minimum_calls": 4,
+        "window_seconds": 60,
+        "open_seconds": 30,
+        "half_open_max_calls": 2,
+    }
+    config.update(overrides)
+    return CircuitBreaker(**config)
+
+
+def test_breaker_trips_after_failure_rate():
+    breaker = make_breaker()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.rejected == 1
+
+
+def test_breaker_half_open_probes_close_circuit():
+    breaker = make_breaker(open_seconds=0)
+    for _ in range(4):
+        breaker.record_failure()
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert [t["to"] for t in breaker.transitions] == [OPEN, HALF_OPEN, CLOSED]
+
+
+def test_breaker_half_open_failure_reopens():
+    breaker = make_breaker(open_seconds=0)
+    for _ in range(4):
+        breaker.record_failure()
+
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.transition_counts[OPEN] == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_open_breaker_fails_fast_without_upstream_call():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=httpx.ConnectTimeout("timeout")
+    )
+    for _ in range(swapi_client.breaker.minimum_calls):
+        with pytest.raises(HTTPException):
+            await swapi_client._make_request("people/1")
+
+    calls = route.call_count
+    with pytest.raises(HTTPException) as exc:
+        await swapi_client._make_request("people/1")
+
+    assert exc.value.status_code == 503
+    assert "Retry-After" in exc.value.headers
+    assert route.call_count == calls
+
+
+def test_upstream_health_endpoint():
+    response = client.get("/health/upstream")
+
+    assert response.status_code == 200
+    assert response.json()["state"] == CLOSED
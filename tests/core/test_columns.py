@@ -0,0 +1,107 @@
+import math
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.columns import parse_number
+from app.core.dataset import dataset
+from app.core.snapshot import SnapshotStore
+from app.main import app
+from tests.factories.dataset import make_dataset
+
+client = TestClient(app)
+
+
+def names(response):
+    assert response.status_code == 200, response.json()
+    return [item["name"] for item in response.json()["results"]]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1,358", 1358.0), ("1000km", 1000.0), ("30-165", 30.0), ("0.5", 0.5), (12, 12.0)],
+)
+def test_parse_number(value, expected):
+    assert parse_number(value) == expected
+
+
+@pytest.mark.parametrize("value", ["unknown", "n/a", "", None])
+def test_parse_number_unknown(value):
+    assert math.isnan(parse_number(value))
+
+
+def test_filter_range_and_sort_on_numeric_columns(local_dataset):
+    response = client.get("/people/", params={"filter": "height:gte:170", "sort": "-mass"})
+
+    assert names(response) == ["Jabba Desilijic Tiure", "Darth Vader", "Luke Skywalker"]
+    assert response.json()["count"] == 3
+
+
+def test_filter_in_on_categorical_column_ignores_case(local_dataset):
+    response = client.get(
+        "/people/", params=[("filter", "gender:in:FEMALE|hermaphrodite"), ("filter", "mass:lt:100")]
+    )
+
+    assert names(response) == ["Leia Organa"]
+
+
+def test_comma_separated_values_match_any_value():
+    data = make_dataset()
+    data["planets"][2]["climate"] = "temperate, tropical"
+    data["starships"][0]["manufacturer"] = "Gallofree Yards, Inc."
+    dataset.install(SnapshotStore(data))
+
+    def planets(value):
+        return names(client.get("/planets/", params={"filter": f"climate:{value}"}))
+
+    assert planets("in:arid|Tropical") == ["Tatooine", "Naboo"]
+    assert planets("eq:temperate") == ["Alderaan", "Naboo"]
+    assert planets("ne:temperate") == ["Tatooine"]
+    assert planets("eq:temperate, tropical") == []
+    starships = client.get(
+        "/starships/", params={"filter": "manufacturer:eq:gallofree yards, inc."}
+    )
+    assert names(starships) == ["Millennium Falcon"]
+
+
+def test_sort_keeps_unknown_values_last(local_dataset):
+    ascending = names(client.get("/people/", params={"sort": "height", "page_size": 8}))
+    descending = names(client.get("/people/", params={"sort": "-height", "page_size": 8}))
+
+    assert ascending[:6] == [
+        "R2-D2",
+        "Leia Organa",
+        "C-3PO",
+        "Luke Skywalker",
+        "Jabba Desilijic Tiure",
+        "Darth Vader",
+    ]
+    assert ascending[6:] == ["Figurante 20", "Figurante 21"]
+    assert descending[0] == "Darth Vader"
+    assert descending[6:] == ["Figurante 20", "Figurante 21"]
+
+
+def test_filters_combine_with_search_and_generic_route(local_dataset):
+    response = client.get(
+        "/swapi/planets", params={"filter": "population:gte:200000", "sort": "-diameter"}
+    )
+
+    assert names(response) == ["Alderaan", "Naboo", "Tatooine"]
+    assert names(client.get("/people/", params={"search": "a", "filter": "height:lt:160"})) == [
+        "Leia Organa"
+    ]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"filter": "name:eq:Luke"},
+        {"filter": "height:gt:tall"},
+        {"filter": "gender:gt:male"},
+        {"filter": "height:between:1"},
+        {"filter": "height"},
+        {"sort": "name"},
+    ],
+)
+def test_invalid_filters_and_sorts_are_rejected(params):
+    assert client.get("/people/", params=params).status_code == 400
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import cooccurrence as module
+from app.core.cooccurrence import Cooccurrence, cooccurrence
+from app.core.dataset import dataset
+from app.core.snapshot import SnapshotStore
+from app.main import app
+from tests.factories.dataset import make_dataset
+
+client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("local_dataset")
+
+
+def pairs(response):
+    assert response.status_code == 200, response.json()
+    return [
+        (pair["source"]["id"], pair["target"]["id"], pair["films"])
+        for pair in response.json()["results"]
+    ]
+
+
+def test_top_pairs_come_from_the_incidence_product():
+    response = client.get("/swapi/people/cooccurrence", params={"limit": 5})
+
+    assert pairs(response) == [(2, 3, 3), (2, 4, 3), (3, 4, 3), (1, 2, 2), (1, 3, 2)]
+    assert response.json()["results"][0]["source"]["name"] == "C-3PO"
+    assert pairs(client.get("/swapi/planets/cooccurrence")) == [(1, 2, 2), (1, 8, 1), (2, 8, 1)]
+
+
+def test_partners_of_one_item():
+    response = client.get("/swapi/people/cooccurrence", params={"id": 1})
+
+    assert response.json()["item"] == {"id": 1, "name": "Luke Skywalker"}
+    assert pairs(response) == [(1, 2, 2), (1, 3, 2), (1, 4, 2), (1, 5, 2)]
+    assert pairs(client.get("/swapi/people/cooccurrence", params={"id": 20})) == []
+
+
+def test_blocked_product_matches_the_full_matrix(monkeypatch):
+    monkeypatch.setattr(module, "_BLOCK_CELLS", 7)
+    rng = np.random.default_rng(0)
+    matrix = (rng.random((6, 40)) < 0.4).astype(np.float32)
+
+    table = Cooccurrence("people", np.arange(1, 41), matrix)
+
+    full = (matrix.T @ matrix).astype(np.int64)
+    expected = sorted(
+        ((-full[i, j], i + 1, j + 1) for i in range(40) for j in range(i + 1, 40) if full[i, j]),
+    )[:20]
+    assert table.top_pairs(20) == [(a, b, -films) for films, a, b in expected]
+
+
+def test_update_recomputes_only_the_changed_items(monkeypatch):
+    monkeypatch.setattr(module, "_BLOCK_CELLS", 7)
+    products = []
+    pairs_of = module._pairs
+
+    def spy(incidence, k, items=None):
+        products.append(None if items is None else items.tolist())
+        return pairs_of(incidence, k, items)
+
+    monkeypatch.setattr(module, "_pairs", spy)
+    rng = np.random.default_rng(1)
+    ids = np.arange(1, 41)
+    matrix = (rng.random((6, 40)) < 0.4).astype(np.float32)
+    table = Cooccurrence("people", ids, matrix)
+
+    incremental = 0
+    for _ in range(20):
+        changed = matrix.copy()
+        items = np.sort(rng.choice(40, size=3, replace=False))
+        changed[:, items] = rng.random((6, 3)) < 0.4
+        products.clear()
+
+        updated = table.update(ids, changed)
+        if products == [np.flatnonzero((changed != matrix).any(axis=0)).tolist()]:
+            incremental += 1
+
+        expected = Cooccurrence("people", ids, changed)
+        assert updated.top_pairs(module.TOP_PAIRS) == expected.top_pairs(module.TOP_PAIRS)
+        # Atualizações seguidas partem da anterior
+        table, matrix = updated, changed
+    # Na maioria das vezes só as linhas dos itens alterados são recalculadas
+    assert incremental > 10
+
+
+def test_product_is_reused_while_the_incidence_does_not_change():
+    first = cooccurrence.table("people")
+
+    dataset.install(SnapshotStore(make_dataset()))
+    assert cooccurrence.table("people") is first
+
+    data = make_dataset()
+    data["films"][2]["characters"] = []
+    dataset.install(SnapshotStore(data))
+    assert cooccurrence.table("people") is not first
+    assert cooccurrence.table("people").top_pairs(1) == [(1, 2, 2)]
+
+
+@pytest.mark.parametrize(
+    "params, path, status",
+    [
+        ({}, "/swapi/films/cooccurrence", 400),
+        ({"id": 99}, "/swapi/people/cooccurrence", 404),
+        ({"limit": 1000}, "/swapi/people/cooccurrence", 422),
+    ],
+)
+def test_invalid_cooccurrence_queries(params, path, status):
+    assert client.get(path, params=params).status_code == status
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+import respx
+
+from app.core.swapi_client import SWAPIClient
+from tests.factories.dataset import swapi_handler
+
+
+class CountingClient(SWAPIClient):
+    """Páginas simuladas, mais lentas no início, que registram a concorrência"""
+
+    def __init__(self, pages: int):
+        super().__init__()
+        self.pages = pages
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _make_request(self, resource, params):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001 * (self.pages - params["page"]))
+        self.in_flight -= 1
+        page = params["page"]
+        return {"count": self.pages * 2, "results": [{"n": page * 2 - 1}, {"n": page * 2}]}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_all_walks_every_page_in_order():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+    client = SWAPIClient()
+
+    try:
+        people = await client.fetch_all("people")
+        figurantes = await client.fetch_all("people", search="figurante")
+    finally:
+        await client.close()
+
+    assert len(people) == 23
+    assert [p["name"] for p in people[:2]] == ["Luke Skywalker", "C-3PO"]
+    assert [p["name"] for p in figurantes] == [f"Figurante {i}" for i in range(20, 37)]
+    assert route.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_bounds_concurrency_and_reports_progress():
+    client = CountingClient(pages=10)
+    progress = []
+
+    items = await client.fetch_all(
+        "people", concurrency=3, on_page=lambda done, total: progress.append((done, total))
+    )
+
+    assert [item["n"] for item in items] == list(range(1, 21))
+    assert client.max_in_flight == 3
+    assert progress[0] == (1, 10)
+    assert progress[-1] == (10, 10)
+
+
+@pytest.mark.asyncio
+async def test_shared_semaphore_bounds_several_walks():
+    client = CountingClient(pages=6)
+    semaphore = asyncio.Semaphore(2)
+
+    await asyncio.gather(
+        client.fetch_all("people", semaphore=semaphore),
+        client.fetch_all("planets", semaphore=semaphore),
+    )
+
+    assert client.max_in_flight == 2
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from app.core.graph import graph
+from app.main import app
+
+client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("local_dataset")
+
+
+def nodes(items):
+    return [f"{item['resource']}/{item['id']}" for item in items]
+
+
+def test_adjacency_is_symmetric_and_deduplicated():
+    index = graph()
+    luke = index.node("people", 1)
+    tatooine = index.node("planets", 1)
+
+    neighbors = index.indices[index.indptr[luke] : index.indptr[luke + 1]]
+    assert sorted(index.describe(int(n)) for n in neighbors) == [
+        ("films", 1),
+        ("films", 2),
+        ("planets", 1),
+        ("starships", 12),
+    ]
+    assert luke in index.indices[index.indptr[tatooine] : index.indptr[tatooine + 1]]
+    assert index.node("people", 99) is None
+    assert graph() is index
+
+
+def test_neighbors_are_ordered_by_distance():
+    response = client.get(
+        "/swapi/graph/people/1/neighbors", params={"depth": 2, "resources": "people"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["node"] == {
+        "resource": "people",
+        "id": 1,
+        "name": "Luke Skywalker",
+        "degree": 4,
+        "distance": None,
+    }
+    assert nodes(body["results"]) == ["people/2", "people/3", "people/4", "people/5", "people/16"]
+    assert {item["distance"] for item in body["results"]} == {2}
+
+    direct = client.get("/swapi/graph/people/1/neighbors").json()
+    assert nodes(direct["results"]) == ["planets/1", "films/1", "films/2", "starships/12"]
+
+
+@respx.mock(assert_all_called=False)
+def test_shortest_path_is_answered_locally(respx_mock):
+    upstream = respx_mock.route()
+    response = client.get("/swapi/graph/path", params={"source": "people/20", "target": "people/5"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["found"] is True
+    assert body["distance"] == 4
+    assert nodes(body["path"])[0] == "people/20"
+    assert nodes(body["path"])[-1] == "people/5"
+    assert body["path"][-1]["name"] == "Leia Organa"
+    assert not upstream.called
+
+
+def test_path_can_be_restricted_to_some_resources():
+    through_planet = client.get(
+        "/swapi/graph/path", params={"source": "people/1", "target": "people/16"}
+    ).json()
+    through_films = client.get(
+        "/swapi/graph/path",
+        params={"source": "people/1", "target": "people/16", "via": "films,starships"},
+    ).json()
+
+    assert nodes(through_planet["path"]) == ["people/1", "planets/1", "people/16"]
+    assert through_films["found"] is False
+    assert through_films["distance"] is None
+    assert through_films["path"] == []
+
+
+def test_bfs_stops_at_impassable_nodes():
+    index = graph()
+    passable = index.passable(["films"])
+    distance, _ = index.bfs(index.node("people", 16), index.size, passable=passable)
+
+    reached = sorted(index.describe(int(n)) for n in np.flatnonzero(distance > 0))
+    assert reached == [("planets", 1)]
+
+
+@pytest.mark.parametrize(
+    "path, params, status",
+    [
+        ("/swapi/graph/path", {"source": "people", "target": "people/1"}, 400),
+        ("/swapi/graph/path", {"source": "droids/1", "target": "people/1"}, 400),
+        ("/swapi/graph/path", {"source": "people/1", "target": "people/99"}, 404),
+        ("/swapi/graph/path", {"source": "people/1", "target": "people/4", "via": "x"}, 400),
+        ("/swapi/graph/people/99/neighbors", {}, 404),
+        ("/swapi/graph/people/1/neighbors", {"depth": 4}, 422),
+    ],
+)
+def test_invalid_graph_queries(path, params, status):
+    assert client.get(path, params=params).status_code == status
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from app.core.limiter import LimiterRejectedError, TokenBucket, UpstreamLimiter
+
+
+def make_limiter(**overrides) -> UpstreamLimiter:
+    config = {"max_concurrency": 2, "rate": 0, "burst": 1, "max_wait": 1.0, "max_queue": 10}
+    config.update(overrides)
+    return UpstreamLimiter(**config)
+
+
+def test_token_bucket_reserves_in_order():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrency():
+    limiter = make_limiter()
+    active = 0
+    peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with limiter.slot(max_wait=1.0):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.stats()["peak_queued"] >= 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_after_max_wait():
+    limiter = make_limiter(max_concurrency=1, max_wait=0.01)
+
+    async with limiter.slot(max_wait=1.0):
+        with pytest.raises(LimiterRejectedError):
+            async with limiter.slot(max_wait=1.0):
+                pass
+
+    assert limiter.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_when_queue_is_full():
+    limiter = make_limiter(max_concurrency=1, max_queue=0)
+
+    # Sem disputa a chamada não espera, então não depende da fila
+    async with limiter.slot(max_wait=1.0):
+        with pytest.raises(LimiterRejectedError):
+            async with limiter.slot(max_wait=1.0):
+                pass
+
+    assert limiter.stats()["peak_queued"] == 0
+    assert limiter.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_only_callers_that_wait_are_queued():
+    limiter = make_limiter(max_concurrency=2, max_queue=1)
+
+    async def call():
+        async with limiter.slot(max_wait=1.0):
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(call(), call())
+    assert limiter.stats()["peak_queued"] == 0
+
+    results = await asyncio.gather(*(call() for _ in range(4)), return_exceptions=True)
+    assert sum(isinstance(r, LimiterRejectedError) for r in results) == 1
+    assert limiter.stats()["peak_queued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_when_rate_wait_exceeds_budget():
+    limiter = make_limiter(rate=1, burst=1, max_wait=0.1)
+
+    async with limiter.slot(max_wait=1.0):
+        pass
+    with pytest.raises(LimiterRejectedError):
+        async with limiter.slot(max_wait=1.0):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_cancelled_rate_wait_refunds_its_token():
+    limiter = make_limiter(rate=10, burst=1)
+
+    async with limiter.slot(max_wait=1.0):
+        pass
+    waiting = asyncio.create_task(limiter._acquire(1.0))
+    await asyncio.sleep(0.01)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    # Sem a devolução, o próximo chamador esperaria dois intervalos (~0.2 s)
+    assert limiter._bucket.reserve() < 0.1
+    assert limiter.queued == 0
+    assert not limiter._semaphore.locked()
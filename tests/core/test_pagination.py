@@ -0,0 +1,80 @@
+import respx
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core.pagination import decode_cursor, encode_cursor, query_key
+from app.main import app
+from tests.factories.dataset import swapi_handler
+
+client = TestClient(app)
+
+
+def test_cursor_roundtrip():
+    key = query_key("sky", True, [("height", "gte", "170")], [("mass", True)])
+    cursor = encode_cursor(20, 5, key)
+
+    assert decode_cursor(cursor) == {"offset": 20, "page_size": 5, "key": key}
+    assert key != query_key("sky", True, [], [("mass", True)])
+
+
+def test_page_size_walks_collection_with_cursors(local_dataset):
+    response = client.get("/people/", params={"page_size": 10, "fields": "name"})
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["count"] == 23
+    assert body["previous"] is None
+    assert body["next"].startswith("http://testserver/people/?fields=name&cursor=")
+
+    names = [p["name"] for p in body["results"]]
+    while body["next"]:
+        body = client.get(body["next"]).json()
+        names += [p["name"] for p in body["results"]]
+    assert len(names) == 23
+    assert names[:2] == ["Luke Skywalker", "C-3PO"]
+    assert set(body["results"][0]) == {"name"}
+
+    previous = client.get(body["previous"]).json()
+    assert [p["name"] for p in previous["results"]] == names[10:20]
+
+
+def test_page_size_with_page_and_search(local_dataset):
+    body = client.get(
+        "/swapi/people", params={"search": "figurante", "page_size": 5, "page": 2}
+    ).json()
+
+    assert body["count"] == 17
+    assert [p["name"] for p in body["results"]] == [f"Figurante {i}" for i in range(25, 30)]
+    assert "search=figurante" in body["next"]
+    assert "page=" not in body["next"]
+
+
+def test_invalid_cursors_and_page_sizes_are_rejected(local_dataset, monkeypatch):
+    monkeypatch.setattr(settings, "max_page_size", 20)
+    cursor = encode_cursor(5, 5, query_key("luke", False, [], []))
+
+    assert client.get("/people/", params={"page_size": 21}).status_code == 400
+    assert client.get("/people/", params={"cursor": "???"}).status_code == 400
+    assert client.get("/people/", params={"cursor": cursor, "search": "leia"}).status_code == 400
+    assert client.get("/people/", params={"page_size": 10, "page": 9}).status_code == 404
+
+
+@respx.mock
+def test_page_size_loads_dataset_when_missing():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    body = client.get("/starships/", params={"page_size": 2}).json()
+    calls = route.call_count
+    client.get(body["next"])
+
+    assert [s["name"] for s in body["results"]] == ["Millennium Falcon", "X-wing"]
+    assert route.call_count == calls
+
+
+def test_list_routes_share_the_list_parameters():
+    spec = client.get("/openapi.json").json()
+
+    resources = ("people", "films", "planets", "starships", "vehicles", "species")
+    for path in [f"/{resource}/" for resource in resources] + ["/swapi/{resource}"]:
+        names = {param["name"] for param in spec["paths"][path]["get"]["parameters"]}
+        assert {"page", "fuzzy", "page_size", "cursor", "filter", "sort"} <= names
@@ -0,0 +1,45 @@
+import pytest
+
+from app.config import settings
+from app.core.pool_metrics import PoolMonitor
+from app.core.swapi_client import SWAPIClient
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_pool_and_timeouts(monkeypatch):
+    monkeypatch.setattr(settings, "timeout_connect", 1.5)
+    monkeypatch.setattr(settings, "timeout_pool", 0.5)
+    client = SWAPIClient()
+    await client.start()
+
+    try:
+        timeout = client.client.timeout
+        assert timeout.connect == 1.5
+        assert timeout.read == settings.timeout_read
+        assert timeout.pool == 0.5
+    finally:
+        await client.close()
+
+    assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_pool_monitor_measures_wait_and_occupancy():
+    monitor = PoolMonitor(max_connections=4)
+
+    first = monitor.request_started()
+    second = monitor.request_started()
+    assert monitor.stats()["occupancy"] == 0.5
+
+    await first("connection.connect_tcp.started", {})
+    await second("http11.send_request_headers.started", {})
+    await second("http11.receive_response_headers.started", {})
+    monitor.request_finished()
+    monitor.request_finished()
+
+    stats = monitor.stats()
+    assert stats["inflight"] == 0
+    assert stats["peak_inflight"] == 2
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 1
+    assert stats["wait_p50_ms"] is not None
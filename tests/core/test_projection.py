@@ -0,0 +1,35 @@
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.projection import parse_fields
+from app.main import app
+from app.modules.films.schema import Film
+from tests.factories.dataset import swapi_handler
+
+client = TestClient(app)
+
+
+def test_parse_fields_rejects_unknown_fields():
+    assert parse_fields(Film, "title, episode_id,title") == ["title", "episode_id"]
+    assert parse_fields(Film, None) is None
+
+    with pytest.raises(HTTPException) as exc:
+        parse_fields(Film, "title,name")
+    assert exc.value.status_code == 400
+
+
+@respx.mock
+def test_fields_projects_list_and_detail():
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    page = client.get("/films/?fields=title,episode_id").json()
+    assert page["count"] == 3
+    assert page["results"][0] == {"title": "A New Hope", "episode_id": 4}
+
+    person = client.get("/people/1?fields=name,homeworld&expand=homeworld").json()
+    assert set(person) == {"name", "homeworld"}
+    assert person["homeworld"]["name"] == "Tatooine"
+
+    assert client.get("/people/1?fields=title").status_code == 400
@@ -0,0 +1,66 @@
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.relations import expand_relations, parse_expand
+from app.main import app
+from tests.factories.dataset import make_dataset, swapi_handler, url
+
+client = TestClient(app)
+
+
+def test_parse_expand_validates_fields_and_depth():
+    assert parse_expand("people", "homeworld, films.characters") == [
+        ["homeworld"],
+        ["films", "characters"],
+    ]
+
+    with pytest.raises(HTTPException) as exc:
+        parse_expand("people", "planets")
+    assert exc.value.status_code == 400
+
+    with pytest.raises(HTTPException):
+        parse_expand("people", "films.characters.homeworld")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_expand_deduplicates_urls_across_items():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+    people = make_dataset()["people"][:5]
+
+    await expand_relations(people, [["homeworld"]])
+
+    assert people[0]["homeworld"]["name"] == "Tatooine"
+    assert people[4]["homeworld"]["name"] == "Alderaan"
+    # Tatooine, Naboo e Alderaan: uma chamada por planeta
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_expand_nested_and_partial_failure():
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+    film = make_dataset()["films"][0]
+    film["characters"].append(url("people", 999))
+
+    await expand_relations([film], [["characters", "homeworld"]])
+
+    assert film["characters"][0]["name"] == "Luke Skywalker"
+    assert film["characters"][0]["homeworld"]["name"] == "Tatooine"
+    assert film["characters"][-1] == url("people", 999)
+
+
+@respx.mock
+def test_expand_on_routes():
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    person = client.get("/people/1?expand=homeworld,starships").json()
+    assert person["homeworld"]["name"] == "Tatooine"
+    assert person["starships"][0]["name"] == "X-wing"
+
+    page = client.get("/films/?expand=planets").json()
+    assert page["results"][0]["planets"][0]["name"] == "Tatooine"
+
+    assert client.get("/people/1?expand=characters").status_code == 400
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from app.config import settings
+from app.core.request_context import RequestContext, reset_request_context, set_request_context
+from app.core.swapi_client import DeadlineExceededError, swapi_client
+from app.main import app
+from tests.people.factories import make_person
+
+client = TestClient(app)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transient_error_is_retried():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=[httpx.ConnectError("reset"), Response(200, json={"name": "Luke"})]
+    )
+    context = RequestContext(deadline=time.monotonic() + 5)
+    token = set_request_context(context)
+    try:
+        data = await swapi_client._make_request("people/1")
+    finally:
+        reset_request_context(token)
+
+    assert data["name"] == "Luke"
+    assert route.call_count == 2
+    assert context.upstream_retries == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_every_caller_of_a_shared_call_sees_its_retries():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=[httpx.ConnectError("reset"), Response(200, json={"name": "Luke"})]
+    )
+    contexts = [RequestContext(deadline=time.monotonic() + 5) for _ in range(3)]
+
+    async def call(context):
+        set_request_context(context)
+        return await swapi_client._make_request("people/1")
+
+    results = await asyncio.gather(*(asyncio.create_task(call(c)) for c in contexts))
+
+    assert [data["name"] for data in results] == ["Luke"] * 3
+    assert route.call_count == 2
+    assert [context.upstream_retries for context in contexts] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_not_found_is_not_retried():
+    route = respx.get("https://swapi.dev/api/people/999/").mock(return_value=Response(404))
+
+    with pytest.raises(HTTPException) as exc:
+        await swapi_client._make_request("people/999")
+
+    assert exc.value.status_code == 404
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retries_stop_at_max_attempts():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(return_value=Response(502))
+
+    with pytest.raises(HTTPException) as exc:
+        await swapi_client._make_request("people/1")
+
+    assert exc.value.status_code == 502
+    assert route.call_count == settings.retry_max_attempts + 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retries_respect_request_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "retry_base_delay", 10.0)
+    monkeypatch.setattr(settings, "retry_max_delay", 10.0)
+    monkeypatch.setattr("app.core.swapi_client.random.uniform", lambda a, b: b)
+    route = respx.get("https://swapi.dev/api/people/1/").mock(return_value=Response(503))
+
+    token = set_request_context(RequestContext(deadline=time.monotonic() + 1))
+    try:
+        with pytest.raises(HTTPException):
+            await swapi_client._make_request("people/1")
+    finally:
+        reset_request_context(token)
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_deadline_spent_waiting_for_the_limiter_is_not_sent_upstream(monkeypatch):
+    route = respx.get("https://swapi.dev/api/people/1/").mock(return_value=Response(200, json={}))
+
+    @asynccontextmanager
+    async def slow_slot(max_wait):
+        await asyncio.sleep(0.05)
+        yield
+
+    monkeypatch.setattr(swapi_client.limiter, "slot", slow_slot)
+    token = set_request_context(RequestContext(deadline=time.monotonic() + 0.02))
+    try:
+        with pytest.raises(DeadlineExceededError):
+            await swapi_client._make_request("people/1")
+    finally:
+        reset_request_context(token)
+
+    assert route.call_count == 0
+
+
+@respx.mock
+def test_retry_headers():
+    respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=[httpx.ReadTimeout("timeout"), Response(200, json=make_person())]
+    )
+
+    response = client.get("/people/1")
+
+    assert response.status_code == 200
+    assert response.headers["X-Upstream-Retries"] == "1"
+    assert "X-Upstream-Retry-Time" in response.headers
@@ -0,0 +1,119 @@
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from app.core.dataset import dataset
+from app.core.search_index import ResourceIndex, fold, search_index
+from app.core.snapshot import SnapshotStore, search_text
+from app.main import app
+from app.modules.people.service import PeopleService
+from app.modules.starships.service import StarshipService
+from tests.factories.dataset import swapi_handler, url
+
+client = TestClient(app)
+
+
+def make_index(names):
+    items = [{"name": name, "url": url("people", i)} for i, name in enumerate(names, start=1)]
+    return ResourceIndex(
+        [i for i, _ in enumerate(items, start=1)],
+        [search_text("people", item) for item in items],
+    )
+
+
+def test_fold_removes_accents_and_case():
+    assert fold("Padmé Amidala") == "padme amidala"
+    assert fold("ÉCLAIR") == "eclair"
+
+
+def test_index_keeps_swapi_substring_semantics():
+    index = make_index(["Luke Skywalker", "Anakin Skywalker", "Leia Organa", "R2-D2"])
+
+    assert index.search("sky") == [1, 2]
+    assert index.search("walker") == [1, 2]
+    assert index.search("ke sky") == [1]
+    assert index.search("r2-d") == [4]
+    assert index.search("skywalker luke") == []
+    assert index.search("-") == [4]
+
+
+def test_index_folds_accents_in_query_and_text():
+    index = make_index(["Padmé Amidala", "Luke Skywalker"])
+
+    assert index.search("padme") == [1]
+    assert index.search("PADMÉ") == [1]
+
+
+def test_search_index_is_unavailable_without_dataset():
+    assert search_index.search("people", "luke") is None
+
+
+def test_search_index_paginates_like_swapi(local_dataset):
+    data = search_index.search("people", "figurante", page=2)
+
+    assert data["count"] == 17
+    assert [p["name"] for p in data["results"]] == [f"Figurante {i}" for i in range(30, 37)]
+    assert data["next"] is None
+    assert data["previous"] == "https://swapi.dev/api/people/?search=figurante&page=1"
+
+
+def test_search_index_is_rebuilt_when_dataset_changes(local_dataset):
+    assert search_index.search("people", "vader")["count"] == 1
+
+    dataset.install(SnapshotStore({"people": []}))
+    assert search_index.search("people", "vader")["count"] == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_services_search_locally_when_dataset_is_available(local_dataset):
+    route = respx.get(url__startswith="https://swapi.dev/api/").respond(500)
+    people = await PeopleService.search_people(search="skywalker")
+    starships = await StarshipService.search_starships(search="x1")
+
+    assert [p["name"] for p in people["results"]] == ["Luke Skywalker"]
+    assert [s["name"] for s in starships["results"]] == ["TIE Advanced x1"]
+    assert route.call_count == 0
+
+
+def test_fuzzy_search_ranks_by_trigram_similarity():
+    index = make_index(["Luke Skywalker", "Anakin Skywalker", "Leia Organa", "Owen Lars"])
+
+    assert [item_id for item_id, _ in index.fuzzy_search("skywaker", threshold=0.3)] == [1, 2]
+    assert [item_id for item_id, _ in index.fuzzy_search("luke skywaker", threshold=0.3)] == [1]
+    assert index.fuzzy_search("organna", threshold=0.3)[0][0] == 3
+    assert index.fuzzy_search("xyzzy", threshold=0.3) == []
+
+
+def test_fuzzy_search_scores_exact_matches_first():
+    index = make_index(["Luke Skywalker", "Lukas Walker"])
+
+    assert index.fuzzy_search("walker", threshold=0.3) == [(1, 1.0), (2, 1.0)]
+    assert index.fuzzy_search("sky", threshold=0.3) == [(1, 1.0)]
+
+
+@respx.mock
+def test_fuzzy_search_loads_dataset_once_and_pages_locally():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    first = client.get("/people/", params={"search": "figurantte", "fuzzy": "true"}).json()
+    calls = route.call_count
+    starships = client.get("/starships/", params={"search": "millenium", "fuzzy": "true"})
+
+    assert first["count"] == 17
+    assert first["next"].startswith("http://testserver/people/?")
+    assert "swapi.dev" not in first["next"]
+    assert [s["name"] for s in starships.json()["results"]] == ["Millennium Falcon"]
+
+    # O próximo link continua a ordenação aproximada, sem voltar à SWAPI
+    second = client.get(first["next"]).json()
+    names = [p["name"] for p in first["results"] + second["results"]]
+    assert names == [
+        p["name"]
+        for p in search_index.load_items(
+            "people", search_index.matching_ids("people", "figurantte", fuzzy=True)
+        )
+    ]
+    assert len(set(names)) == 17
+    assert second["next"] is None
+    assert route.call_count == calls
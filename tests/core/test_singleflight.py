@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+import respx
+from fastapi import HTTPException
+from httpx import Response
+
+from app.core.singleflight import SingleFlight
+from app.core.swapi_client import swapi_client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    executions = 0
+
+    async def work():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert results == ["ok"] * 5
+    assert executions == 1
+    assert flight.coalesced == 4
+    assert flight.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_waiters_receive_the_same_exception():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise HTTPException(status_code=504, detail="Timeout")
+
+    results = await asyncio.gather(
+        *(flight.do("k", work) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, HTTPException) and r.status_code == 504 for r in results)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_coalesces_identical_requests():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(
+        return_value=Response(200, json={"name": "Luke Skywalker"})
+    )
+
+    results = await asyncio.gather(*(swapi_client._make_request("people/1") for _ in range(10)))
+
+    assert route.call_count == 1
+    assert all(r["name"] == "Luke Skywalker" for r in results)
+    assert swapi_client.singleflight.coalesced == 9
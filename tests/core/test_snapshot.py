@@ -0,0 +1,78 @@
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.snapshot import SnapshotStore, crawl, load_snapshot, save_snapshot
+from app.core.swapi_client import SWAPIClient, swapi_client
+from app.main import app
+from tests.factories.dataset import make_dataset, swapi_handler
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def store() -> SnapshotStore:
+    return SnapshotStore(make_dataset())
+
+
+def test_resolve_detail(store):
+    assert store.resolve("people/4")["name"] == "Darth Vader"
+
+    with pytest.raises(HTTPException) as exc:
+        store.resolve("people/999")
+    assert exc.value.status_code == 404
+
+
+def test_resolve_paginates_like_swapi(store):
+    page = store.resolve("people", {"page": 2})
+
+    assert page["count"] == 23
+    assert len(page["results"]) == 10
+    assert page["next"] == "https://swapi.dev/api/people/?page=3"
+    assert page["previous"] == "https://swapi.dev/api/people/?page=1"
+
+    with pytest.raises(HTTPException):
+        store.resolve("people", {"page": 4})
+
+
+def test_resolve_search(store):
+    page = store.resolve("starships", {"search": "x-wing", "page": 1})
+
+    assert [s["name"] for s in page["results"]] == ["X-wing"]
+    assert store.resolve("people", {"search": "SKY"})["count"] == 1
+
+
+def test_snapshot_round_trip(store, tmp_path):
+    path = tmp_path / "snapshot.json"
+    save_snapshot(store, str(path))
+
+    assert load_snapshot(str(path)).counts() == store.counts()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_crawl_fetches_every_page():
+    source = SnapshotStore(make_dataset())
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+    crawler = SWAPIClient()
+
+    try:
+        result = await crawl(crawler)
+    finally:
+        await crawler.close()
+
+    assert result.counts() == source.counts()
+
+
+@respx.mock
+def test_client_serves_snapshot_without_network(store, monkeypatch):
+    route = respx.get(url__startswith="https://swapi.dev/api/")
+    monkeypatch.setattr(swapi_client, "snapshot", store)
+
+    response = client.get("/people/1")
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Luke Skywalker"
+    assert response.headers["X-Cache-Status"] == "snapshot"
+    assert not route.called
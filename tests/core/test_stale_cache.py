@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from app.core.cache import EXPIRED, FRESH, STALE, ResponseCache
+from app.core.swapi_client import swapi_client
+from app.main import app
+from tests.people.factories import make_person
+
+client = TestClient(app)
+
+
+def _age(key: str, seconds: float) -> None:
+    """Envelhece uma entrada do cache compartilhado em `seconds` segundos"""
+    entry = swapi_client.cache._entries[key]
+    entry.expires_at -= seconds
+    entry.revalidate_until -= seconds
+    entry.stale_until -= seconds
+
+
+def _past_revalidation_window() -> float:
+    cache = swapi_client.cache
+    return cache.ttl + cache.stale_while_revalidate + 1
+
+
+def test_entry_states(monkeypatch):
+    cache = ResponseCache(
+        ttl=10, max_entries=10, max_bytes=1024, stale_while_revalidate=5, stale_if_error=20
+    )
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: 0.0)
+    cache.set("a", b"1")
+    entry = cache._entries["a"]
+
+    assert entry.state(9) == FRESH
+    assert entry.state(12) == STALE
+    assert entry.state(25) == EXPIRED
+    assert entry.stale_until == 30
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stale_entry_is_served_while_revalidating():
+    route = respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=[
+            Response(200, json={"name": "Luke Skywalker"}),
+            Response(200, json={"name": "Luke Skywalker (editado)"}),
+        ]
+    )
+    await swapi_client._make_request("people/1")
+    _age("people/1", swapi_client.cache.ttl + 1)
+
+    stale = await swapi_client._make_request("people/1")
+    assert stale["name"] == "Luke Skywalker"
+
+    await asyncio.gather(*swapi_client._background)
+    fresh = await swapi_client._make_request("people/1")
+
+    assert route.call_count == 2
+    assert fresh["name"] == "Luke Skywalker (editado)"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_expired_entry_is_served_when_upstream_fails():
+    respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=[
+            Response(200, json={"name": "Luke Skywalker"}),
+            *[httpx.ConnectTimeout("timeout")] * 10,
+        ]
+    )
+    await swapi_client._make_request("people/1")
+    _age("people/1", _past_revalidation_window())
+
+    data = await swapi_client._make_request("people/1")
+
+    assert data["name"] == "Luke Skywalker"
+    assert swapi_client.stale_if_error_served == 1
+
+
+@respx.mock
+def test_cache_status_header():
+    respx.get("https://swapi.dev/api/people/1/").mock(
+        side_effect=[Response(200, json=make_person()), *[httpx.ConnectError("falha")] * 10]
+    )
+
+    assert client.get("/people/1").headers["X-Cache-Status"] == "miss"
+    assert client.get("/people/1").headers["X-Cache-Status"] == "fresh"
+
+    _age("people/1", _past_revalidation_window())
+    response = client.get("/people/1")
+
+    assert response.status_code == 200
+    assert response.headers["X-Cache-Status"] == "stale"
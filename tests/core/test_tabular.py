@@ -0,0 +1,105 @@
+import csv
+import io
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.dataset import dataset
+from app.core.snapshot import SnapshotStore, main, save_snapshot
+from app.main import app
+from tests.factories.dataset import make_dataset
+
+client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("local_dataset")
+
+
+def test_csv_export_has_typed_columns_and_relation_ids():
+    response = client.get("/swapi/people/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="people.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 23
+    luke, jabba, extra = rows[0], rows[5], rows[-1]
+    assert (luke["id"], luke["height"], luke["homeworld"]) == ("1", "172", "1")
+    assert (luke["films"], luke["starships"], luke["species"]) == ("1|2", "12", "")
+    assert jabba["mass"] == "1358"
+    assert extra["height"] == ""
+    assert (
+        client.get("/swapi/starships/export", params={"format": "csv"})
+        .text.splitlines()[1]
+        .startswith("10,Millennium Falcon")
+    )
+
+
+def test_arrow_and_parquet_exports_share_the_schema():
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    arrow = client.get("/swapi/people/export", params={"format": "arrow"})
+    table = pa.ipc.open_file(io.BytesIO(arrow.content)).read_all()
+    from_parquet = parquet.read_table(
+        io.BytesIO(client.get("/swapi/people/export", params={"format": "parquet"}).content)
+    )
+
+    assert arrow.headers["content-type"] == "application/vnd.apache.arrow.file"
+    assert table.schema.field("height").type == pa.float64()
+    assert table.schema.field("films").type == pa.list_(pa.int64())
+    assert table.schema.field("homeworld").type == pa.int64()
+    assert pa.types.is_dictionary(table.schema.field("gender").type)
+    assert table.column("films").to_pylist()[:2] == [[1, 2], [1, 2, 6]]
+    assert table.column("height").null_count == 17
+    assert from_parquet.column("mass").to_pylist() == table.column("mass").to_pylist()
+
+
+def test_export_is_cached_and_honours_if_none_match():
+    first = client.get("/swapi/planets/export", params={"format": "csv"})
+    etag = first.headers["etag"]
+
+    again = client.get(
+        "/swapi/planets/export", params={"format": "csv"}, headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+
+    data = make_dataset()
+    data["planets"][0]["name"] = "Tatooine II"
+    dataset.install(SnapshotStore(data))
+    changed = client.get(
+        "/swapi/planets/export", params={"format": "csv"}, headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert "Tatooine II" in changed.text
+
+
+def test_arrow_formats_require_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    response = client.get("/swapi/people/export", params={"format": "parquet"})
+
+    assert response.status_code == 501
+    assert "arrow" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("params", [{"format": "xlsx"}, {"format": "csv", "search": "luke"}])
+def test_invalid_tabular_exports(params):
+    assert client.get("/swapi/people/export", params=params).status_code == 400
+
+
+def test_cli_exports_every_resource(tmp_path):
+    snapshot = tmp_path / "snapshot.json"
+    save_snapshot(SnapshotStore(make_dataset()), str(snapshot))
+
+    main(["export", str(snapshot), str(tmp_path / "out"), "--format", "csv"])
+
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "films.csv",
+        "people.csv",
+        "planets.csv",
+        "species.csv",
+        "starships.csv",
+        "vehicles.csv",
+    ]
+    with open(tmp_path / "out" / "films.csv", newline="") as f:
+        assert [row["title"] for row in csv.DictReader(f)][-1] == "Revenge of the Sith"
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from app.core.dataset import dataset
+from app.core.search_index import search_index
+from app.core.swapi_client import swapi_client
+from app.core.warmup import DONE, FAILED, RUNNING, warmup
+from app.main import app
+from tests.factories.dataset import make_dataset, swapi_handler
+
+client = TestClient(app)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_warmup_crawls_every_resource_and_fills_cache():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    await warmup.run(["people", "films"], concurrency=2)
+
+    assert warmup.state == DONE
+    assert warmup.status()["resources"]["people"] == {
+        "pages_done": 3,
+        "pages_total": 3,
+        "items": 23,
+    }
+    assert dataset.available
+    assert len(dataset.items("people")) == 23
+    # O índice de trigramas da busca aproximada já está pronto
+    assert search_index.index("people")._vocabulary is not None
+
+    calls = route.call_count
+    person = await swapi_client._make_request("people/4")
+    assert person["name"] == "Darth Vader"
+    assert route.call_count == calls
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_expired_dataset_is_downloaded_again_in_background(monkeypatch):
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+    monkeypatch.setattr(swapi_client.cache, "ttl", 0.05)
+    await warmup.run(["people"], concurrency=2)
+    version = dataset.version
+
+    changed = make_dataset()
+    changed["people"][3]["name"] = "Anakin Skywalker"
+    route.side_effect = swapi_handler(changed)
+    await asyncio.sleep(0.06)
+
+    # Vencido: a busca responde com as coleções atuais e dispara a atualização
+    assert search_index.search("people", "anakin")["count"] == 0
+    await dataset._refreshing
+    monkeypatch.setattr(swapi_client.cache, "ttl", 3600.0)
+
+    assert dataset.version == version + 1
+    assert search_index.index("people")._vocabulary is not None
+    assert search_index.search("people", "anakin")["results"][0]["url"].endswith("/people/4/")
+    # O item individual no cache também foi atualizado
+    person = await swapi_client._make_request("people/4")
+    assert person["name"] == "Anakin Skywalker"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_warmup_failure_does_not_block_readiness():
+    respx.get(url__startswith="https://swapi.dev/api/").respond(404)
+
+    await warmup.run(["people"], concurrency=2)
+
+    assert warmup.state == FAILED
+    assert warmup.ready
+
+
+def test_readiness_reports_warmup_progress():
+    warmup.state = RUNNING
+    warmup.progress = {"people": {"pages_done": 1, "pages_total": 4}}
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["warmup"]["percent"] == 25.0
+
+    warmup.state = DONE
+    assert client.get("/health/ready").status_code == 200
@@ -0,0 +1,287 @@
+from tests.films.factories import make_film
+from tests.people.factories import make_person
+from tests.planets.factories import make_planet
+from tests.species.factories import make_species
+from tests.starships.factories import make_starship
+from tests.vehicles.factories import make_vehicle
+
+BASE = "https://swapi.dev/api"
+
+
+def url(resource: str, item_id: int) -> str:
+    return f"{BASE}/{resource}/{item_id}/"
+
+
+def urls(resource: str, *ids: int) -> list:
+    return [url(resource, i) for i in ids]
+
+
+def make_dataset() -> dict:
+    """Dataset pequeno, mas com relações entre todos os recursos, no formato da SWAPI"""
+    people = [
+        make_person(
+            {
+                "name": "Luke Skywalker",
+                "homeworld": url("planets", 1),
+                "films": urls("films", 1, 2),
+                "starships": urls("starships", 12),
+                "url": url("people", 1),
+            }
+        ),
+        make_person(
+            {
+                "name": "C-3PO",
+                "height": "167",
+                "mass": "75",
+                "gender": "n/a",
+                "homeworld": url("planets", 1),
+                "films": urls("films", 1, 2, 6),
+                "species": urls("species", 2),
+                "url": url("people", 2),
+            }
+        ),
+        make_person(
+            {
+                "name": "R2-D2",
+                "height": "96",
+                "mass": "32",
+                "gender": "n/a",
+                "homeworld": url("planets", 8),
+                "films": urls("films", 1, 2, 6),
+                "species": urls("species", 2),
+                "url": url("people", 3),
+            }
+        ),
+        make_person(
+            {
+                "name": "Darth Vader",
+                "height": "202",
+                "mass": "136",
+                "homeworld": url("planets", 1),
+                "films": urls("films", 1, 2, 6),
+                "starships": urls("starships", 13),
+                "url": url("people", 4),
+            }
+        ),
+        make_person(
+            {
+                "name": "Leia Organa",
+                "height": "150",
+                "mass": "49",
+                "gender": "female",
+                "homeworld": url("planets", 2),
+                "films": urls("films", 1, 2),
+                "vehicles": urls("vehicles", 30),
+                "url": url("people", 5),
+            }
+        ),
+        make_person(
+            {
+                "name": "Jabba Desilijic Tiure",
+                "height": "175",
+                "mass": "1,358",
+                "gender": "hermaphrodite",
+                "homeworld": url("planets", 1),
+                "url": url("people", 16),
+            }
+        ),
+    ]
+    people += [
+        make_person(
+            {
+                "name": f"Figurante {i}",
+                "height": "unknown",
+                "mass": "unknown",
+                "homeworld": url("planets", 8),
+                "url": url("people", i),
+            }
+        )
+        for i in range(20, 37)
+    ]
+
+    planets = [
+        make_planet(
+            {
+                "name": "Tatooine",
+                "residents": urls("people", 1, 2, 4, 16),
+                "films": urls("films", 1, 6),
+                "url": url("planets", 1),
+            }
+        ),
+        make_planet(
+            {
+                "name": "Alderaan",
+                "climate": "temperate",
+                "population": "2000000000",
+                "diameter": "12500",
+                "residents": urls("people", 5),
+                "films": urls("films", 1, 6),
+                "url": url("planets", 2),
+            }
+        ),
+        make_planet(
+            {
+                "name": "Naboo",
+                "climate": "temperate",
+                "population": "4500000000",
+                "diameter": "12120",
+                "residents": urls("people", 3),
+                "films": urls("films", 6),
+                "url": url("planets", 8),
+            }
+        ),
+    ]
+
+    films = [
+        make_film(
+            {
+                "characters": urls("people", 1, 2, 3, 4, 5),
+                "planets": urls("planets", 1, 2),
+                "starships": urls("starships", 12, 13),
+                "vehicles": urls("vehicles", 4),
+                "species": urls("species", 1, 2),
+                "url": url("films", 1),
+            }
+        ),
+        make_film(
+            {
+                "title": "The Empire Strikes Back",
+                "episode_id": 5,
+                "director": "Irvin Kershner",
+                "release_date": "1980-05-17",
+                "characters": urls("people", 1, 2, 3, 4, 5),
+                "planets": [],
+                "starships": urls("starships", 10, 12),
+                "vehicles": urls("vehicles", 30),
+                "species": urls("species", 1, 2),
+                "url": url("films", 2),
+            }
+        ),
+        make_film(
+            {
+                "title": "Revenge of the Sith",
+                "episode_id": 3,
+                "release_date": "2005-05-19",
+                "characters": urls("people", 2, 3, 4),
+                "planets": urls("planets", 1, 2, 8),
+                "starships": urls("starships", 10),
+                "vehicles": [],
+                "species": urls("species", 2),
+                "url": url("films", 6),
+            }
+        ),
+    ]
+
+    starships = [
+        make_starship(
+            {
+                "name": "Millennium Falcon",
+                "model": "YT-1300 light freighter",
+                "manufacturer": "Corellian Engineering Corporation",
+                "cost_in_credits": "100000",
+                "length": "34.37",
+                "cargo_capacity": "100000",
+                "pilots": [],
+                "films": urls("films", 2, 6),
+                "url": url("starships", 10),
+            }
+        ),
+        make_starship(
+            {
+                "name": "X-wing",
+                "model": "T-65 X-wing",
+                "manufacturer": "Incom Corporation",
+                "cost_in_credits": "149999",
+                "length": "12.5",
+                "cargo_capacity": "110",
+                "pilots": urls("people", 1),
+                "films": urls("films", 1, 2),
+                "url": url("starships", 12),
+            }
+        ),
+        make_starship(
+            {
+                "name": "TIE Advanced x1",
+                "model": "Twin Ion Engine Advanced x1",
+                "manufacturer": "Sienar Fleet Systems",
+                "cost_in_credits": "unknown",
+                "length": "9.2",
+                "cargo_capacity": "150",
+                "pilots": urls("people", 4),
+                "films": urls("films", 1),
+                "url": url("starships", 13),
+            }
+        ),
+    ]
+
+    vehicles = [
+        make_vehicle(
+            {
+                "name": "Sand Crawler",
+                "model": "Digger Crawler",
+                "pilots": [],
+                "films": urls("films", 1),
+                "url": url("vehicles", 4),
+            }
+        ),
+        make_vehicle(
+            {
+                "name": "Imperial Speeder Bike",
+                "model": "74-Z speeder bike",
+                "manufacturer": "Aratech Repulsor Company",
+                "cost_in_credits": "8000",
+                "length": "3",
+                "pilots": urls("people", 5),
+                "films": urls("films", 2),
+                "url": url("vehicles", 30),
+            }
+        ),
+    ]
+
+    species = [
+        make_species(
+            {
+                "name": "Human",
+                "people": [],
+                "films": urls("films", 1, 2),
+                "url": url("species", 1),
+            }
+        ),
+        make_species(
+            {
+                "name": "Droid",
+                "classification": "artificial",
+                "homeworld": None,
+                "people": urls("people", 2, 3),
+                "films": urls("films", 1, 2, 6),
+                "url": url("species", 2),
+            }
+        ),
+    ]
+
+    return {
+        "people": people,
+        "planets": planets,
+        "films": films,
+        "starships": starships,
+        "vehicles": vehicles,
+        "species": species,
+    }
+
+
+def swapi_handler(dataset: dict | None = None):
+    """Side effect para o respx que responde como a SWAPI a partir do dataset"""
+    from httpx import Response
+
+    from app.core.snapshot import SnapshotStore
+
+    store = SnapshotStore(dataset or make_dataset())
+
+    def handler(request):
+        endpoint = request.url.path.replace("/api/", "", 1).strip("/")
+        try:
+            return Response(200, json=store.resolve(endpoint, dict(request.url.params)))
+        except Exception:  # pylint: disable=broad-except
+            return Response(404, json={"detail": "Not found"})
+
+    return handler
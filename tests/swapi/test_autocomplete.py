@@ -0,0 +1,63 @@
+import respx
+from fastapi.testclient import TestClient
+
+from app.core.search_index import PrefixIndex
+from app.main import app
+from tests.factories.dataset import swapi_handler
+
+client = TestClient(app)
+
+
+def test_prefix_index_prefers_name_prefixes_over_word_prefixes():
+    index = PrefixIndex(
+        [
+            ("people", 1, "Luke Skywalker"),
+            ("starships", 9, "Death Star"),
+            ("people", 7, "Owen Lars"),
+            ("planets", 3, "Skywalker Ranch"),
+        ]
+    )
+
+    assert index.complete("sky", 10) == [
+        ("planets", 3, "Skywalker Ranch"),
+        ("people", 1, "Luke Skywalker"),
+    ]
+    assert index.complete("s", 2) == [
+        ("planets", 3, "Skywalker Ranch"),
+        ("people", 1, "Luke Skywalker"),
+    ]
+    assert index.complete("  ", 10) == []
+
+
+def test_autocomplete_returns_resource_and_id(local_dataset):
+    response = client.get("/swapi/autocomplete", params={"q": "T", "limit": 3})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "query": "T",
+        "results": [
+            {"resource": "planets", "id": 1, "name": "Tatooine"},
+            {"resource": "films", "id": 2, "name": "The Empire Strikes Back"},
+            {"resource": "starships", "id": 13, "name": "TIE Advanced x1"},
+        ],
+    }
+
+
+def test_autocomplete_validates_query():
+    assert client.get("/swapi/autocomplete").status_code == 422
+    assert client.get("/swapi/autocomplete", params={"q": "a", "limit": 0}).status_code == 422
+
+
+@respx.mock
+def test_autocomplete_loads_dataset_once():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    first = client.get("/swapi/autocomplete", params={"q": "mill"})
+    calls = route.call_count
+    second = client.get("/swapi/autocomplete", params={"q": "vad"})
+
+    assert first.json()["results"] == [
+        {"resource": "starships", "id": 10, "name": "Millennium Falcon"}
+    ]
+    assert second.json()["results"] == [{"resource": "people", "id": 4, "name": "Darth Vader"}]
+    assert route.call_count == calls
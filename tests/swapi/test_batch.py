@@ -0,0 +1,51 @@
+import respx
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from tests.factories.dataset import swapi_handler
+
+client = TestClient(app)
+
+
+@respx.mock
+def test_batch_fetches_items_with_per_item_errors():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    response = client.post(
+        "/swapi/batch",
+        json={
+            "items": [
+                {"resource": "people", "id": 1},
+                {"resource": "planets", "id": 1},
+                {"resource": "people", "id": 1},
+                {"resource": "people", "id": 999},
+                {"resource": "droids", "id": 1},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 5
+    assert body["errors"] == 2
+    assert [r["status"] for r in body["results"]] == [200, 200, 200, 404, 400]
+    assert body["results"][0]["data"]["name"] == "Luke Skywalker"
+    assert body["results"][2]["data"] == body["results"][0]["data"]
+    assert route.call_count == 3
+
+
+def test_batch_rejects_too_many_items(monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_items", 2)
+
+    response = client.post(
+        "/swapi/batch", json={"items": [{"resource": "people", "id": i} for i in range(1, 4)]}
+    )
+
+    assert response.status_code == 400
+
+
+def test_batch_validates_ids():
+    response = client.post("/swapi/batch", json={"items": [{"resource": "people", "id": 0}]})
+
+    assert response.status_code == 422
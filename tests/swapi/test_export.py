@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from app.core.swapi_client import SWAPIClient
+from app.main import app
+from tests.factories.dataset import swapi_handler
+
+client = TestClient(app)
+
+
+def lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+@respx.mock
+def test_export_streams_every_page_in_order():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    response = client.get("/swapi/people/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items = lines(response)
+    assert len(items) == 23
+    assert [item["name"] for item in items[:2]] == ["Luke Skywalker", "C-3PO"]
+    assert items[-1]["name"] == "Figurante 36"
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_export_passes_search_through():
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    items = lines(client.get("/swapi/people/export", params={"search": "figurante"}))
+
+    assert len(items) == 17
+    assert {item["name"] for item in items} == {f"Figurante {i}" for i in range(20, 37)}
+
+
+@respx.mock
+def test_failure_after_first_page_ends_stream_with_error_line():
+    handler = swapi_handler()
+
+    def failing(request):
+        if request.url.params.get("page") == "3":
+            return Response(404, json={"detail": "Not found"})
+        return handler(request)
+
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=failing)
+
+    items = lines(client.get("/swapi/people/export"))
+
+    assert len(items) == 21
+    assert "error" in items[-1]
+
+
+@respx.mock
+def test_failure_on_first_page_is_an_http_error():
+    respx.get(url__startswith="https://swapi.dev/api/").mock(return_value=Response(404))
+
+    assert client.get("/swapi/people/export").status_code == 404
+    assert client.get("/swapi/droids/export").status_code == 400
+
+
+class SlowClient(SWAPIClient):
+    """Cliente com respostas simuladas que registra quantas páginas foram pedidas"""
+
+    def __init__(self, pages: int):
+        super().__init__()
+        self.pages = pages
+        self.requested = []
+
+    async def _make_request(self, resource, params):
+        self.requested.append(params["page"])
+        await asyncio.sleep(0.001 * (self.pages - params["page"]))
+        return {"count": self.pages, "results": [{"page": params["page"]}]}
+
+
+@pytest.mark.asyncio
+async def test_pages_are_emitted_in_order_with_a_bounded_window():
+    fake = SlowClient(pages=12)
+    first = await fake._make_request("people", {"page": 1})
+
+    stream = fake.iter_pages("people", first, window=3)
+    received = [await stream.__anext__() for _ in range(2)]
+    # A página 2 foi consumida: no máximo 3 páginas à frente foram pedidas
+    assert max(fake.requested) == 4
+    await stream.aclose()
+
+    fake.requested.clear()
+    pages = [items[0]["page"] async for items in fake.iter_pages("people", first, window=3)]
+    assert received == [[{"page": 1}], [{"page": 2}]]
+    assert pages == list(range(1, 13))
+
+
+@pytest.mark.asyncio
+async def test_failure_stops_requesting_new_pages():
+    class Failing(SlowClient):
+        async def _make_request(self, resource, params):
+            if params["page"] == 2:
+                raise HTTPException(status_code=502, detail="boom")
+            return await super()._make_request(resource, params)
+
+    fake = Failing(pages=6)
+    first = await SlowClient(6)._make_request("people", {"page": 1})
+
+    with pytest.raises(HTTPException):
+        async for _ in fake.iter_pages("people", first, window=3):
+            pass
+    await asyncio.sleep(0.01)
+    assert max(fake.requested) == 4
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.modules.swapi.service import SearchService
+from tests.factories.dataset import swapi_handler, url
+
+client = TestClient(app)
+
+
+@respx.mock
+def test_search_merges_resources_by_relevance():
+    route = respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=swapi_handler())
+
+    response = client.get("/swapi/search", params={"q": "x"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["partial"] is False
+    assert body["errors"] == {}
+    assert [(h["resource"], h["id"], h["name"]) for h in body["results"]] == [
+        ("starships", 12, "X-wing"),
+        ("starships", 13, "TIE Advanced x1"),
+    ]
+    assert body["results"][0]["score"] > body["results"][1]["score"]
+    assert route.call_count == 6
+
+
+@respx.mock
+def test_search_returns_partial_results_when_a_resource_fails():
+    handler = swapi_handler()
+    respx.get(url__startswith="https://swapi.dev/api/planets").respond(500)
+    respx.get(url__startswith="https://swapi.dev/api/").mock(side_effect=handler)
+
+    response = client.get("/swapi/search", params={"q": "tatooine"})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["partial"] is True
+    assert list(body["errors"]) == ["planets"]
+    assert body["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_wait_for_slow_resources():
+    async def fast(search, page):
+        return {"results": [{"name": "Luke Skywalker", "url": url("people", 1)}]}
+
+    async def slow(search, page):
+        await asyncio.sleep(5)
+
+    async def missing(search, page):
+        raise HTTPException(status_code=404, detail="Recurso não encontrado na SWAPI: species")
+
+    result = await SearchService.search(
+        {"people": fast, "planets": slow, "species": missing}, "luke", limit=10, timeout=0.05
+    )
+
+    assert result["partial"] is True
+    assert result["errors"] == {
+        "planets": "Tempo limite de 0.05s excedido",
+        "species": "Recurso não encontrado na SWAPI: species",
+    }
+    assert [h["name"] for h in result["results"]] == ["Luke Skywalker"]
+    assert result["results"][0]["score"] == 0.9
+
+
+def test_search_requires_query():
+    assert client.get("/swapi/search").status_code == 422